@@ -0,0 +1,119 @@
+"""
+Benchmark: helper functions vs DocumentBuilder for large tables and lists.
+
+Measures wall time and peak traced memory to produce the JSON for a document
+with one large table (or list), comparing:
+
+- helpers: ``table()`` / ``table_row()`` / ``table_cell()`` tree + ``json.dumps``
+- builder: ``DocumentBuilder`` streamed to a sink (no full string in memory)
+- builder.to_json(): ``DocumentBuilder`` serialized into one string
+
+Usage:
+    python benchmarks/bench_document_builder.py --rows 50000 --cols 5
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+
+from vaiz.helpers import (
+    DocumentBuilder,
+    bullet_list,
+    heading,
+    table,
+    table_cell,
+    table_row,
+)
+from vaiz.helpers.document_structure import _generate_uid
+
+
+class _CountingSink:
+    """Text sink that only counts characters."""
+
+    def __init__(self):
+        self.size = 0
+
+    def write(self, chunk: str) -> None:
+        self.size += len(chunk)
+
+
+def _rows(count, cols):
+    return ((f"row {i}", *(f"value {i}.{c}" for c in range(1, cols))) for i in range(count))
+
+
+def _measure(label, func):
+    tracemalloc.start()
+    start = time.perf_counter()
+    size = func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {label:<22} {elapsed * 1000:9.1f} ms   peak {peak / 1024 / 1024:8.1f} MiB   {size / 1024 / 1024:6.1f} MiB JSON")
+
+
+def bench_table(rows, cols):
+    print(f"Table: {rows} rows x {cols} columns")
+
+    def helpers():
+        content = [heading(1, "Report"), table(*(table_row(*row) for row in _rows(rows, cols)))]
+        return len(json.dumps(content))
+
+    def builder_stream():
+        sink = _CountingSink()
+        DocumentBuilder().heading(1, "Report").table(_rows(rows, cols)).write(sink)
+        return sink.size
+
+    def builder_string():
+        return len(DocumentBuilder().heading(1, "Report").table(_rows(rows, cols)).to_json())
+
+    _measure("helpers + json.dumps", helpers)
+    _measure("builder (streamed)", builder_stream)
+    _measure("builder.to_json()", builder_string)
+
+
+def bench_list(items):
+    print(f"Bullet list: {items} items")
+    labels = [f"item {i}" for i in range(items)]
+
+    def helpers():
+        return len(json.dumps([bullet_list(*labels)]))
+
+    def builder_stream():
+        sink = _CountingSink()
+        DocumentBuilder().bullet_list(labels).write(sink)
+        return sink.size
+
+    _measure("helpers + json.dumps", helpers)
+    _measure("builder (streamed)", builder_stream)
+
+
+def bench_uids(count):
+    from vaiz.helpers import UidPool
+
+    print(f"Uids: {count}")
+    start = time.perf_counter()
+    for _ in range(count):
+        _generate_uid()
+    print(f"  {'_generate_uid()':<22} {(time.perf_counter() - start) * 1000:9.1f} ms")
+    pool = UidPool()
+    start = time.perf_counter()
+    for _ in range(count):
+        pool()
+    print(f"  {'UidPool()':<22} {(time.perf_counter() - start) * 1000:9.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--cols", type=int, default=5)
+    parser.add_argument("--items", type=int, default=100000)
+    args = parser.parse_args()
+
+    bench_table(args.rows, args.cols)
+    bench_list(args.items)
+    bench_uids(args.items)
+
+
+if __name__ == "__main__":
+    main()
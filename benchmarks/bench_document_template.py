@@ -0,0 +1,71 @@
+"""
+Benchmark: helper functions vs DocumentTemplate for repeated descriptions.
+
+Renders the same task description layout (heading, owner paragraph, a small
+table and a checklist) many times with different values, comparing:
+
+- helpers: building the node tree with the helper functions per instance
+- template.render(): compiled template rendered to fresh nodes
+- template.render_json(): compiled template rendered to a JSON string
+
+Usage:
+    python benchmarks/bench_document_template.py --count 20000
+"""
+
+import argparse
+import time
+
+from vaiz.helpers import (
+    DocumentTemplate,
+    heading,
+    paragraph,
+    table,
+    table_row,
+    task_item,
+    task_list,
+    text,
+)
+
+
+def _helpers(i):
+    return [
+        heading(1, f"Task {i}"),
+        paragraph("Owner: ", text(f"member {i % 17}", bold=True)),
+        table(table_row("Estimate", str(i % 8)), table_row("Due", "Friday")),
+        task_list(task_item("Reviewed", checked=bool(i % 2)), task_item("Tested")),
+    ]
+
+
+TEMPLATE = DocumentTemplate([
+    heading(1, "Task {{i}}"),
+    paragraph("Owner: ", text("{{owner}}", bold=True)),
+    table(table_row("Estimate", "{{estimate}}"), table_row("Due", "{{due}}")),
+    task_list(task_item("Reviewed", checked="{{reviewed}}"), task_item("Tested")),
+])
+
+
+def _values(i):
+    return {"i": i, "owner": f"member {i % 17}", "estimate": i % 8, "due": "Friday", "reviewed": bool(i % 2)}
+
+
+def _measure(label, func, count):
+    start = time.perf_counter()
+    for i in range(count):
+        func(i)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<24} {elapsed * 1000:9.1f} ms   {elapsed / count * 1e6:7.1f} us/instance")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=20000)
+    args = parser.parse_args()
+
+    print(f"Descriptions: {args.count}")
+    _measure("helpers", _helpers, args.count)
+    _measure("template.render()", lambda i: TEMPLATE.render(_values(i)), args.count)
+    _measure("template.render_json()", lambda i: TEMPLATE.render_json(_values(i)), args.count)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Benchmark: bulk construction and serialization of task requests.
+
+Builds and dumps many ``CreateTaskRequest`` / ``EditTaskRequest`` objects, as a
+bulk import does before calling ``create_task()`` / ``edit_task()``, and
+compares them with equivalent "legacy" models that convert datetimes in a
+model-wide wrap serializer (the approach ``VaizBaseModel`` used before
+``IsoDateTime`` fields):
+
+- build: model construction and validation
+- dump: ``model_dump(by_alias=True)`` as sent to the API
+
+Usage:
+    python benchmarks/bench_request_serialization.py --count 50000
+"""
+
+import argparse
+import time
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from pydantic import BaseModel, ConfigDict, create_model, model_serializer
+from typing_extensions import get_args, get_origin
+
+from vaiz.models import CreateTaskRequest, EditTaskRequest, IsoDateTime
+
+
+class _LegacyBase(BaseModel):
+    model_config = ConfigDict(populate_by_name=True, validate_assignment=True)
+
+    @model_serializer(mode="wrap")
+    def serialize_model(self, serializer, info):
+        data = serializer(self)
+        if isinstance(data, dict):
+            for key, value in data.items():
+                if isinstance(value, datetime):
+                    data[key] = value.isoformat()
+        return data
+
+    def model_dump(self, **kwargs):
+        # Same None filtering as CreateTaskRequest / EditTaskRequest
+        data = super().model_dump(**kwargs)
+        return {k: v for k, v in data.items() if v is not None}
+
+
+def _legacy(model):
+    """The same model with plain ``datetime`` fields and the wrap serializer."""
+    fields = {}
+    for name, field in model.model_fields.items():
+        annotation: Any = field.annotation
+        if annotation is IsoDateTime or get_args(annotation) and IsoDateTime in get_args(annotation):
+            annotation = Optional[datetime] if get_origin(annotation) is not None else datetime
+        fields[name] = (annotation, field)
+    return create_model(f"Legacy{model.__name__}", __base__=_LegacyBase, **fields)
+
+
+def _best(function, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    due = datetime(2025, 5, 1, 17, 0, tzinfo=timezone.utc)
+    cases = [
+        ("CreateTaskRequest", CreateTaskRequest,
+         lambda i: dict(name=f"Task {i}", board="b1", group="g1", assignees=["u1"], due_start=due, due_end=due)),
+        ("EditTaskRequest", EditTaskRequest,
+         lambda i: dict(task_id=f"t{i}", name=f"Task {i}", due_end=due)),
+    ]
+
+    print(f"Requests: {args.count}")
+    for label, model, make in cases:
+        inputs = [make(i) for i in range(args.count)]
+        dumps = []
+        for variant, cls in (("legacy", _legacy(model)), ("IsoDateTime", model)):
+            build, requests = _best(lambda: [cls(**data) for data in inputs], args.repeat)
+            dump, dumped = _best(lambda: [request.model_dump(by_alias=True) for request in requests], args.repeat)
+            dumps.append(dumped)
+            print(f"  {label:<18} {variant:<12} build {build * 1000:7.1f} ms   dump {dump * 1000:7.1f} ms")
+        assert dumps[0] == dumps[1], "outputs differ"
+
+
+if __name__ == "__main__":
+    main()
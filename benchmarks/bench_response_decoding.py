@@ -0,0 +1,113 @@
+"""
+Benchmark: decoding large API responses.
+
+Decodes synthetic ``getJSONDocument`` and ``getTasks`` response bodies of
+roughly 1, 5 and 10 MB with each available decoder:
+
+- requests: ``Response.json()`` followed by ``json.loads`` of the embedded
+  document string (what the client did before decoders were pluggable)
+- json / orjson / msgspec: ``get_json_decoder(name)`` on the raw body bytes,
+  then on the embedded document string
+
+Usage:
+    python benchmarks/bench_response_decoding.py --sizes 1 5 10
+"""
+
+import argparse
+import json
+import time
+
+import requests
+
+from vaiz.api.encoding import get_json_decoder
+from vaiz.helpers import bullet_list, heading, paragraph, text
+
+
+def _document_body(megabytes):
+    nodes = []
+    size = 0
+    i = 0
+    while size < megabytes * 2 ** 20:
+        node = (heading(2, f"Section {i}") if i % 10 == 0 else
+                bullet_list(f"Item {i} ✓", paragraph(text(f"Note {i}", bold=True))) if i % 3 == 0 else
+                paragraph(text(f"Paragraph {i} with some text: \"quoted\" — Zürich")))
+        nodes.append(node)
+        size += len(json.dumps(node))
+        i += 1
+    document = json.dumps({"type": "doc", "content": nodes})
+    return json.dumps({"type": "GetJSONDocument", "payload": {"json": document}}).encode("utf-8")
+
+
+def _tasks_body(megabytes):
+    tasks = []
+    size = 0
+    i = 0
+    while size < megabytes * 2 ** 20:
+        task = {
+            "_id": f"65f{i:021x}", "name": f"Task {i} ✓", "group": f"g{i % 8}", "board": f"b{i % 4}",
+            "project": f"p{i % 4}", "types": ["t1"], "priority": i % 4, "hrid": f"PRJ-{i}",
+            "followers": {f"u{i % 50}": "creator"}, "completed": bool(i % 3), "assignees": [f"u{i % 50}"],
+            "subtasks": [], "milestones": [], "dueEnd": "2025-03-01T00:00:00.000Z",
+            "customFields": [{"id": "f1", "value": str(i % 100)}], "creator": f"u{i % 50}",
+            "createdAt": "2025-01-01T10:00:00.000Z", "updatedAt": "2025-01-02T10:00:00.000Z",
+            "document": f"d{i:021x}",
+        }
+        tasks.append(task)
+        size += len(json.dumps(task))
+        i += 1
+    return json.dumps({"type": "GetTasks", "payload": {"tasks": tasks}}).encode("utf-8")
+
+
+def _decode_nested(decode, body):
+    data = decode(body)
+    payload = data["payload"]
+    if "json" in payload:
+        return decode(payload["json"])
+    return data
+
+
+def _requests_json(body):
+    response = requests.Response()
+    response._content = body
+    response.encoding = None
+    data = response.json()
+    payload = data["payload"]
+    if "json" in payload:
+        return json.loads(payload["json"])
+    return data
+
+
+def _best(function, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 5, 10], help="Body sizes in MB")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    decoders = [("requests", _requests_json)]
+    for name in ("json", "orjson", "msgspec"):
+        try:
+            decode = get_json_decoder(name)
+        except ImportError:
+            continue
+        decoders.append((name, lambda body, decode=decode: _decode_nested(decode, body)))
+
+    for label, build in (("getJSONDocument", _document_body), ("getTasks", _tasks_body)):
+        for megabytes in args.sizes:
+            body = build(megabytes)
+            print(f"{label} {len(body) / 2 ** 20:.1f} MB")
+            for name, decode in decoders:
+                seconds = _best(lambda: decode(body), args.repeat)
+                print(f"  {name:<10} {seconds * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmark: memory held by a large in-process mirror of tasks.
+
+Builds the same synthetic tasks in several representations and measures the
+memory they keep alive with ``tracemalloc``:
+
+- raw dicts: the decoded ``getTasks`` JSON
+- Task: validated pydantic models
+- TaskView: lazy views (raw dict plus memoized fields)
+- TaskRecord: slotted records with interned ids and integer timestamps
+
+Usage:
+    python benchmarks/bench_task_memory.py --count 200000
+"""
+
+import argparse
+import gc
+import json
+import tracemalloc
+
+from vaiz.models import Task, TaskRecord, TaskView
+
+
+def _task(i):
+    return {
+        "_id": f"65f{i:021x}", "name": f"Task {i}", "group": f"g{i % 8}", "board": f"b{i % 4}",
+        "project": f"p{i % 4}", "types": ["t1"], "priority": i % 4, "hrid": f"PRJ-{i}",
+        "followers": {f"u{i % 50}": "creator"}, "completed": bool(i % 3), "assignees": [f"u{i % 50}", f"u{i % 7}"],
+        "subtasks": [], "milestones": [f"m{i % 10}"], "dueStart": None, "dueEnd": "2025-03-01T00:00:00.000Z",
+        "rightConnectors": [], "leftConnectors": [], "customFields": [{"id": "f1", "value": str(i % 100)}],
+        "creator": f"u{i % 50}", "createdAt": "2025-01-01T10:00:00.000Z", "updatedAt": "2025-01-02T10:00:00.000Z",
+        "document": f"d{i:021x}",
+    }
+
+
+def _measure(label, build, count):
+    # Decode fresh JSON so no representation shares strings with the source data
+    raw = json.dumps([_task(i) for i in range(count)])
+    gc.collect()
+    tracemalloc.start()
+    items = build(json.loads(raw))
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {label:<12} {current / 2 ** 20:9.1f} MiB   {current / count:7.0f} B/task")
+    del items
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=50000)
+    args = parser.parse_args()
+
+    print(f"Tasks: {args.count}")
+    _measure("raw dicts", lambda data: data, args.count)
+    _measure("Task", lambda data: [Task(**task) for task in data], args.count)
+    _measure("TaskView", lambda data: [TaskView(task) for task in data], args.count)
+    _measure("TaskRecord", lambda data: [TaskRecord.from_dict(task) for task in data], args.count)
+
+
+if __name__ == "__main__":
+    main()
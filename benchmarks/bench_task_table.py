@@ -0,0 +1,90 @@
+"""
+Benchmark: analytics over a large task set, row objects vs TaskTable.
+
+Runs the same queries over synthetic tasks held as ``Task`` models and as a
+``TaskTable`` (with NumPy when installed, and with the ``array`` fallback):
+
+- overdue open tasks
+- open high-priority tasks on one board
+- tasks per assignee
+- tasks sorted by due date
+
+Usage:
+    python benchmarks/bench_task_table.py --count 200000
+"""
+
+import argparse
+import time
+from collections import Counter
+from datetime import datetime, timezone
+
+from vaiz import TaskTable
+from vaiz.helpers import task_table
+from vaiz.models import Task
+
+
+def _task(i):
+    return {
+        "_id": f"65f{i:021x}", "name": f"Task {i}", "group": f"g{i % 8}", "board": f"b{i % 4}",
+        "project": f"p{i % 4}", "priority": i % 4, "hrid": f"PRJ-{i}", "followers": {},
+        "completed": bool(i % 3 == 0), "assignees": [f"u{i % 50}", f"u{i % 7}"][: i % 3],
+        "dueEnd": None if i % 5 == 0 else f"2025-{i % 12 + 1:02d}-{i % 28 + 1:02d}T00:00:00.000Z",
+        "creator": f"u{i % 50}", "createdAt": "2025-01-01T10:00:00.000Z", "updatedAt": "2025-01-02T10:00:00.000Z",
+        "document": f"d{i:021x}",
+    }
+
+
+NOW = datetime(2025, 6, 1, tzinfo=timezone.utc)
+FAR_FUTURE = datetime.max.replace(tzinfo=timezone.utc)
+
+
+def _row_queries(tasks):
+    overdue = [t.id for t in tasks if not t.completed and t.due_end is not None and t.due_end < NOW]
+    urgent = [t.id for t in tasks if not t.completed and t.priority == 3 and t.board == "b1"]
+    load = Counter(member for t in tasks for member in t.assignees)
+    by_due = [t.id for t in sorted(tasks, key=lambda t: t.due_end or FAR_FUTURE)]
+    return len(overdue), len(urgent), len(load), len(by_due)
+
+
+def _table_queries(table):
+    overdue = table.overdue(NOW).ids
+    urgent = table.filter(completed=False, priority=3, board="b1").ids
+    load = table.count_by("assignees")
+    by_due = table.sort_by("due_end").ids
+    return len(overdue), len(urgent), len(load), len(by_due)
+
+
+def _best(function, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    data = [_task(i) for i in range(args.count)]
+    tasks = [Task(**task) for task in data]
+    print(f"Tasks: {args.count}")
+
+    seconds, expected = _best(lambda: _row_queries(tasks), args.repeat)
+    print(f"  {'Task rows':<18} {seconds * 1000:8.1f} ms")
+
+    backends = [("TaskTable (array)", False)]
+    if task_table.np is not None:
+        backends.append(("TaskTable (numpy)", True))
+    for label, use_numpy in backends:
+        build_seconds, table = _best(lambda: TaskTable.from_tasks(data, use_numpy=use_numpy), 1)
+        seconds, result = _best(lambda: _table_queries(table), args.repeat)
+        assert result == expected, (result, expected)
+        print(f"  {label:<18} {seconds * 1000:8.1f} ms   (build {build_seconds * 1000:.0f} ms)")
+
+
+if __name__ == "__main__":
+    main()
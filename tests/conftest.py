@@ -0,0 +1,33 @@
+"""
+Shared fixtures for unit tests that run without a Vaiz server.
+"""
+
+import pytest
+
+from vaiz import VaizClient
+
+
+@pytest.fixture
+def fake_client(monkeypatch):
+    """
+    Factory for a ``VaizClient`` whose requests are answered locally.
+
+    ``fake_client(respond=None, **client_kwargs)`` returns ``(client, calls)``:
+    the endpoint of every request is appended to ``calls``, and the request is
+    answered with ``respond(endpoint, json_data)`` (an empty dict by default).
+
+    Example:
+        >>> client, calls = fake_client(lambda endpoint, data: {"payload": {}}, json_decoder="json")
+    """
+    def make(respond=None, **kwargs):
+        client = VaizClient(api_key="key", space_id="space", **kwargs)
+        calls = []
+
+        def fake_request(endpoint, method="POST", json_data=None):
+            calls.append(endpoint)
+            return respond(endpoint, json_data) if respond is not None else {}
+
+        monkeypatch.setattr(client, "_make_request", fake_request)
+        return client, calls
+
+    return make
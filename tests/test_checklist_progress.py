@@ -0,0 +1,68 @@
+"""
+Tests for checklist progress aggregation across task descriptions.
+"""
+
+import json
+
+import pytest
+
+from vaiz import ChecklistProgress, count_checklist
+from vaiz.helpers import paragraph, task_item, task_list
+from vaiz.models import Task
+
+
+def _task(task_id, document_id):
+    return {
+        "_id": task_id, "name": task_id, "group": "g", "board": "b", "project": "p",
+        "priority": 1, "hrid": "PRJ-1", "followers": {}, "completed": False, "creator": "u",
+        "createdAt": "2025-01-01T00:00:00Z", "updatedAt": "2025-01-01T00:00:00Z", "document": document_id,
+    }
+
+
+def _checklist(*states):
+    return json.dumps({"type": "doc", "content": [task_list(*(task_item("item", checked=state) for state in states))]})
+
+
+def test_count_checklist_includes_nested_items():
+    """Test that nested task items are counted and percentages are derived."""
+    nested = task_item(paragraph("parent"), task_list(task_item("child", checked=True)), checked=False)
+    content = [paragraph("intro"), task_list(task_item("done", checked=True), nested)]
+
+    progress = count_checklist(content)
+    assert progress == ChecklistProgress(checked=2, total=3)
+    assert progress.unchecked == 1
+    assert round(progress.percent, 1) == 66.7
+    assert count_checklist({"type": "doc", "content": [paragraph("no checklist")]}).percent is None
+
+
+def test_checklist_progress_resolves_ids_and_aggregates(fake_client):
+    """Test that task IDs are resolved in batches and descriptions are counted per task."""
+    documents = {"doc1": _checklist(True, False), "doc2": _checklist(True, True, True, False)}
+    tasks = {"t1": _task("t1", "doc1"), "t2": _task("t2", "doc2"), "t3": _task("t3", "missing")}
+    batches = []
+
+    def respond(endpoint, json_data):
+        if endpoint == "getTasks":
+            batches.append(json_data["ids"])
+            found = [tasks[task_id] for task_id in json_data["ids"] if task_id in tasks]
+            return {"type": "GetTasks", "payload": {"tasks": found}}
+        if endpoint == "getJSONDocument":
+            if json_data["documentId"] not in documents:
+                raise RuntimeError("Document not found")
+            return {"payload": {"json": documents[json_data["documentId"]]}}
+        raise AssertionError(endpoint)
+
+    client, _ = fake_client(respond)
+    known = Task(**_task("t2", "doc2"))
+
+    result = client.checklist_progress(["t1", known, "t3", "t4", "t1"])
+
+    assert batches == [["t1", "t3", "t4"]]
+    assert list(result.tasks) == ["t1", "t2"]
+    assert result.tasks["t1"] == ChecklistProgress(1, 2)
+    assert result.tasks["t2"] == ChecklistProgress(3, 4)
+    assert result.total == ChecklistProgress(4, 6)
+    assert result.failed == {"t3": "Document not found", "t4": "Task not found"}
+
+    with pytest.raises(ValueError):
+        client.checklist_progress(["t1"], concurrency=0)
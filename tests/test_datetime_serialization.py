@@ -0,0 +1,41 @@
+"""
+Tests for IsoDateTime field serialization.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+from vaiz.models import CreateTaskRequest, EditTaskRequest, GetTasksResponse, IsoDateTime, VaizBaseModel
+
+
+def test_request_datetimes_dump_as_iso_strings():
+    """Test that request datetimes are ISO strings in model_dump and pydantic's format in JSON."""
+    due = datetime(2025, 5, 1, 17, 0, tzinfo=timezone(timedelta(hours=2)))
+    request = CreateTaskRequest(name="Task", board="b1", due_start=datetime(2025, 4, 1, 9, 30), due_end=due)
+
+    data = request.model_dump(by_alias=True)
+    assert data["dueStart"] == "2025-04-01T09:30:00"
+    assert data["dueEnd"] == "2025-05-01T17:00:00+02:00"
+    assert EditTaskRequest(task_id="t1", due_end=due).model_dump(by_alias=True) == {"taskId": "t1", "dueEnd": due.isoformat()}
+
+    response = GetTasksResponse(type="GetTasks", payload={"tasks": [{
+        "_id": "t1", "name": "T", "group": "g", "board": "b", "project": "p", "priority": 1, "hrid": "H-1",
+        "followers": {}, "completed": False, "creator": "u", "document": "d",
+        "createdAt": "2025-01-01T10:00:00.000Z", "updatedAt": "2025-01-02T10:00:00.000Z",
+    }]})
+    task = response.model_dump()["payload"]["tasks"][0]
+    assert task["created_at"] == "2025-01-01T10:00:00+00:00"
+    assert '"createdAt":"2025-01-01T10:00:00Z"' in response.model_dump_json(by_alias=True)
+
+
+def test_nested_datetimes_are_serialized():
+    """Test that datetimes inside lists and dicts are converted too."""
+
+    class Schedule(VaizBaseModel):
+        when: Optional[IsoDateTime] = None
+        reminders: List[IsoDateTime] = []
+        by_user: Dict[str, IsoDateTime] = {}
+
+    moment = datetime(2025, 3, 1, 12, 0, tzinfo=timezone.utc)
+    data = Schedule(reminders=[moment], by_user={"u1": moment}).model_dump()
+    assert data == {"when": None, "reminders": ["2025-03-01T12:00:00+00:00"], "by_user": {"u1": "2025-03-01T12:00:00+00:00"}}
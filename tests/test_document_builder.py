@@ -0,0 +1,102 @@
+"""
+Tests for the streaming DocumentBuilder.
+"""
+
+import io
+import json
+
+from vaiz.helpers import (
+    DocumentBuilder,
+    UidPool,
+    bullet_list,
+    heading,
+    ordered_list,
+    paragraph,
+    table,
+    table_cell,
+    table_header,
+    table_row,
+    task_item,
+    task_list,
+    text,
+    toc_block,
+    canonical_json,
+)
+
+
+def _builder():
+    builder = DocumentBuilder()
+    builder.add(toc_block()).heading(1, "Inventory").paragraph("Generated ", text("nightly", italic=True))
+    builder.table(
+        [("A-1", 3, None), ("B-2", 4.5, text("low", bold=True))],
+        header=["SKU", "Qty", "Note"],
+    )
+    builder.bullet_list(["one", "two"]).ordered_list(["first"], start=3)
+    builder.task_list(["todo", ("done", True), task_item("node")])
+    return builder
+
+
+def test_builder_matches_helper_functions():
+    """Test that builder output equals the same content built with helpers."""
+    expected = [
+        toc_block(),
+        heading(1, "Inventory"),
+        paragraph("Generated ", text("nightly", italic=True)),
+        table(
+            table_row(table_header("SKU"), table_header("Qty"), table_header("Note")),
+            table_row("A-1", "3", table_cell(paragraph(" "))),
+            table_row("B-2", "4.5", table_cell(paragraph(text("low", bold=True)))),
+        ),
+        bullet_list("one", "two"),
+        ordered_list("first", start=3),
+        task_list("todo", task_item("done", checked=True), task_item("node")),
+    ]
+    builder = _builder()
+    built = builder.build()
+    assert canonical_json(built) == canonical_json(expected)
+    # Tables and task lists get uids in the helpers' format
+    assert [len(built[i]["attrs"]["uid"]) for i in (3, 6)] == [len(expected[i]["attrs"]["uid"]) for i in (3, 6)]
+    assert canonical_json(json.loads(builder.to_json())) == canonical_json(expected)
+
+
+def test_streamed_json_equals_built_nodes():
+    """Test that streamed JSON is byte-for-byte the serialization of build()."""
+    builder = _builder()
+    out = io.StringIO()
+    written = builder.write(out)
+    assert written == len(out.getvalue())
+    assert json.loads(out.getvalue()) == json.loads(json.dumps(builder.build()))
+
+
+def test_large_table_is_consumed_lazily():
+    """Test that table rows are pulled from a generator only during serialization."""
+    pulled = []
+
+    def rows():
+        for i in range(1000):
+            pulled.append(i)
+            yield (f"row {i}", i)
+
+    builder = DocumentBuilder().table(rows())
+    assert pulled == []
+    chunks = builder.iter_json()
+    head = [next(chunks), next(chunks), next(chunks)]
+    assert 0 < len(pulled) < 1000
+    document = json.loads("".join(head) + "".join(chunks))
+    assert len(document[0]["content"]) == 1000
+    assert len(pulled) == 1000
+
+
+def test_uid_pool():
+    """Test that pooled uids have the ``_short_id()`` format and do not repeat."""
+    pool = UidPool(batch_size=4)
+    uids = [pool() for _ in range(1000)]
+    assert len(set(uids)) == 1000
+    assert all(len(uid) == 11 and set(uid) <= set("0123456789abcdef") for uid in uids)
+
+
+def test_uid_pool_odd_batch_sizes():
+    """Test that odd batch sizes never hand out the spare hex character as a uid."""
+    for batch_size in (1, 3, 5):
+        pool = UidPool(batch_size=batch_size)
+        assert all(len(pool()) == 11 for _ in range(4 * batch_size + 1)), batch_size
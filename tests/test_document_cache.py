@@ -0,0 +1,132 @@
+"""
+Tests for the opt-in document content cache.
+"""
+
+import json
+
+import pytest
+
+from vaiz.api.cache import DocumentCache
+from vaiz.helpers import paragraph
+
+
+def _respond(endpoint, json_data):
+    if endpoint == "getJSONDocument":
+        return {"payload": {"json": json.dumps({"type": "doc", "content": [paragraph("Hello")]})}}
+    if endpoint == "getMarkdownDocument":
+        return {"payload": {"markdown": "Hello"}, "type": "GetMarkdownDocument"}
+    return {}
+
+
+def test_reads_are_cached_per_format(fake_client):
+    """Test that repeated reads hit the network once per document and format."""
+    client, calls = fake_client(_respond, document_cache=True)
+
+    first = client.get_json_document("doc_1")
+    first["content"].clear()  # callers get their own copy
+    assert client.get_json_document("doc_1")["content"]
+    assert client.get_markdown_document("doc_1") == "Hello"
+    assert client.get_markdown_document("doc_1") == "Hello"
+
+    assert calls == ["getJSONDocument", "getMarkdownDocument"]
+
+
+def test_writes_invalidate_cached_content(fake_client):
+    """Test that replace and append calls drop the cached entries of that document."""
+    client, calls = fake_client(_respond, document_cache=True)
+
+    client.get_json_document("doc_1")
+    client.get_json_document("doc_2")
+    client.append_markdown_document("doc_1", "More")
+    client.get_json_document("doc_1")
+    client.get_json_document("doc_2")
+    client.replace_json_document("doc_1", [paragraph("New")])
+    client.get_markdown_document("doc_1")
+    client.clear_document_cache()
+    client.get_json_document("doc_2")
+
+    assert calls == [
+        "getJSONDocument", "getJSONDocument",
+        "appendMarkdownDocument", "getJSONDocument",
+        "replaceJSONDocument", "getMarkdownDocument",
+        "getJSONDocument",
+    ]
+
+
+def test_fetch_overlapping_a_write_is_not_cached(fake_client):
+    """Test that content fetched while a write lands is not put back into the cache."""
+    interleaved = set()
+
+    def respond(endpoint, json_data):
+        if endpoint in ("getJSONDocument", "getMarkdownDocument") and endpoint not in interleaved:
+            # A write completes while the first fetch of each format is in flight
+            interleaved.add(endpoint)
+            client.replace_markdown_document("doc_1", "New")
+        return _respond(endpoint, json_data)
+
+    client, calls = fake_client(respond, document_cache=True)
+
+    client.get_json_document("doc_1")
+    client.get_json_document("doc_1")
+    client.get_markdown_document("doc_1")
+    client.get_markdown_document("doc_1")
+
+    assert calls == [
+        "getJSONDocument", "replaceMarkdownDocument", "getJSONDocument",
+        "getMarkdownDocument", "replaceMarkdownDocument", "getMarkdownDocument",
+    ]
+
+
+def test_cache_is_disabled_by_default(fake_client):
+    """Test that without document_cache every read hits the network."""
+    client, calls = fake_client(_respond)
+
+    client.get_json_document("doc_1")
+    client.get_json_document("doc_1")
+
+    assert calls == ["getJSONDocument", "getJSONDocument"]
+
+
+def test_document_cache_ttl_and_lru(monkeypatch):
+    """Test expiry and least-recently-used eviction."""
+    now = [1000.0]
+    monkeypatch.setattr("vaiz.api.cache.time.monotonic", lambda: now[0])
+
+    cache = DocumentCache(max_entries=2, ttl=10)
+    cache.set("a", "json", "{}")
+    cache.set("b", "json", "{}")
+    assert cache.get("a", "json") == "{}"  # "a" is now most recently used
+    cache.set("c", "json", "{}")
+    assert cache.get("b", "json") is None
+    assert cache.get("a", "json") == "{}"
+
+    now[0] += 11
+    assert cache.get("a", "json") is None
+    assert len(cache) == 1
+
+    with pytest.raises(ValueError):
+        DocumentCache(max_entries=0)
+
+
+def test_document_cache_generations():
+    """Test that content fetched before an invalidation or clear is dropped."""
+    cache = DocumentCache(max_entries=2)
+    before = cache.generation("a")
+    cache.invalidate("a")
+    cache.set("a", "json", "stale", before)
+    assert cache.get("a", "json") is None
+    cache.set("a", "json", "fresh", cache.generation("a"))
+    assert cache.get("a", "json") == "fresh"
+
+    before = cache.generation("b")
+    cache.clear()
+    cache.set("b", "json", "stale", before)
+    assert len(cache) == 0
+
+    # The generation table stays bounded, and documents invalidated earlier still move on
+    before = cache.generation("c")
+    for document_id in ("d", "e", "f"):
+        cache.invalidate(document_id)
+    cache.set("c", "json", "{}", before)
+    assert cache.get("c", "json") is None
+    assert len(cache._generations) <= 2
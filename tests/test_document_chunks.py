@@ -0,0 +1,145 @@
+"""
+Tests for chunked writes of oversized document content.
+"""
+
+import json
+
+import pytest
+import requests
+
+from vaiz.api.base import (
+    VaizChunkedWriteError,
+    VaizHTTPError,
+    VaizRateLimitError,
+    VaizSDKError,
+    VaizValidationError,
+)
+from vaiz.helpers import paragraph, split_content
+
+
+def _content(count=20):
+    return [paragraph(f"Paragraph number {i} " + "x" * 40) for i in range(count)]
+
+
+def _client(fake_client, fail=None, **kwargs):
+    """Client recording the content of each write; ``fail(n)`` may return an error for the n-th request."""
+    chunks = []
+
+    def respond(endpoint, json_data):
+        chunks.append(json_data["content"])
+        error = fail(len(chunks)) if fail else None
+        if error:
+            raise error
+        return {}
+
+    client, calls = fake_client(respond, chunk_retry_delay=0, **kwargs)
+    return client, calls, chunks
+
+
+def test_split_content_respects_budget_and_order():
+    """Test that chunks stay under the byte budget and keep node order."""
+    content = _content()
+    budget = 400
+    chunks = split_content(content, budget)
+
+    assert len(chunks) > 1
+    assert [node for chunk in chunks for node in chunk] == content
+    for chunk in chunks:
+        assert len(json.dumps(chunk, separators=(",", ":")).encode("utf-8")) <= budget
+
+    # A node larger than the budget gets a chunk of its own
+    big = paragraph("y" * 1000)
+    assert split_content([content[0], big, content[1]], budget) == [[content[0]], [big], [content[1]]]
+    assert split_content([], budget) == []
+    with pytest.raises(ValueError):
+        split_content(content, 0)
+
+
+def test_replace_sends_replace_then_ordered_appends(fake_client):
+    """Test that oversized content is sent as one replace followed by appends."""
+    client, calls, chunks = _client(fake_client, chunk_size=400)
+    content = _content()
+
+    client.replace_json_document("doc_1", content)
+
+    assert calls[0] == "replaceJSONDocument"
+    assert set(calls[1:]) == {"appendJSONDocument"}
+    assert [node for chunk in chunks for node in chunk] == content
+
+    # Per-call override and small content stay single-request
+    calls.clear()
+    client.replace_json_document("doc_1", content, chunk_size=10**6)
+    assert calls == ["replaceJSONDocument"]
+
+
+def _error(cause):
+    """A client network error raised from a requests exception."""
+    error = VaizSDKError("Network error")
+    error.__cause__ = cause
+    return error
+
+
+def test_only_failed_chunk_is_retried(fake_client):
+    """Test that a transient failure resends only the failing chunk."""
+    client, calls, chunks = _client(
+        fake_client,
+        chunk_size=400,
+        fail=lambda n: VaizRateLimitError("slow down") if n == 3 else None,
+    )
+    content = _content()
+
+    client.append_json_document("doc_1", content)
+
+    assert chunks[2] == chunks[3]  # failed chunk resent once
+    assert [node for chunk in chunks[:2] + chunks[3:] for node in chunk] == content
+
+
+def test_partial_failure_raises_chunked_write_error(fake_client):
+    """Test that non-retryable errors stop the write and report progress."""
+    client, calls, _ = _client(
+        fake_client,
+        chunk_size=400,
+        fail=lambda n: VaizValidationError("bad node") if n == 2 else None,
+    )
+
+    with pytest.raises(VaizChunkedWriteError) as exc_info:
+        client.replace_json_document("doc_1", _content())
+
+    assert len(calls) == 2
+    assert exc_info.value.chunk_index == 1
+    assert exc_info.value.total_chunks > 2
+    assert isinstance(exc_info.value.__cause__, VaizValidationError)
+
+
+@pytest.mark.parametrize("error, retried", [
+    (_error(requests.exceptions.ConnectTimeout("connect timed out")), True),
+    (VaizHTTPError("Invalid JSON", status_code=503), True),
+    (_error(requests.exceptions.ReadTimeout("read timed out")), False),
+    (VaizHTTPError("Invalid JSON", status_code=502), False),
+    (VaizSDKError("Server error"), False),
+], ids=["connect-timeout", "503", "read-timeout", "502", "api-error"])
+def test_append_is_retried_only_if_not_applied(fake_client, error, retried):
+    """Test that an append that may have been applied is never sent again."""
+    client, calls, chunks = _client(fake_client, chunk_size=400, fail=lambda n: error if n == 2 else None)
+
+    if retried:
+        client.append_json_document("doc_1", _content())
+        assert chunks[1] == chunks[2]
+    else:
+        with pytest.raises(VaizChunkedWriteError):
+            client.append_json_document("doc_1", _content())
+        assert len(calls) == 2
+
+
+def test_replace_chunk_is_retried_after_ambiguous_failure(fake_client):
+    """Test that the first (replace) chunk is retried after any transient failure."""
+    client, calls, _ = _client(
+        fake_client,
+        chunk_size=400,
+        fail=lambda n: _error(requests.exceptions.ReadTimeout("read timed out")) if n == 1 else None,
+    )
+
+    client.replace_json_document("doc_1", _content())
+
+    assert calls[:2] == ["replaceJSONDocument", "replaceJSONDocument"]
+    assert set(calls[2:]) == {"appendJSONDocument"}
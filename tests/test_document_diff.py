@@ -0,0 +1,101 @@
+"""
+Tests for document diffing and minimal-update planning.
+"""
+
+import json
+
+from vaiz.helpers import (
+    heading,
+    paragraph,
+    text,
+    task_list,
+    toc_block,
+    files_block,
+    canonical_json,
+    content_fingerprint,
+    plan_document_update,
+)
+
+
+def _report(*extra):
+    return [
+        toc_block(),
+        heading(1, "Weekly report"),
+        paragraph("Status: ", text("green", bold=True)),
+        task_list("Ship it", "Celebrate"),
+        *extra,
+    ]
+
+
+def test_canonical_json_ignores_generated_ids():
+    """Test that re-rendered content has the same canonical form."""
+    file_item = {
+        "fileId": "file_1", "url": "http://example.com/a.pdf", "name": "a.pdf",
+        "size": 1, "extension": "pdf", "type": "Pdf",
+    }
+    assert canonical_json(_report(files_block(file_item))) == canonical_json(_report(files_block(file_item)))
+    assert content_fingerprint(_report()) == content_fingerprint(_report())
+    assert content_fingerprint(_report()) != content_fingerprint(_report(paragraph("More")))
+
+
+def test_plan_no_change():
+    """Test identical content plans no write."""
+    plan = plan_document_update({"type": "doc", "content": _report()}, _report())
+
+    assert plan.action == "none"
+    assert plan.content == []
+    assert plan.bytes_saved == plan.full_bytes > 0
+
+
+def test_plan_append_suffix():
+    """Test that new nodes at the end are planned as an append."""
+    new_section = [heading(2, "Details"), paragraph("New numbers")]
+    plan = plan_document_update({"type": "doc", "content": _report()}, _report(*new_section))
+
+    assert plan.action == "append"
+    assert plan.content == new_section
+    assert 0 < plan.sent_bytes < plan.full_bytes
+    assert plan.bytes_saved == plan.full_bytes - plan.sent_bytes
+
+
+def test_plan_replace_on_change():
+    """Test that edits, removals and empty documents fall back to replace."""
+    current = {"type": "doc", "content": _report()}
+
+    edited = _report()
+    edited[1] = heading(1, "Monthly report")
+    assert plan_document_update(current, edited).action == "replace"
+
+    assert plan_document_update(current, _report()[:2]).action == "replace"
+
+    plan = plan_document_update({}, _report())
+    assert plan.action == "replace"
+    assert plan.bytes_saved == 0
+
+    assert plan_document_update({}, []).action == "none"
+
+
+def test_update_json_document_executes_plan(fake_client):
+    """Test that the client sends only what the plan requires."""
+    stored = {"type": "doc", "content": _report()}
+
+    def respond(endpoint, json_data):
+        if endpoint == "getJSONDocument":
+            return {"type": "GetJSONDocument", "payload": {"json": json.dumps(stored)}}
+        if endpoint == "appendJSONDocument":
+            stored["content"].extend(json_data["content"])
+        return {}
+
+    client, calls = fake_client(respond)
+
+    assert client.update_json_document("doc_id", _report()).action == "none"
+    assert calls == ["getJSONDocument"]
+
+    calls.clear()
+    plan = client.update_json_document("doc_id", _report(paragraph("Appendix")))
+    assert plan.action == "append"
+    assert calls == ["getJSONDocument", "appendJSONDocument"]
+
+    calls.clear()
+    assert client.update_json_document("doc_id", [paragraph("Fresh start")]).action == "replace"
+    assert calls == ["getJSONDocument", "replaceJSONDocument"]
@@ -0,0 +1,97 @@
+"""
+Tests for bulk document export to Markdown files.
+"""
+
+import json
+import os
+
+from vaiz.api.document_sync import EXPORT_MANIFEST
+from vaiz.models.enums import Kind
+
+
+def _document(doc_id, title, kind="Project", kind_id="project_1", updated="2026-01-01T00:00:00Z"):
+    return {
+        "_id": doc_id, "title": title, "size": 0, "kindId": kind_id, "kind": kind,
+        "creator": "member_1", "createdAt": "2026-01-01T00:00:00Z", "updatedAt": updated,
+        "bucket": "bucket_1",
+    }
+
+
+class FakeDocumentsAPI:
+    """In-memory documents backend: project_1 -> Guide -> {Setup, Usage}, plus Notes."""
+
+    def __init__(self):
+        self.updated = {"guide": "2026-01-01T00:00:00Z"}
+        self.children = {
+            "project_1": [("guide", "Guide"), ("notes", "Notes: Q1/Q2")],
+            "guide": [("setup", "Setup"), ("usage", "Usage")],
+        }
+        self.markdown = {doc_id: f"# {doc_id}\n" for doc_id in ("guide", "notes", "setup", "usage")}
+        self.calls = []
+
+    def __call__(self, endpoint, json_data):
+        self.calls.append((endpoint, json_data))
+        if endpoint == "getDocuments":
+            documents = [
+                _document(doc_id, title, updated=self.updated.get(doc_id, "2026-01-01T00:00:00Z"))
+                for doc_id, title in self.children.get(json_data["kindId"], [])
+            ]
+            return {"payload": {"documents": documents}, "type": "GetDocuments"}
+        if endpoint == "getMarkdownDocument":
+            return {"payload": {"markdown": self.markdown[json_data["documentId"]]}, "type": "GetMarkdownDocument"}
+        raise AssertionError(endpoint)
+
+    def content_requests(self):
+        return sorted(data["documentId"] for endpoint, data in self.calls if endpoint == "getMarkdownDocument")
+
+
+def test_export_writes_hierarchy_and_manifest(fake_client, tmp_path):
+    """Test that documents are written as nested Markdown files with a manifest."""
+    api = FakeDocumentsAPI()
+    client, _ = fake_client(api)
+
+    result = client.export_documents(Kind.Project, "project_1", str(tmp_path), concurrency=3)
+
+    assert sorted(result.exported) == ["guide", "notes", "setup", "usage"]
+    assert (tmp_path / "Guide.md").read_text(encoding="utf-8") == "# guide\n"
+    assert (tmp_path / "Guide" / "Setup.md").exists()
+    assert (tmp_path / "Guide" / "Usage.md").exists()
+    assert (tmp_path / "Notes_ Q1_Q2.md").exists()
+
+    manifest = json.loads((tmp_path / EXPORT_MANIFEST).read_text(encoding="utf-8"))
+    assert manifest["documents"]["setup"]["path"] == "Guide/Setup.md"
+
+
+def test_rerun_skips_unchanged_documents(fake_client, tmp_path):
+    """Test that a rerun only fetches documents whose updatedAt changed."""
+    api = FakeDocumentsAPI()
+    client, _ = fake_client(api)
+    client.export_documents(Kind.Project, "project_1", str(tmp_path))
+
+    api.calls.clear()
+    api.updated["guide"] = "2026-02-01T00:00:00Z"
+    api.markdown["guide"] = "# guide v2\n"
+    result = client.export_documents(Kind.Project, "project_1", str(tmp_path))
+
+    assert api.content_requests() == ["guide"]
+    assert result.exported == ["guide"]
+    assert sorted(result.unchanged) == ["notes", "setup", "usage"]
+    assert (tmp_path / "Guide.md").read_text(encoding="utf-8") == "# guide v2\n"
+
+
+def test_export_resumes_after_failures(fake_client, tmp_path):
+    """Test that failed documents are reported and fetched again on the next run."""
+    api = FakeDocumentsAPI()
+    client, _ = fake_client(api)
+    del api.markdown["usage"]
+
+    result = client.export_documents(Kind.Project, "project_1", str(tmp_path))
+    assert list(result.failed) == ["usage"]
+    assert not os.path.exists(tmp_path / "Guide" / "Usage.md")
+
+    api.calls.clear()
+    api.markdown["usage"] = "# usage\n"
+    result = client.export_documents(Kind.Project, "project_1", str(tmp_path))
+
+    assert api.content_requests() == ["usage"]
+    assert result.exported == ["usage"]
@@ -0,0 +1,83 @@
+"""
+Tests for crawling the nested document hierarchy.
+"""
+
+import threading
+
+from vaiz.models.enums import Kind
+
+
+def _document(doc_id, title):
+    return {
+        "_id": doc_id, "title": title, "size": 0, "kindId": "project_1", "kind": "Project",
+        "creator": "member_1", "createdAt": "2026-01-01T00:00:00Z", "updatedAt": "2026-01-01T00:00:00Z",
+        "bucket": "bucket_1",
+    }
+
+
+def _client(fake_client, children):
+    requested = []
+    lock = threading.Lock()
+
+    def respond(endpoint, json_data):
+        assert endpoint == "getDocuments"
+        with lock:
+            requested.append(json_data["kindId"])
+        documents = [_document(doc_id, doc_id.title()) for doc_id in children.get(json_data["kindId"], [])]
+        return {"payload": {"documents": documents}, "type": "GetDocuments"}
+
+    client, _ = fake_client(respond)
+    return client, requested
+
+
+CHILDREN = {
+    "project_1": ["guide", "notes"],
+    "guide": ["setup", "usage"],
+    "setup": ["linux"],
+}
+
+
+def test_tree_indexes(fake_client):
+    """Test that the crawl builds parent and child indexes in document order."""
+    client, requested = _client(fake_client, CHILDREN)
+
+    tree = client.get_document_tree(Kind.Project, "project_1", concurrency=3)
+
+    assert len(tree) == 5
+    assert [doc.id for doc in tree.roots] == ["guide", "notes"]
+    assert [doc.id for doc in tree.get_children("guide")] == ["setup", "usage"]
+    assert tree.get_parent("linux").id == "setup"
+    assert [doc.id for doc in tree.get_ancestors("linux")] == ["setup", "guide"]
+    assert [(doc.id, depth) for doc, depth in tree.walk()] == [
+        ("guide", 0), ("setup", 1), ("linux", 2), ("usage", 1), ("notes", 0),
+    ]
+    # Every document is listed exactly once
+    assert sorted(requested) == sorted(["project_1", "guide", "notes", "setup", "usage", "linux"])
+
+
+def test_max_depth_limits_requests(fake_client):
+    """Test that max_depth stops the crawl early."""
+    client, requested = _client(fake_client, CHILDREN)
+
+    tree = client.get_document_tree(Kind.Project, "project_1", max_depth=1)
+
+    assert "linux" not in tree
+    assert sorted(doc.id for doc, _ in tree.walk()) == ["guide", "notes", "setup", "usage"]
+    assert sorted(requested) == ["guide", "notes", "project_1"]
+    assert client.get_document_tree(Kind.Project, "project_1", max_depth=0).get_children("guide") == []
+
+
+def test_nested_document_listed_at_top_level_is_reparented(fake_client):
+    """Test that duplicates are deduplicated and moved under their real parent."""
+    children = {
+        "project_1": ["guide", "setup"],
+        "guide": ["setup"],
+        "setup": ["guide"],  # cycle must not reparent the ancestor
+    }
+    client, _ = _client(fake_client, children)
+
+    tree = client.get_document_tree(Kind.Project, "project_1")
+
+    assert [doc.id for doc in tree.roots] == ["guide"]
+    assert tree.get_parent("setup").id == "guide"
+    assert tree.get_parent("guide") is None
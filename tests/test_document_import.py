@@ -0,0 +1,100 @@
+"""
+Tests for bulk import of a Markdown directory tree.
+"""
+
+import json
+
+from vaiz.api.document_sync import IMPORT_CHECKPOINT
+from vaiz.models.enums import Kind
+
+
+class FakeDocumentsAPI:
+    """In-memory backend recording created documents and written content."""
+
+    def __init__(self, fail_titles=()):
+        self.documents = {}
+        self.content = {}
+        self.fail_titles = set(fail_titles)
+
+    def __call__(self, endpoint, json_data):
+        if endpoint == "createDocument":
+            if json_data["title"] in self.fail_titles:
+                raise RuntimeError("boom")
+            doc_id = f"doc_{len(self.documents) + 1}"
+            self.documents[doc_id] = json_data
+            document = {
+                "_id": doc_id, "title": json_data["title"], "size": 0,
+                "kindId": json_data["kindId"], "kind": json_data["kind"], "creator": "member_1",
+                "createdAt": "2026-01-01T00:00:00Z", "updatedAt": "2026-01-01T00:00:00Z", "bucket": "b",
+            }
+            return {"payload": {"document": document}, "type": "CreateDocument"}
+        if endpoint == "replaceMarkdownDocument":
+            self.content[json_data["documentId"]] = json_data["markdown"]
+            return {}
+        raise AssertionError(endpoint)
+
+    def by_title(self, title):
+        return next(doc_id for doc_id, data in self.documents.items() if data["title"] == title)
+
+
+def _wiki(tmp_path):
+    (tmp_path / "Guide").mkdir()
+    (tmp_path / "Guide.md").write_text("# Guide", encoding="utf-8")
+    (tmp_path / "Guide" / "Setup.md").write_text("# Setup", encoding="utf-8")
+    (tmp_path / "Guide" / "Usage.md").write_text("# Usage", encoding="utf-8")
+    (tmp_path / "Archive").mkdir()
+    (tmp_path / "Archive" / "2025.md").write_text("Old notes", encoding="utf-8")
+    return tmp_path
+
+
+def test_import_creates_parents_before_children(fake_client, tmp_path):
+    """Test that the directory tree maps to the document hierarchy."""
+    api = FakeDocumentsAPI()
+    client, _ = fake_client(api)
+
+    result = client.import_documents(Kind.Project, "project_1", str(_wiki(tmp_path)), concurrency=3)
+
+    assert sorted(result.created) == ["Archive", "Archive/2025", "Guide", "Guide/Setup", "Guide/Usage"]
+    assert not result.failed
+    setup = api.documents[api.by_title("Setup")]
+    assert setup["parentDocumentId"] == api.by_title("Guide")
+    assert api.documents[api.by_title("2025")]["parentDocumentId"] == api.by_title("Archive")
+    assert "parentDocumentId" not in api.documents[api.by_title("Guide")]
+    # Directory without a matching file is an empty parent
+    assert api.by_title("Archive") not in api.content
+    assert api.content[result.document_ids["Guide/Setup"]] == "# Setup"
+
+
+def test_rerun_does_not_duplicate_documents(fake_client, tmp_path):
+    """Test that a rerun reuses checkpointed documents and only rewrites changed files."""
+    wiki = _wiki(tmp_path)
+    api = FakeDocumentsAPI()
+    client, calls = fake_client(api)
+    client.import_documents(Kind.Project, "project_1", str(wiki))
+
+    calls.clear()
+    (wiki / "Guide" / "Usage.md").write_text("# Usage v2", encoding="utf-8")
+    result = client.import_documents(Kind.Project, "project_1", str(wiki))
+
+    assert "createDocument" not in calls
+    assert result.written == ["Guide/Usage"]
+    assert sorted(result.unchanged) == ["Archive/2025", "Guide", "Guide/Setup"]
+    assert len(api.documents) == 5
+
+
+def test_crashed_import_resumes(fake_client, tmp_path):
+    """Test that a failed parent skips its children and a rerun completes the import."""
+    wiki = _wiki(tmp_path)
+    api = FakeDocumentsAPI(fail_titles={"Guide"})
+    client, _ = fake_client(api)
+
+    result = client.import_documents(Kind.Project, "project_1", str(wiki))
+    assert set(result.failed) == {"Guide", "Guide/Setup", "Guide/Usage"}
+    checkpoint = json.loads((wiki / IMPORT_CHECKPOINT).read_text(encoding="utf-8"))
+    assert set(checkpoint["documents"]) == {"Archive", "Archive/2025"}
+
+    api.fail_titles.clear()
+    result = client.import_documents(Kind.Project, "project_1", str(wiki))
+
+    assert sorted(result.created) == ["Guide", "Guide/Setup", "Guide/Usage"]
+    assert len(api.documents) == 5
@@ -0,0 +1,56 @@
+"""
+Tests for building tables from rows/CSV and extracting them back.
+"""
+
+import io
+
+import pytest
+
+from vaiz import extract_tables, table_from_csv, table_from_rows
+from vaiz.helpers import (
+    canonical_json,
+    heading,
+    paragraph,
+    table,
+    table_cell,
+    table_header,
+    table_row,
+    text,
+)
+
+
+def test_table_from_rows_matches_helpers():
+    """Test that the single-pass builder produces the same nodes as the helpers."""
+    expected = table(
+        table_row(table_header("SKU"), table_header("Qty"), table_header("Note"), show_row_numbers=True),
+        table_row("A-1", "3", table_cell(paragraph(" ")), show_row_numbers=True),
+        table_row("B-2", "4", table_cell(paragraph(text("low", bold=True))), show_row_numbers=True),
+        show_row_numbers=True,
+    )
+    rows = [("A-1", 3, None), ("B-2", 4, text("low", bold=True))]
+
+    node = table_from_rows(rows, header=["SKU", "Qty", "Note"], show_row_numbers=True)
+    assert canonical_json(node) == canonical_json(expected)
+
+    # Mapping rows take the header from the first row
+    dict_rows = [{"SKU": sku, "Qty": qty, "Note": note} for sku, qty, note in rows]
+    assert canonical_json(table_from_rows(dict_rows, show_row_numbers=True)) == canonical_json(expected)
+    assert table_from_rows([])["content"] == []
+
+
+def test_csv_round_trip_with_column_types():
+    """Test CSV -> table -> typed row tuples."""
+    csv_text = "SKU,Price,Qty\nA-1,1.5,3\n\"B,2\",10,\n"
+    node = table_from_csv(io.StringIO(csv_text, newline=""), types={"Price": lambda v: f"{float(v):.2f}"})
+
+    [data] = extract_tables([heading(1, "Inventory"), node], types={"Price": float, "Qty": int})
+
+    assert data.header == ("SKU", "Price", "Qty")
+    assert data.rows == [("A-1", 1.5, 3), ("B,2", 10.0, None)]
+    assert extract_tables(node)[0].rows[0] == ("A-1", "1.50", "3")
+
+
+def test_unknown_typed_column_raises():
+    """Test that converters must refer to existing columns."""
+    with pytest.raises(ValueError, match="Missing"):
+        table_from_rows([("a",)], header=["Name"], types={"Missing": int})
@@ -0,0 +1,125 @@
+"""
+Tests for compiled document templates.
+"""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from vaiz import DocumentTemplate, slot
+from vaiz.helpers import (
+    canonical_json,
+    embed_block,
+    heading,
+    image_block,
+    link_text,
+    paragraph,
+    table,
+    table_row,
+    task_item,
+    task_list,
+    text,
+)
+
+
+class MockUploadedFile:
+    """Mock uploaded image for testing."""
+    id = "file_1"
+    url = "https://files.example/cat.png"
+    name = "cat.png"
+    size = 1024
+    ext = "png"
+    mime = None
+    dimension = [640, 480]
+    dominant_color = None
+
+
+def _template():
+    return DocumentTemplate([
+        heading(1, "{{title}}"),
+        paragraph("Owner: ", text("{{owner}}", bold=True), " (", link_text("profile", "https://x/{{owner}}"), ")"),
+        table(table_row("Estimate", "{{estimate}}")),
+        task_list(task_item("Reviewed", checked="{{reviewed}}"), slot("items")),
+    ])
+
+
+def test_render_matches_helper_output():
+    """Test that a rendered instance equals the same content built with helpers."""
+    expected = [
+        heading(1, "Checkout \"v2\""),
+        paragraph("Owner: ", text("Ann", bold=True), " (", link_text("profile", "https://x/Ann"), ")"),
+        table(table_row("Estimate", "3")),
+        task_list(task_item("Reviewed", checked=True), task_item("Ship")),
+    ]
+    template = _template()
+    assert template.names == {"title", "owner", "estimate", "reviewed", "items"}
+
+    values = {"title": 'Checkout "v2"', "owner": "Ann", "estimate": 3, "reviewed": True, "items": [task_item("Ship")]}
+
+    assert canonical_json(template.render(values)) == canonical_json(expected)
+    assert canonical_json(json.loads(template.render_json(values))) == canonical_json(expected)
+    assert json.loads(template.render_json(title="t", owner="o", estimate=1, reviewed=False, items=None)) \
+        [3]["content"] == [task_item("Reviewed", checked=False)]
+
+
+def test_each_render_gets_fresh_uids():
+    """Test that uids and custom block ids are regenerated per instance in the helpers' formats."""
+    template = DocumentTemplate([heading(2, "Photo"), image_block(MockUploadedFile(), caption="{{caption}}")])
+
+    first = template.render(caption='A "quoted" cat')
+    second = template.render(caption="Another cat")
+
+    assert first[0]["attrs"]["uid"] != second[0]["attrs"]["uid"]
+    assert len(first[0]["attrs"]["uid"]) == 12
+    first_data = json.loads(first[1]["content"][0]["text"])
+    second_data = json.loads(second[1]["content"][0]["text"])
+    assert first_data["caption"] == 'A "quoted" cat'
+    assert first_data["id"] != second_data["id"] and len(first_data["id"]) == 11
+    assert first[1]["attrs"]["uid"] != second[1]["attrs"]["uid"]
+    assert first_data["fileId"] == "file_1"
+
+
+def test_missing_value_raises():
+    """Test that every placeholder must be given a value."""
+    with pytest.raises(ValueError, match="estimate"):
+        _template().render(title="t", owner="o", reviewed=False, items=[])
+
+
+
+def test_rendered_instances_do_not_share_values():
+    """Test that dict and list values and slot nodes are copied into each instance."""
+    template = DocumentTemplate([{"type": "paragraph", "attrs": "{{attrs}}"}, task_list(slot("items"))])
+    attrs = {"align": "left", "classes": ["note"]}
+    item = task_item("Ship")
+
+    first = template.render(attrs=attrs, items=[item])
+    first[0]["attrs"]["classes"].append("changed")
+    first[1]["content"][0]["attrs"]["checked"] = True
+    second = template.render(attrs=attrs, items=item)
+
+    assert attrs == {"align": "left", "classes": ["note"]}
+    assert item["attrs"]["checked"] is False
+    assert second[0]["attrs"] == attrs and second[1]["content"] == [item]
+    assert json.loads(template.render_json(attrs=attrs, items=None))[0]["attrs"] == attrs
+
+
+def test_concurrent_renders_get_unique_uids():
+    """Test that a template shared between threads never hands out the same uid twice."""
+    template = DocumentTemplate([task_list(task_item("{{name}}"))])
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        uids = list(executor.map(lambda i: template.render(name=i)[0]["attrs"]["uid"], range(4000)))
+
+    assert len(set(uids)) == len(uids)
+
+
+def test_uid_format_follows_node_type():
+    """Test that long_uid_types picks which nodes get 12-character uids."""
+    content = [heading(1, "{{title}}"), embed_block("https://example.com/embed"), task_list(task_item("Ship"))]
+
+    default = DocumentTemplate(content).render(title="t")
+    assert [len(node["attrs"]["uid"]) for node in default] == [12, 12, 11]
+
+    custom = DocumentTemplate(content, long_uid_types={"taskList"}).render(title="t")
+    assert [len(node["attrs"]["uid"]) for node in custom] == [11, 11, 12]
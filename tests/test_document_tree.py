@@ -0,0 +1,106 @@
+"""
+Tests for the indexed DocumentTree wrapper.
+"""
+
+from vaiz.helpers import (
+    DocumentTree,
+    heading,
+    paragraph,
+    text,
+    bullet_list,
+    task_list,
+    task_item,
+    table,
+    table_row,
+    mention_user,
+    mention_task,
+    files_block,
+    toc_block,
+)
+
+
+def _sample_document():
+    return {
+        "type": "doc",
+        "content": [
+            toc_block(),
+            heading(1, "Overview"),
+            paragraph("Owner: ", mention_user("user_1"), " see ", mention_task("task_1")),
+            bullet_list("First", "Second"),
+            heading(2, "Checklist"),
+            task_list(
+                task_item("Done", checked=True),
+                task_item("Todo", checked=False),
+            ),
+            table(table_row("A", "B"), table_row("1", "2")),
+            files_block({
+                "fileId": "file_1",
+                "url": "http://example.com/a.pdf",
+                "name": "a.pdf",
+                "size": 10,
+                "extension": "pdf",
+                "type": "Pdf",
+            }),
+        ],
+    }
+
+
+def test_document_tree_type_indexes():
+    """Test per-type indexes and convenience properties."""
+    tree = DocumentTree(_sample_document())
+
+    assert [tree.text(node) for node in tree.headings] == ["Overview", "Checklist"]
+    assert len(tree.task_lists) == 1
+    assert len(tree.task_items) == 2
+    assert len(tree.tables) == 1
+    assert len(tree.mentions) == 2
+    assert len(tree.file_blocks) == 1
+    assert tree.image_blocks == []
+    assert tree.count("listItem") == 2
+
+
+def test_document_tree_uid_lookup_and_parents():
+    """Test lookup by uid and parent/ancestor navigation."""
+    document = _sample_document()
+    tree = DocumentTree(document)
+
+    second_heading = document["content"][4]
+    uid = second_heading["attrs"]["uid"]
+    assert uid in tree
+    assert tree.get(uid) is second_heading
+    assert tree.get("missing") is None
+
+    item = tree.task_items[1]
+    assert tree.parent(item) is tree.task_lists[0]
+    assert list(tree.ancestors(item)) == [tree.task_lists[0], document]
+
+
+def test_document_tree_iter_nodes_document_order():
+    """Test that iteration follows document order and filters lazily."""
+    tree = DocumentTree(_sample_document())
+
+    texts = [node["text"] for node in tree.iter_nodes(type="text")]
+    assert texts[1:3] == ["Overview", "Owner: "]
+
+    types = [node["type"] for node in tree.iter_nodes(type=("heading", "taskList"))]
+    assert types == ["heading", "heading", "taskList"]
+
+    assert len(list(tree.iter_nodes())) == len(tree)
+
+
+def test_document_tree_text_and_block_helpers():
+    """Test text extraction skips custom block payloads and helpers decode them."""
+    tree = DocumentTree([paragraph("Hello ", text("World", bold=True)), toc_block()])
+
+    assert tree.text() == "Hello World"
+    assert DocumentTree.block_data(tree.content[1]) == {"type": "toc"}
+
+    mention_tree = DocumentTree([paragraph(mention_user("user_1"))])
+    assert DocumentTree.mention_item(mention_tree.mentions[0]) == {"id": "user_1", "kind": "User"}
+
+
+def test_document_tree_empty_document():
+    """Test wrapping empty or content-less documents."""
+    assert len(DocumentTree({})) == 0
+    assert len(DocumentTree([])) == 0
+    assert DocumentTree({"type": "doc"}).headings == []
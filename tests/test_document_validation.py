@@ -0,0 +1,90 @@
+"""
+Tests for local validation of document node trees.
+"""
+
+import pytest
+
+from vaiz import validate_document
+from vaiz.api.base import VaizValidationError
+from vaiz.helpers import (
+    blockquote,
+    bullet_list,
+    code_block,
+    details,
+    details_content,
+    details_summary,
+    embed_block,
+    heading,
+    horizontal_rule,
+    link_text,
+    mention_user,
+    ordered_list,
+    paragraph,
+    table_from_rows,
+    task_item,
+    task_list,
+    text,
+)
+
+
+def test_helper_output_is_valid():
+    """Test that content built with the helpers passes validation."""
+    content = [
+        heading(1, "Report"),
+        paragraph("Hello ", text("world", bold=True), link_text("docs", "https://example.com"), mention_user("u1")),
+        bullet_list("a", "b"),
+        ordered_list("one", "two"),
+        task_list(task_item("done", checked=True), task_item("todo")),
+        blockquote(paragraph("quote")),
+        code_block("x = 1", language="python"),
+        horizontal_rule(),
+        details(details_summary("More"), details_content(paragraph("Hidden"))),
+        table_from_rows([("A-1", 3)], header=["SKU", "Qty"]),
+        embed_block("https://www.youtube.com/watch?v=dQw4w9WgXcQ"),
+    ]
+
+    assert validate_document(content) == []
+    assert validate_document({"type": "doc", "content": content}) == []
+
+
+def test_issues_have_precise_paths():
+    """Test that every kind of problem is reported with the path to the offending value."""
+    content = [
+        heading(7, "Title"),
+        bullet_list("a", paragraph("not a list item")),
+        {"type": "paragraph", "content": [{"type": "text", "text": "", "marks": [{"type": "strike"}]}]},
+        task_list({"type": "taskItem", "attrs": {}, "content": []}),
+        {"type": "widget"},
+        text("inline at top level"),
+        {"type": "paragraph", "content": [{"type": "text", "text": "x", "marks": [{"type": "link", "attrs": {}}]}]},
+    ]
+
+    issues = [tuple(issue) for issue in validate_document(content)]
+    assert issues == [
+        ("[0].attrs.level", "expected 1 | 2 | 3 | 4 | 5 | 6, got 7"),
+        ("[1].content[1]", "'paragraph' is not allowed here"),
+        ("[2].content[0].text", "text nodes cannot be empty"),
+        ("[2].content[0].marks[0]", "unknown type 'strike'"),
+        ("[3].content[0].attrs", "object is missing required 'checked'"),
+        ("[4]", "unknown type 'widget'"),
+        ("[5]", "'text' is not allowed here"),
+        ("[6].content[0].marks[0].attrs", "object is missing required 'href'"),
+    ]
+    assert len(validate_document(content, limit=2)) == 2
+
+    doc_issues = validate_document({"type": "doc", "content": [heading(7, "Title")]})
+    assert doc_issues[0].path == "content[0].attrs.level"
+
+
+def test_validate_rejects_before_sending(fake_client):
+    """Test that writes with validate=True raise without making a request."""
+    client, calls = fake_client()
+
+    with pytest.raises(VaizValidationError, match=r"\[0\]\.attrs\.level"):
+        client.replace_json_document("doc1", [heading(9, "Bad")], validate=True)
+    with pytest.raises(VaizValidationError):
+        client.append_json_document("doc1", [bullet_list(paragraph("bad"))], validate=True)
+    assert calls == []
+
+    client.replace_json_document("doc1", [heading(1, "Good")], validate=True)
+    assert calls == ["replaceJSONDocument"]
@@ -0,0 +1,106 @@
+"""
+Tests for skipping unchanged document writes.
+"""
+
+import json
+
+import pytest
+
+from vaiz.api.cache import DocumentFingerprintStore
+from vaiz.helpers import heading, paragraph
+
+
+def _content():
+    return [heading(1, "Status"), paragraph("All systems operational")]
+
+
+def test_identical_writes_are_skipped(fake_client):
+    """Test that re-rendered identical content is written only once."""
+    client, calls = fake_client(skip_unchanged_writes=True)
+
+    client.replace_json_document("doc_1", _content())
+    client.replace_json_document("doc_1", _content())
+    client.replace_markdown_document("doc_2", "# Status")
+    client.replace_markdown_document("doc_2", "# Status")
+
+    assert calls == ["replaceJSONDocument", "replaceMarkdownDocument"]
+
+
+def test_changed_content_and_force_are_written(fake_client):
+    """Test that changed content, force=True and other formats still write."""
+    client, calls = fake_client(skip_unchanged_writes=True)
+
+    client.replace_json_document("doc_1", _content())
+    client.replace_json_document("doc_1", _content() + [paragraph("Incident")])
+    client.replace_json_document("doc_1", _content())
+    client.replace_json_document("doc_1", _content(), force=True)
+    client.replace_markdown_document("doc_1", "# Status")
+
+    assert calls == ["replaceJSONDocument"] * 4 + ["replaceMarkdownDocument"]
+
+
+def test_appends_invalidate_fingerprint(fake_client):
+    """Test that appends make the next identical replace go through."""
+    client, calls = fake_client(skip_unchanged_writes=True)
+
+    client.replace_markdown_document("doc_1", "# Status")
+    client.append_markdown_document("doc_1", "More")
+    client.replace_markdown_document("doc_1", "# Status")
+
+    assert calls == ["replaceMarkdownDocument", "appendMarkdownDocument", "replaceMarkdownDocument"]
+
+
+def test_update_rewrites_content_changed_on_server(fake_client):
+    """Test that update_json_document replaces a drifted document even if this client wrote the same content."""
+    stored = {"type": "doc", "content": []}
+
+    def respond(endpoint, json_data):
+        if endpoint == "getJSONDocument":
+            return {"type": "GetJSONDocument", "payload": {"json": json.dumps(stored)}}
+        if endpoint == "replaceJSONDocument":
+            stored["content"] = json_data["content"]
+        return {}
+
+    content = _content()
+    client, calls = fake_client(respond, skip_unchanged_writes=True)
+    client.replace_json_document("doc_1", content)
+
+    stored["content"] = [paragraph("Edited by someone else")]
+    plan = client.update_json_document("doc_1", content)
+
+    assert plan.action == "replace"
+    assert calls == ["replaceJSONDocument", "getJSONDocument", "replaceJSONDocument"]
+    assert stored["content"] == content
+
+
+def test_dedup_disabled_by_default(fake_client):
+    """Test that clients write every time unless dedup is enabled."""
+    client, calls = fake_client()
+
+    client.replace_json_document("doc_1", _content())
+    client.replace_json_document("doc_1", _content())
+
+    assert calls == ["replaceJSONDocument", "replaceJSONDocument"]
+
+
+def test_fingerprints_are_bounded_and_persisted(fake_client, tmp_path):
+    """Test LRU bound and persistence across client instances."""
+    path = tmp_path / "state" / "fingerprints.json"
+    client, calls = fake_client(skip_unchanged_writes=True, fingerprint_limit=2, fingerprint_path=str(path))
+
+    for document_id in ("doc_1", "doc_2", "doc_3"):
+        client.replace_markdown_document(document_id, "# Status")
+    assert len(client._document_fingerprints) == 2
+
+    restarted, restarted_calls = fake_client(skip_unchanged_writes=True, fingerprint_limit=2, fingerprint_path=str(path))
+    for document_id in ("doc_3", "doc_2", "doc_1"):
+        restarted.replace_markdown_document(document_id, "# Status")
+
+    # doc_1 was evicted by the bound, the others were remembered on disk
+    assert restarted_calls == ["replaceMarkdownDocument"]
+
+
+def test_fingerprint_store_rejects_empty_bound():
+    """Test store validation."""
+    with pytest.raises(ValueError):
+        DocumentFingerprintStore(max_entries=0)
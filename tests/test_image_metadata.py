@@ -0,0 +1,155 @@
+"""
+Tests for client-side image metadata extraction.
+"""
+
+import io
+import json
+import struct
+import zlib
+
+import pytest
+from vaiz.helpers import image_block, read_image_info, estimate_dominant_color, ImageInfo
+
+
+def _png(width, height):
+    ihdr = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    chunk = struct.pack(">I", len(ihdr)) + b"IHDR" + ihdr + struct.pack(">I", zlib.crc32(b"IHDR" + ihdr))
+    return b"\x89PNG\r\n\x1a\n" + chunk
+
+
+def _jpeg(width, height):
+    # SOI, an APP0 segment to skip, then a baseline SOF0 frame header
+    app0 = b"\xff\xe0" + struct.pack(">H", 16) + b"JFIF\x00" + b"\x00" * 9
+    sof0 = b"\xff\xc0" + struct.pack(">HBHHB", 11, 8, height, width, 1) + b"\x01\x11\x00"
+    return b"\xff\xd8" + app0 + sof0 + b"\xff\xd9"
+
+
+def _gif(width, height):
+    return b"GIF89a" + struct.pack("<HH", width, height) + b"\x00" * 8
+
+
+def _webp_vp8x(width, height):
+    body = b"VP8X" + struct.pack("<I", 10) + b"\x00" * 4
+    body += (width - 1).to_bytes(3, "little") + (height - 1).to_bytes(3, "little")
+    return b"RIFF" + struct.pack("<I", len(body) + 4) + b"WEBP" + body
+
+
+def _webp_vp8l(width, height):
+    bits = (width - 1) | ((height - 1) << 14)
+    body = b"VP8L" + struct.pack("<I", 5) + b"\x2f" + struct.pack("<I", bits)
+    return b"RIFF" + struct.pack("<I", len(body) + 4) + b"WEBP" + body + b"\x00" * 8
+
+
+def _webp_vp8(width, height):
+    frame = b"\x00\x00\x00" + b"\x9d\x01\x2a" + struct.pack("<HH", width, height)
+    body = b"VP8 " + struct.pack("<I", len(frame)) + frame
+    return b"RIFF" + struct.pack("<I", len(body) + 4) + b"WEBP" + body
+
+
+@pytest.mark.parametrize("data, expected", [
+    (_png(800, 600), ImageInfo(800, 600, "image/png", "png")),
+    (_jpeg(1024, 768), ImageInfo(1024, 768, "image/jpeg", "jpg")),
+    (_gif(32, 16), ImageInfo(32, 16, "image/gif", "gif")),
+    (_webp_vp8x(4000, 3000), ImageInfo(4000, 3000, "image/webp", "webp")),
+    (_webp_vp8l(640, 480), ImageInfo(640, 480, "image/webp", "webp")),
+    (_webp_vp8(320, 240), ImageInfo(320, 240, "image/webp", "webp")),
+])
+def test_read_image_info_formats(data, expected):
+    """Test dimension and MIME detection for every supported format."""
+    assert read_image_info(data) == expected
+
+
+def test_read_image_info_sources(tmp_path):
+    """Test reading from paths and streams, preserving the stream position."""
+    path = tmp_path / "image.png"
+    path.write_bytes(_png(10, 20))
+    assert read_image_info(str(path)).dimensions == [10, 20]
+    assert read_image_info(path).dimensions == [10, 20]
+
+    stream = io.BytesIO(b"prefix" + _jpeg(5, 7))
+    stream.seek(6)
+    assert read_image_info(stream).dimensions == [5, 7]
+    assert stream.tell() == 6
+
+
+def test_read_image_info_unknown_or_truncated():
+    """Test that unsupported or broken headers return None."""
+    assert read_image_info(b"not an image at all") is None
+    assert read_image_info(b"") is None
+    assert read_image_info(_jpeg(10, 10)[:8]) is None
+
+
+def test_image_info_aspect_ratio():
+    """Test aspect ratio helper."""
+    assert ImageInfo(800, 400, "image/png", "png").aspect_ratio == 2.0
+    assert ImageInfo(800, 0, "image/png", "png").aspect_ratio is None
+
+
+class MockUploadedFile:
+    """Uploaded file without server-side image metadata."""
+    def __init__(self):
+        self.id = "file_id"
+        self.url = "http://example.com/photo.bin"
+        self.name = "photo.bin"
+        self.size = 100
+        self.ext = "bin"
+        self.mime = None
+        self.dimension = []
+        self.dominant_color = {}
+
+
+def test_image_block_reads_missing_metadata_from_source():
+    """Test image_block fills dimensions and MIME type from a local source."""
+    result = image_block(file=MockUploadedFile(), source=_png(800, 400))
+    image_data = json.loads(result["content"][0]["text"])
+
+    assert image_data["dimensions"] == [800, 400]
+    assert image_data["aspectRatio"] == 2.0
+    assert image_data["fileType"] == "image/png"
+
+
+def test_image_block_prefers_server_metadata():
+    """Test that server-provided metadata is not overridden by the source."""
+    mock_file = MockUploadedFile()
+    mock_file.dimension = [100, 50]
+    mock_file.mime = "image/jpeg"
+
+    result = image_block(file=mock_file, source=_png(800, 400))
+    image_data = json.loads(result["content"][0]["text"])
+
+    assert image_data["dimensions"] == [100, 50]
+    assert image_data["fileType"] == "image/jpeg"
+
+
+def test_estimate_dominant_color():
+    """Test dominant color estimation (requires optional Pillow)."""
+    Image = pytest.importorskip("PIL.Image")
+    buffer = io.BytesIO()
+    Image.new("RGB", (64, 64), (200, 20, 20)).save(buffer, format="PNG")
+
+    color = estimate_dominant_color(buffer.getvalue())
+    assert color == {"color": "#c81414", "isDark": True}
+
+
+def test_upload_response_filled_from_local_header(tmp_path):
+    """Test that upload responses without image metadata are completed locally."""
+    from vaiz import VaizClient
+    from vaiz.models import UploadFileResponse
+
+    path = tmp_path / "diagram.gif"
+    path.write_bytes(_gif(300, 150))
+    response = UploadFileResponse(**{
+        "type": "UploadFile",
+        "payload": {"file": {
+            "_id": "file_id", "date": "2025-01-01T00:00:00Z", "owner": "owner_id",
+            "url": "http://example.com/diagram.gif", "name": "diagram.gif",
+            "type": "Image", "ext": "gif", "size": 100, "originalName": "diagram.gif",
+            "accessKind": "Space", "accessKindId": "space_id",
+        }},
+    })
+
+    client = VaizClient(api_key="key", space_id="space")
+    client._fill_image_metadata(response, str(path))
+
+    assert response.file.dimension == [300, 150]
+    assert response.file.mime == "image/gif"
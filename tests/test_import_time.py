@@ -0,0 +1,79 @@
+"""
+Tests for lazy package imports and deferred model schemas.
+
+Each check runs in a fresh interpreter so earlier imports in the test session
+do not hide what ``import vaiz`` loads on its own.
+"""
+
+import os
+import subprocess
+import sys
+import textwrap
+
+import vaiz
+import vaiz.helpers
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _run(code: str) -> str:
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [ROOT, os.environ.get("PYTHONPATH")])))
+    result = subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(code)], cwd=ROOT, env=env,
+        capture_output=True, text=True, check=True,
+    )
+    return result.stdout.strip()
+
+
+def test_import_vaiz_loads_nothing_heavy():
+    """Test that `import vaiz` defers the client, models, helpers and their dependencies."""
+    output = _run("""
+        import sys
+        import vaiz
+        heavy = ["requests", "pydantic", "vaiz.client", "vaiz.models", "vaiz.helpers.document_structure"]
+        print(",".join(name for name in heavy if name in sys.modules) or "-")
+        vaiz.paragraph("x")
+        print("vaiz.helpers.custom_fields" in sys.modules, "vaiz.models" in sys.modules)
+        from vaiz.models import Task
+        print(Task.__pydantic_complete__)
+    """)
+    assert output.splitlines() == ["-", "False False", "False"]
+
+
+def test_lazy_names_resolve():
+    """Test that every exported name resolves and is listed by dir()."""
+    for module in (vaiz, vaiz.helpers):
+        assert set(module.__all__) <= set(dir(module))
+        for name in module.__all__:
+            assert getattr(module, name) is not None, name
+    assert vaiz.VaizClient.__module__ == "vaiz.client"
+    assert isinstance(vaiz.__version__, str)
+    try:
+        vaiz.not_a_name
+    except AttributeError as e:
+        assert "not_a_name" in str(e)
+    else:
+        raise AssertionError("expected AttributeError")
+
+
+def test_import_time_benchmark():
+    """Report `import vaiz` against importing every public name (best of 3 runs).
+
+    Timings depend on the machine and its load, so they are printed, not asserted.
+    """
+    output = _run("""
+        import subprocess, sys, time
+
+        def best(statement):
+            times = []
+            for _ in range(3):
+                start = time.perf_counter()
+                subprocess.run([sys.executable, "-c", statement], check=True)
+                times.append(time.perf_counter() - start)
+            return min(times)
+
+        baseline = best("pass")
+        print(best("import vaiz") - baseline, best("from vaiz import *") - baseline)
+    """)
+    lazy, eager = (float(value) for value in output.split())
+    print(f"import vaiz: {lazy * 1000:.1f} ms, from vaiz import *: {eager * 1000:.1f} ms")
@@ -0,0 +1,148 @@
+"""
+Tests for the offline Markdown <-> document JSON converter.
+"""
+
+import io
+
+import pytest
+
+from vaiz.helpers import (
+    heading,
+    paragraph,
+    text,
+    bullet_list,
+    list_item,
+    task_list,
+    task_item,
+    code_block,
+    table,
+    table_row,
+    table_header,
+    table_cell,
+    mention_user,
+    toc_block,
+    canonical_json,
+    markdown_to_nodes,
+    iter_markdown_nodes,
+    nodes_to_markdown,
+)
+
+
+SAMPLE = """# Release notes
+
+Some *italic*, **bold**, `code` and [a **link**](https://vaiz.com) in snake_case_text.
+
+- Faster sync
+- Better docs
+  - Nested item
+
+- [x] Ship it
+- [ ] Celebrate
+
+| Name | Status |
+| --- | --- |
+| Sync | Done |
+| Docs | In \\| progress |
+
+```python
+print("hi")
+```
+
+> Quoted *text*
+
+---
+
+<details>
+<summary>More</summary>
+
+Hidden **content**
+
+</details>"""
+
+
+def test_markdown_to_nodes_block_types():
+    """Test that each Markdown block maps to the matching builder node."""
+    nodes = markdown_to_nodes(SAMPLE)
+    assert [node["type"] for node in nodes] == [
+        "heading", "paragraph", "bulletList", "taskList", "extension-table",
+        "codeBlock", "blockquote", "horizontalRule", "details",
+    ]
+    assert nodes[0]["attrs"]["level"] == 1
+    assert nodes[2]["content"][1]["content"][1]["type"] == "bulletList"
+    assert [item["attrs"]["checked"] for item in nodes[3]["content"]] == [True, False]
+    assert nodes[5]["attrs"]["language"] == "python"
+    assert nodes[5]["content"][0]["text"] == 'print("hi")'
+
+
+def test_markdown_to_nodes_matches_builders():
+    """Test that parsed nodes equal hand-built nodes apart from generated uids."""
+    md = (
+        "## Plan\n\n"
+        "Status: **green**\n\n"
+        "- One\n- Two\n\n"
+        "- [x] Done\n\n"
+        "| A | B |\n|---|---|\n| 1 | 2 |\n\n"
+        "```\ncode\n```"
+    )
+    expected = [
+        heading(2, "Plan"),
+        paragraph("Status: ", text("green", bold=True)),
+        bullet_list(list_item(paragraph("One")), list_item(paragraph("Two"))),
+        task_list(task_item(paragraph("Done"), checked=True)),
+        table(
+            table_row(table_header(paragraph("A")), table_header(paragraph("B"))),
+            table_row(table_cell(paragraph("1")), table_cell(paragraph("2"))),
+        ),
+        code_block(code="code"),
+    ]
+    assert canonical_json(markdown_to_nodes(md)) == canonical_json(expected)
+
+
+def test_inline_formatting():
+    """Test emphasis, code spans, links, escapes and intraword underscores."""
+    [node] = markdown_to_nodes("***both*** **a *b*** [x](<https://a.b/c d>) \\*lit\\* snake_case `a*b`")
+    content = node["content"]
+    assert content[0] == text("both", bold=True, italic=True)
+    assert text("b", bold=True, italic=True) in content
+    assert text("x", link="https://a.b/c d") in content
+    plain = "".join(item["text"] for item in content if "marks" not in item)
+    assert "*lit*" in plain and "snake_case" in plain
+    assert content[-1] == text("a*b", code=True)
+
+
+@pytest.mark.parametrize("unit", ["*a ", "**a ", "***a ", "_a ", "[a ", "[a](", "[a](<"])
+def test_unmatched_delimiters_stay_literal(unit):
+    """Test that unmatched delimiters are kept as text without rescanning the line for each one."""
+    line = (unit * 20000).strip()
+
+    [node] = markdown_to_nodes(line)
+
+    assert node["content"] == [text(line)]
+
+
+def test_round_trip():
+    """Test that Markdown -> nodes -> Markdown -> nodes is stable."""
+    nodes = markdown_to_nodes(SAMPLE)
+    rendered = nodes_to_markdown(nodes)
+    assert rendered == SAMPLE
+    assert canonical_json(markdown_to_nodes(rendered)) == canonical_json(nodes)
+
+
+def test_nodes_to_markdown_custom_blocks():
+    """Test rendering of nodes without a Markdown equivalent."""
+    document = {"type": "doc", "content": [
+        toc_block(),
+        paragraph("Owner: ", mention_user("member_1")),
+        paragraph("1. not a list"),
+    ]}
+    assert nodes_to_markdown(document) == "Owner: @User:member_1\n\n1\\. not a list"
+
+
+def test_iter_markdown_nodes_streams_lines():
+    """Test converting a file-like object lazily, one top-level node at a time."""
+    source = io.StringIO("# A\n\npara\n\n- item\n")
+    nodes = iter_markdown_nodes(source)
+    assert next(nodes)["type"] == "heading"
+    # The rest of the input has not been consumed yet
+    assert source.tell() < len(source.getvalue())
+    assert [node["type"] for node in nodes] == ["paragraph", "bulletList"]
@@ -0,0 +1,84 @@
+"""
+Tests for mention extraction and the backlink index.
+"""
+
+import json
+
+from vaiz import MentionIndex, extract_mentions
+from vaiz.helpers import heading, mention_document, mention_task, mention_user, paragraph
+from vaiz.models.enums import Kind
+
+
+def _document(doc_id, updated):
+    return {
+        "_id": doc_id, "title": doc_id.title(), "size": 0, "kindId": "project_1", "kind": "Project",
+        "creator": "member_1", "createdAt": "2026-01-01T00:00:00Z", "updatedAt": updated,
+        "bucket": "bucket_1",
+    }
+
+
+def test_extract_mentions_in_order_without_duplicates():
+    """Test that nested mentions are found once, in document order."""
+    content = [
+        heading(1, "Plan"),
+        paragraph("Owner ", mention_user("user_1"), " for ", mention_task("task_1")),
+        paragraph(mention_task("task_1"), mention_document("doc_9")),
+    ]
+    assert extract_mentions({"type": "doc", "content": content}) == [
+        {"id": "user_1", "kind": "User"},
+        {"id": "task_1", "kind": "Task"},
+        {"id": "doc_9", "kind": "Document"},
+    ]
+    assert extract_mentions([paragraph("no mentions")]) == []
+
+
+def test_index_backlinks_and_persistence(tmp_path):
+    """Test forward and reverse lookups, updates and reload from disk."""
+    path = str(tmp_path / "mentions.json")
+    index = MentionIndex(path=path)
+    index.update("doc_1", [{"id": "task_1", "kind": "Task"}, {"id": "user_1", "kind": "User"}], "v1")
+    index.update("doc_2", [{"id": "task_1", "kind": "Task"}], "v1")
+
+    assert index.get_backlinks("task_1") == ["doc_1", "doc_2"]
+    assert index.get_backlinks("task_1", kind="User") == []
+
+    index.update("doc_1", [{"id": "user_1", "kind": "User"}], "v2")
+    assert index.get_backlinks("task_1") == ["doc_2"]
+    index.save()
+
+    reloaded = MentionIndex(path=path)
+    assert reloaded.get_mentions("doc_1") == [{"id": "user_1", "kind": "User"}]
+    assert reloaded.get_version("doc_1") == "v2"
+    assert reloaded.get_backlinks("task_1", kind="Task") == ["doc_2"]
+
+
+def test_refresh_fetches_only_changed_documents(fake_client):
+    """Test that refresh_mention_index only refetches documents whose updatedAt changed."""
+    updated = {"a": "2026-01-01T00:00:00Z", "b": "2026-01-01T00:00:00Z"}
+    content = {"a": [paragraph(mention_task("task_1"))], "b": [paragraph("nothing")]}
+    fetched = []
+
+    def respond(endpoint, json_data):
+        if endpoint == "getDocuments":
+            ids = ["a", "b"] if json_data["kindId"] == "project_1" else []
+            return {"payload": {"documents": [_document(i, updated[i]) for i in ids]}, "type": "GetDocuments"}
+        if endpoint == "getJSONDocument":
+            fetched.append(json_data["documentId"])
+            return {"payload": {"json": json.dumps({"type": "doc", "content": content[json_data["documentId"]]})}}
+        raise AssertionError(endpoint)
+
+    client, _ = fake_client(respond)
+    index = MentionIndex()
+
+    result = client.refresh_mention_index(index, Kind.Project, "project_1")
+    assert sorted(result.updated) == ["a", "b"]
+    assert index.get_backlinks("task_1") == ["a"]
+
+    fetched.clear()
+    updated["b"] = "2026-02-01T00:00:00Z"
+    content["b"] = [paragraph(mention_task("task_1"))]
+    result = client.refresh_mention_index(index, Kind.Project, "project_1")
+
+    assert fetched == ["b"]
+    assert result.unchanged == ["a"]
+    assert index.get_backlinks("task_1", kind="Task") == ["a", "b"]
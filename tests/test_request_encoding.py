@@ -0,0 +1,74 @@
+"""
+Tests for single-pass request encoding.
+"""
+
+import hashlib
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from vaiz import VaizClient
+from vaiz.api import encoding
+from vaiz.api.encoding import EncodedJSON, encode_json
+from vaiz.models import GetTasksRequest
+
+
+PAYLOAD = {"b": [1, 2.5, None, True], "a": "Zürich ✓", "when": datetime(2025, 3, 1, 12, 0, tzinfo=timezone.utc)}
+
+
+@pytest.mark.parametrize("use_orjson", [False, True], ids=["json", "orjson"])
+def test_encode_json_is_canonical(monkeypatch, use_orjson):
+    """Test that both encoders produce the same compact, sorted UTF-8 JSON."""
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(encoding, "orjson", None)
+
+    body = encode_json(PAYLOAD)
+    assert body == '{"a":"Zürich ✓","b":[1,2.5,null,true],"when":"2025-03-01T12:00:00+00:00"}'.encode("utf-8")
+    assert encode_json({"n": 2 ** 70}) == b'{"n":1180591620717411303424}'
+    with pytest.raises(TypeError):
+        encode_json({"x": object()})
+
+
+def test_make_request_sends_encoded_body(monkeypatch, capsys):
+    """Test that the body is sent as-is and EncodedJSON payloads are not encoded again."""
+    client = VaizClient(api_key="key", space_id="space", verbose=True)
+    sent = []
+
+    class FakeResponse:
+        content = b'{"payload": {}}'
+
+    def fake_request(method, url, data=None, headers=None, verify=True):
+        sent.append((data, headers))
+        return FakeResponse()
+
+    monkeypatch.setattr(client.session, "request", fake_request)
+    payload = EncodedJSON({"documentId": "d1", "content": []})
+    client._make_request("replaceJSONDocument", json_data=payload)
+    client._make_request("getProfile", json_data={"z": 1, "a": 2})
+
+    assert sent[0] == (payload.body, {"Content-Type": "application/json"})
+    assert sent[0][0] is payload.body
+    assert sent[1][0] == b'{"a":2,"z":1}'
+    assert 'Request payload: {"content":[],"documentId":"d1"}' in capsys.readouterr().out
+
+
+def test_get_tasks_reuses_body_for_cache_key(fake_client):
+    """Test that the cache key is derived from the exact bytes sent to the server."""
+    payloads = []
+
+    def respond(endpoint, json_data):
+        payloads.append(json_data)
+        return {"type": "GetTasks", "payload": {"tasks": []}}
+
+    client, _ = fake_client(respond)
+    request = GetTasksRequest(board="b1", limit=10)
+    client.get_tasks(request)
+    client.get_tasks(GetTasksRequest(board="b1", limit=10))
+
+    [payload] = payloads
+    assert isinstance(payload, EncodedJSON) and payload["board"] == "b1"
+    assert json.loads(payload.body) == request.model_dump(by_alias=True)
+    assert client._get_cache_key(request) == hashlib.md5(b"space:" + payload.body).hexdigest()
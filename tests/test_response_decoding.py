@@ -0,0 +1,64 @@
+"""
+Tests for pluggable response decoding.
+"""
+
+import json
+
+import pytest
+
+from vaiz import VaizClient
+from vaiz.api.base import VaizSDKError
+from vaiz.api.encoding import get_json_decoder
+
+
+DOCUMENT = {"type": "doc", "content": [{"type": "paragraph", "content": [{"type": "text", "text": "Zürich ✓"}]}]}
+
+
+def _decoders():
+    names = ["json"]
+    for name in ("orjson", "msgspec"):
+        try:
+            __import__(name)
+            names.append(name)
+        except ImportError:
+            pass
+    return names
+
+
+@pytest.mark.parametrize("name", _decoders())
+def test_decoders_agree(name):
+    """Test that every decoder reads bytes and str and accepts what json accepts."""
+    decode = get_json_decoder(name)
+    body = json.dumps({"payload": {"json": json.dumps(DOCUMENT)}, "n": 2 ** 70, "x": float("nan")}).encode("utf-8")
+
+    data = decode(body)
+    assert decode(data["payload"]["json"]) == DOCUMENT
+    assert data["n"] == 2 ** 70 and data["x"] != data["x"]
+    with pytest.raises(ValueError):
+        decode(b"{not json")
+
+
+def test_client_decodes_response_bytes(monkeypatch):
+    """Test that responses and embedded document JSON go through the configured decoder."""
+    calls = []
+
+    def decoder(data):
+        calls.append(type(data))
+        return json.loads(data)
+
+    client = VaizClient(api_key="key", space_id="space", json_decoder=decoder)
+    bodies = [json.dumps({"payload": {"json": json.dumps(DOCUMENT)}}).encode("utf-8"), b"<html>Bad gateway</html>"]
+
+    class FakeResponse:
+        def __init__(self, content):
+            self.content = content
+
+    monkeypatch.setattr(client.session, "request", lambda *args, **kwargs: FakeResponse(bodies.pop(0)))
+
+    assert client.get_json_document("d1") == DOCUMENT
+    assert calls == [bytes, str]
+    with pytest.raises(VaizSDKError, match="Invalid JSON in response"):
+        client.get_json_document("d2")
+
+    with pytest.raises(ValueError, match="json_decoder"):
+        VaizClient(api_key="key", space_id="space", json_decoder="simdjson")
@@ -0,0 +1,83 @@
+"""
+Tests for the local full-text search index.
+"""
+
+import time
+
+from vaiz import SearchIndex
+from vaiz.helpers import heading, paragraph
+
+
+def _task(task_id, name, hrid):
+    return {"_id": task_id, "name": name, "hrid": hrid}
+
+
+def test_search_tasks_and_documents():
+    """Test tokenization, AND queries, prefix matching and ranking."""
+    index = SearchIndex()
+    index.add_tasks([
+        _task("t1", "Fix login bug", "PRJ-1"),
+        _task("t2", "Deployment pipeline", "PRJ-2"),
+        _task("t3", "Login page redesign", "PRJ-3"),
+    ])
+    index.add_document("d1", [heading(1, "Runbook"), paragraph("Restart the deployment if login fails")], title="Ops")
+
+    assert [hit.id for hit in index.search("login")] == ["t1", "t3", "d1"]
+    assert [hit.id for hit in index.search("deplo pip")] == ["t2"]
+    assert index.search("deplo", prefix=False) == []
+    assert [hit.id for hit in index.search("LOGIN", kind="document")] == ["d1"]
+    assert [hit.id for hit in index.search("prj-3")] == ["t3"]
+    assert index.search("login missing") == []
+    assert index.search("") == []
+
+
+def test_incremental_updates():
+    """Test that re-indexing and removal only keep current tokens."""
+    index = SearchIndex()
+    index.add_document("d1", "alpha beta", title="Notes")
+    index.add_document("d1", "gamma")
+    assert index.search("alpha") == []
+    assert [hit.title for hit in index.search("gamma")] == ["Notes"]
+
+    index.append_document("d1", "delta")
+    assert [hit.id for hit in index.search("gam del")] == ["d1"]
+
+    assert index.remove("document", "d1")
+    assert index.search("notes") == [] and len(index) == 0
+
+
+def test_client_keeps_index_up_to_date(fake_client):
+    """Test that fetched and written content is indexed through the client."""
+    index = SearchIndex()
+
+    def respond(endpoint, json_data):
+        if endpoint == "getMarkdownDocument":
+            return {"payload": {"markdown": "# Quarterly roadmap"}, "type": "GetMarkdownDocument"}
+        return {}
+
+    client, _ = fake_client(respond, search_index=index)
+
+    client.get_markdown_document("d1")
+    assert [hit.id for hit in index.search("roadmap")] == ["d1"]
+
+    client.replace_json_document("d1", [paragraph("Budget review")])
+    assert index.search("roadmap") == []
+    client.append_markdown_document("d1", "Hiring plan")
+    assert [hit.id for hit in index.search("budget hiring")] == ["d1"]
+
+
+def test_search_large_index_is_fast():
+    """Test that a 100k-task index answers queries quickly."""
+    words = ["alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf", "hotel"]
+    index = SearchIndex()
+    index.add_tasks(
+        _task(f"t{i}", f"{words[i % 8]} {words[(i // 8) % 8]} item {i}", f"PRJ-{i}")
+        for i in range(100_000)
+    )
+
+    start = time.perf_counter()
+    hits = index.search("alpha bravo 4", limit=10)
+    elapsed = time.perf_counter() - start
+
+    assert hits and all("alpha" in hit.title and "bravo" in hit.title for hit in hits)
+    assert elapsed < 1.0
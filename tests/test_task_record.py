@@ -0,0 +1,49 @@
+"""
+Tests for memory-compact TaskRecord objects.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from vaiz import TaskRecord, TaskView
+from vaiz.models import Task, from_epoch_millis, to_epoch_millis
+
+
+def _task(i, board="board-1"):
+    return {
+        "_id": f"t{i}", "name": f"Task {i}", "group": "g", "board": board, "project": "p",
+        "priority": 2, "hrid": f"PRJ-{i}", "followers": {"u1": "creator"}, "completed": True,
+        "creator": "u1", "assignees": ["u1", "u2"], "createdAt": "2025-01-01T10:00:00.123Z",
+        "updatedAt": "2025-01-02T10:00:00.000Z", "completedAt": "2025-01-03T00:00:00.000Z",
+        "document": "d", "customFields": [{"id": "c", "value": ["a"]}], "leftConnectors": ["t0"],
+    }
+
+
+def test_record_round_trips_task():
+    """Test that records built from dicts, models and views agree and convert back to Task."""
+    task = Task(**_task(1))
+    record = TaskRecord.from_dict(_task(1))
+    assert record == TaskRecord.from_task(task) == TaskRecord.from_task(TaskView(_task(1)))
+
+    assert record.created_at == 1735725600123
+    assert record.due_end is None
+    assert record.assignees == ("u1", "u2") and record.blockers == ("t0",)
+    assert record.followers == (("u1", "creator"),)
+    assert record.to_task() == task
+
+    with pytest.raises(AttributeError):
+        record.extra = 1
+
+
+def test_records_share_repeated_ids():
+    """Test that repeated ids are interned and timestamps convert both ways."""
+    board = "".join(["board-", "shared"])  # built at runtime, so not interned by the compiler
+    first = TaskRecord.from_dict(_task(1, board=board))
+    second = TaskRecord.from_dict(_task(2, board="".join(["board-", "shared"])))
+    assert first.board is second.board
+
+    moment = datetime(2025, 3, 1, 12, 30, 15, 250000, tzinfo=timezone.utc)
+    assert from_epoch_millis(to_epoch_millis(moment)) == moment
+    assert to_epoch_millis("2025-03-01T12:30:15.250Z") == to_epoch_millis(moment)
+    assert to_epoch_millis(moment.replace(tzinfo=None)) == to_epoch_millis(moment)
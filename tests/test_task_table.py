@@ -0,0 +1,89 @@
+"""
+Tests for the columnar TaskTable.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from vaiz import TaskRecord, TaskTable, TaskView
+from vaiz.helpers.task_table import MISSING
+from vaiz.models import Task, TaskPriority
+
+
+def _task(i, board, priority, completed=False, due_end=None, assignees=()):
+    return {
+        "_id": f"t{i}", "name": f"Task {i}", "group": "g", "board": board, "project": "p",
+        "priority": priority, "hrid": f"PRJ-{i}", "followers": {}, "completed": completed,
+        "creator": "u1", "assignees": list(assignees), "dueEnd": due_end,
+        "createdAt": f"2025-01-0{i + 1}T10:00:00.000Z", "updatedAt": "2025-01-10T10:00:00.000Z",
+        "document": "d",
+    }
+
+
+TASKS = [
+    _task(0, "b1", 3, due_end="2025-02-01T00:00:00.000Z", assignees=["u1", "u2"]),
+    _task(1, "b2", 1, completed=True, due_end="2025-01-15T00:00:00.000Z", assignees=["u2"]),
+    _task(2, "b1", 1, due_end="2025-03-01T00:00:00.000Z"),
+    _task(3, "b2", 2, assignees=["u3"]),
+]
+
+
+@pytest.fixture(params=[False, True], ids=["array", "numpy"])
+def use_numpy(request):
+    if request.param:
+        pytest.importorskip("numpy")
+    return request.param
+
+
+def test_filters_and_counts(use_numpy):
+    """Test vectorized filters and per-value counts on both backends."""
+    inputs = [TASKS[0], Task(**TASKS[1]), TaskView(TASKS[2]), TaskRecord.from_dict(TASKS[3])]
+    table = TaskTable.from_tasks(inputs, use_numpy=use_numpy)
+
+    assert len(table) == 4
+    assert table.filter(board="b1").ids == ["t0", "t2"]
+    assert table.filter(priority=[TaskPriority.General, 3], completed=False).ids == ["t0", "t2"]
+    assert table.filter(assignee="u2").ids == ["t0", "t1"]
+    assert table.filter(assignee=["u3"], board="b2").ids == ["t3"]
+
+    now = datetime(2025, 2, 15, tzinfo=timezone.utc)
+    assert table.overdue(now).ids == ["t0"]
+    assert table.filter(due_after="2025-01-20T00:00:00Z").ids == ["t0", "t2"]
+
+    assert table.count_by("board") == {"b1": 2, "b2": 2}
+    assert table.count_by("completed") == {False: 3, True: 1}
+    assert table.count_by("assignees") == {"u1": 1, "u2": 2, "u3": 1}
+    assert table.filter(board="b2").count_by("assignees") == {"u2": 1, "u3": 1}
+
+
+def test_sort_and_group(use_numpy):
+    """Test stable sorts with missing timestamps last and group-bys."""
+    table = TaskTable.from_tasks(TASKS, use_numpy=use_numpy)
+
+    assert table.sort_by("due_end").ids == ["t1", "t0", "t2", "t3"]
+    assert table.sort_by("due_end", descending=True).ids == ["t2", "t0", "t1", "t3"]
+    assert table.sort_by("priority", descending=True).ids == ["t0", "t3", "t1", "t2"]
+    assert table.sort_by("board").ids == ["t0", "t2", "t1", "t3"]
+
+    groups = table.group_by("priority")
+    assert {key: group.ids for key, group in groups.items()} == {3: ["t0"], 1: ["t1", "t2"], 2: ["t3"]}
+    assert groups[1].count_by("assignees") == {"u2": 1}
+    assert list(table.column("due_end"))[3] == MISSING
+
+
+def test_numpy_matches_array_backend_with_unassigned_tail():
+    """Test that both backends agree when the last tasks have no assignees."""
+    pytest.importorskip("numpy")
+    tasks = [
+        _task(i, f"b{i % 2}", i % 4, assignees=[["u1"], ["u2", "u1"], [], ["u3"]][i % 4] if i < 6 else [])
+        for i in range(9)
+    ]
+    tables = [TaskTable.from_tasks(tasks, use_numpy=flag) for flag in (False, True)]
+
+    for members in ("u1", ["u2", "u3"], "nobody"):
+        array_ids, numpy_ids = (table.filter(assignee=members).ids for table in tables)
+        assert array_ids == numpy_ids
+    assert tables[0].filter(assignee="u1").ids == ["t0", "t1", "t4", "t5"]
+    assert tables[1].filter(board="b1").filter(assignee="u3").ids == ["t3"]
+    assert tables[0].count_by("assignees") == tables[1].count_by("assignees")
@@ -0,0 +1,66 @@
+"""
+Tests for lazy TaskView objects and task iteration.
+"""
+
+from datetime import datetime, timezone
+
+from vaiz import TaskView
+from vaiz.models import GetTasksRequest, Task
+from vaiz.models.base import TaskPriority
+
+
+def _task(i):
+    return {
+        "_id": f"t{i}", "name": f"Task {i}", "group": "g", "board": "b", "project": "p",
+        "priority": 3, "hrid": f"PRJ-{i}", "followers": {"u": "creator"}, "completed": False,
+        "creator": "u", "assignees": ["u1"], "createdAt": "2025-01-01T10:00:00.000Z",
+        "updatedAt": "2025-01-02T10:00:00.000Z", "dueEnd": "2025-02-01T00:00:00.000Z", "document": "d",
+        "customFields": [{"id": "c", "value": "v"}],
+    }
+
+
+def test_task_view_converts_on_first_access():
+    """Test that fields are converted lazily, memoized and match the Task model."""
+    view = TaskView(_task(1))
+    assert view.__dict__ == {}
+
+    assert view.id == "t1"
+    assert view.due_end == datetime(2025, 2, 1, tzinfo=timezone.utc)
+    assert view.priority is TaskPriority.High
+    assert set(view.__dict__) == {"id", "due_end", "priority"}
+    assert view.custom_fields is view.custom_fields
+
+    # Missing optional fields fall back to the model defaults
+    assert view.subtasks == [] and view.archived_at is None
+    model = view.to_model()
+    assert isinstance(model, Task)
+    assert model == Task(**_task(1))
+    for name in Task.model_fields:
+        assert getattr(view, name) == getattr(model, name)
+
+
+def test_get_task_views_and_iter_tasks(fake_client):
+    """Test that views share the getTasks cache logic and iteration follows pages."""
+    all_tasks = [_task(i) for i in range(5)]
+    requests = []
+
+    def respond(endpoint, json_data):
+        assert endpoint == "getTasks"
+        requests.append((json_data["skip"], json_data["limit"]))
+        page = all_tasks[json_data["skip"]:json_data["skip"] + json_data["limit"]]
+        return {"type": "GetTasks", "payload": {"tasks": page}}
+
+    client, _ = fake_client(respond)
+
+    views = client.get_task_views(GetTasksRequest(limit=2))
+    assert [view.id for view in views] == ["t0", "t1"]
+    assert client.get_task_views(GetTasksRequest(limit=2)) is views
+    assert requests == [(0, 2)]
+
+    ids = [view.id for view in client.iter_tasks(GetTasksRequest(limit=2), views=True)]
+    assert ids == ["t0", "t1", "t2", "t3", "t4"]
+    assert requests == [(0, 2), (2, 2), (4, 2)]
+
+    tasks = list(client.iter_tasks(GetTasksRequest(limit=2)))
+    assert all(isinstance(task, Task) for task in tasks)
+    assert [task.id for task in tasks] == ids
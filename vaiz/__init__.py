@@ -1,314 +1,237 @@
-from importlib import metadata
+from typing import TYPE_CHECKING
 
-try:
-    __version__ = metadata.version("vaiz-sdk")
-except metadata.PackageNotFoundError:
-    __version__ = "0.0.0"
+from ._lazy import attach
 
-from .client import VaizClient
-from .models import (
-    TaskFollower,
-    TaskPriority,
-    CustomField,
-    CreateTaskRequest,
-    EditTaskRequest,
-    Task,
-    TaskResponse,
-    BoardResponse,
-    BoardsResponse,
-    CreateBoardTypeRequest,
-    CreateBoardTypeResponse,
-    EditBoardTypeRequest,
-    EditBoardTypeResponse,
-    Profile,
-    ProfileResponse,
-    Project,
-    ProjectsResponse,
-    ProjectResponse,
-    Milestone,
-    MilestonesResponse,
-    CreateMilestoneRequest,
-    CreateMilestoneResponse,
-    GetMilestoneResponse,
-    EditMilestoneRequest,
-    EditMilestoneResponse,
-    ToggleMilestoneRequest,
-    ToggleMilestoneResponse,
-    UploadedFile,
-    UploadFileResponse,
-    Document,
-    ReplaceDocumentRequest,
-    ReplaceDocumentResponse,
-    ReplaceJSONDocumentRequest,
-    ReplaceJSONDocumentResponse,
-    AppendDocumentRequest,
-    AppendDocumentResponse,
-    AppendJSONDocumentRequest,
-    AppendJSONDocumentResponse,
-    ReplaceMarkdownDocumentRequest,
-    ReplaceMarkdownDocumentResponse,
-    AppendMarkdownDocumentRequest,
-    AppendMarkdownDocumentResponse,
-    GetMarkdownDocumentRequest,
-    GetMarkdownDocumentResponse,
-    GetDocumentsRequest,
-    GetDocumentsResponse,
-    CreateDocumentRequest,
-    CreateDocumentResponse,
-    EditDocumentRequest,
-    EditDocumentResponse,
-    Comment,
-    CommentReaction,
-    PostCommentRequest,
-    PostCommentResponse,
-    ReactToCommentRequest,
-    ReactToCommentResponse,
-    GetCommentsRequest,
-    GetCommentsResponse,
-    EditCommentRequest,
-    EditCommentResponse,
-    DeleteCommentRequest,
-    DeleteCommentResponse,
-    CommentReactionType,
-    COMMENT_REACTION_METADATA,
-    Space,
-    GetSpaceResponse,
-    Member,
-    GetSpaceMembersResponse,
-    AvatarMode,
-    ColorInfo,
-    Kind,
-    MoveTaskItem,
-    MoveTasksRequest,
-    MoveTasksResponse,
-)
-
-# Import helper functions for convenient usage
-from .helpers import (
-    # Field creation helpers
-    make_text_field,
-    make_number_field,
-    make_checkbox_field,
-    make_date_field,
-    make_member_field,
-    make_task_relations_field,
-    make_select_field,
-    make_url_field,
+# Public names are imported from their submodules on first access, so
+# `import vaiz` stays cheap for short-lived processes (CLIs, serverless
+# functions); only the parts of the SDK that are used get loaded.
+_EXPORTS = {
+    '.client': ['VaizClient'],
+    '.models': [
+        'TaskFollower',
+        'TaskPriority',
+        'CustomField',
+        'CreateTaskRequest',
+        'EditTaskRequest',
+        'Task',
+        'TaskView',
+        'TaskRecord',
+        'TaskResponse',
+        'BoardResponse',
+        'BoardsResponse',
+        'CreateBoardTypeRequest',
+        'CreateBoardTypeResponse',
+        'EditBoardTypeRequest',
+        'EditBoardTypeResponse',
+        'Profile',
+        'ProfileResponse',
+        'Project',
+        'ProjectsResponse',
+        'ProjectResponse',
+        'Milestone',
+        'MilestonesResponse',
+        'CreateMilestoneRequest',
+        'CreateMilestoneResponse',
+        'GetMilestoneResponse',
+        'EditMilestoneRequest',
+        'EditMilestoneResponse',
+        'ToggleMilestoneRequest',
+        'ToggleMilestoneResponse',
+        'UploadedFile',
+        'UploadFileResponse',
+        'Document',
+        'ReplaceDocumentRequest',
+        'ReplaceDocumentResponse',
+        'ReplaceJSONDocumentRequest',
+        'ReplaceJSONDocumentResponse',
+        'AppendDocumentRequest',
+        'AppendDocumentResponse',
+        'AppendJSONDocumentRequest',
+        'AppendJSONDocumentResponse',
+        'ReplaceMarkdownDocumentRequest',
+        'ReplaceMarkdownDocumentResponse',
+        'AppendMarkdownDocumentRequest',
+        'AppendMarkdownDocumentResponse',
+        'GetMarkdownDocumentRequest',
+        'GetMarkdownDocumentResponse',
+        'GetDocumentsRequest',
+        'GetDocumentsResponse',
+        'CreateDocumentRequest',
+        'CreateDocumentResponse',
+        'EditDocumentRequest',
+        'EditDocumentResponse',
+        'Comment',
+        'CommentReaction',
+        'PostCommentRequest',
+        'PostCommentResponse',
+        'ReactToCommentRequest',
+        'ReactToCommentResponse',
+        'GetCommentsRequest',
+        'GetCommentsResponse',
+        'EditCommentRequest',
+        'EditCommentResponse',
+        'DeleteCommentRequest',
+        'DeleteCommentResponse',
+        'CommentReactionType',
+        'COMMENT_REACTION_METADATA',
+        'Space',
+        'GetSpaceResponse',
+        'Member',
+        'GetSpaceMembersResponse',
+        'AvatarMode',
+        'ColorInfo',
+        'Kind',
+        'MoveTaskItem',
+        'MoveTasksRequest',
+        'MoveTasksResponse',
+    ],
+    '.helpers': [
+        # Field creation helpers
+        'make_text_field',
+        'make_number_field',
+        'make_checkbox_field',
+        'make_date_field',
+        'make_member_field',
+        'make_task_relations_field',
+        'make_select_field',
+        'make_url_field',
     
-    # Select field option helpers
-    make_select_option,
-    add_board_custom_field_select_option,
-    remove_board_custom_field_select_option,
-    edit_board_custom_field_select_field_option,
-    SelectOption,
+        # Select field option helpers
+        'make_select_option',
+        'add_board_custom_field_select_option',
+        'remove_board_custom_field_select_option',
+        'edit_board_custom_field_select_field_option',
+        'SelectOption',
     
-    # Field editing helpers
-    edit_custom_field_name,
-    edit_custom_field_description,
-    edit_custom_field_visibility,
-    edit_custom_field_complete,
+        # Field editing helpers
+        'edit_custom_field_name',
+        'edit_custom_field_description',
+        'edit_custom_field_visibility',
+        'edit_custom_field_complete',
     
-    # Task relations helpers
-    make_task_relation_value,
-    add_task_relation,
-    remove_task_relation,
+        # Task relations helpers
+        'make_task_relation_value',
+        'add_task_relation',
+        'remove_task_relation',
     
-    # Member field helpers
-    make_member_value,
-    add_member_to_field,
-    remove_member_from_field,
+        # Member field helpers
+        'make_member_value',
+        'add_member_to_field',
+        'remove_member_from_field',
     
-    # Date field helpers
-    make_date_value,
-    make_date_range_value,
+        # Date field helpers
+        'make_date_value',
+        'make_date_range_value',
     
-    # Value formatting helpers
-    make_text_value,
-    make_number_value,
-    make_checkbox_value,
-    make_url_value,
+        # Value formatting helpers
+        'make_text_value',
+        'make_number_value',
+        'make_checkbox_value',
+        'make_url_value',
     
-    # Document structure builders
-    text,
-    paragraph,
-    heading,
-    list_item,
-    bullet_list,
-    ordered_list,
-    task_item,
-    task_list,
-    link_text,
-    horizontal_rule,
-    blockquote,
-    details,
-    details_summary,
-    details_content,
-    table,
-    table_row,
-    table_cell,
-    table_header,
-    mention,
-    mention_user,
-    mention_document,
-    mention_task,
-    mention_milestone,
-    image_block,
-    files_block,
-    toc_block,
-    anchors_block,
-    siblings_block,
-    code_block,
-    embed_block,
-    EmbedType,
-)
-
-__all__ = [
-    'VaizClient',
-    'TaskFollower',
-    'TaskPriority',
-    'CustomField',
-    'CreateTaskRequest',
-    'EditTaskRequest',
-    'Task',
-    'TaskResponse',
-    'BoardResponse',
-    'BoardsResponse',
-    'CreateBoardTypeRequest',
-    'CreateBoardTypeResponse',
-    'EditBoardTypeRequest',
-    'EditBoardTypeResponse',
-    'ProfileResponse',
-    'Project',
-    'ProjectsResponse',
-    'ProjectResponse',
-    'Milestone',
-    'MilestonesResponse',
-    'CreateMilestoneRequest',
-    'CreateMilestoneResponse',
-    'GetMilestoneResponse',
-    'EditMilestoneRequest',
-    'EditMilestoneResponse',
-    'ToggleMilestoneRequest',
-    'ToggleMilestoneResponse',
-    'UploadedFile',
-    'UploadFileResponse',
-    'Document',
-    'ReplaceDocumentRequest',
-    'ReplaceDocumentResponse',
-    'ReplaceJSONDocumentRequest',
-    'ReplaceJSONDocumentResponse',
-    'AppendDocumentRequest',
-    'AppendDocumentResponse',
-    'AppendJSONDocumentRequest',
-    'AppendJSONDocumentResponse',
-    'ReplaceMarkdownDocumentRequest',
-    'ReplaceMarkdownDocumentResponse',
-    'AppendMarkdownDocumentRequest',
-    'AppendMarkdownDocumentResponse',
-    'GetMarkdownDocumentRequest',
-    'GetMarkdownDocumentResponse',
-    'GetDocumentsRequest',
-    'GetDocumentsResponse',
-    'CreateDocumentRequest',
-    'CreateDocumentResponse',
-    'EditDocumentRequest',
-    'EditDocumentResponse',
-    'Comment',
-    'CommentReaction',
-    'PostCommentRequest',
-    'PostCommentResponse',
-    'ReactToCommentRequest',
-    'ReactToCommentResponse',
-    'GetCommentsRequest',
-    'GetCommentsResponse',
-    'EditCommentRequest',
-    'EditCommentResponse',
-    'DeleteCommentRequest',
-    'DeleteCommentResponse',
-    'CommentReactionType',
-    'COMMENT_REACTION_METADATA',
-    'Space',
-    'GetSpaceResponse',
-    'Member',
-    'GetSpaceMembersResponse',
-    'AvatarMode',
-    'ColorInfo',
-    'Kind',
-    'MoveTaskItem',
-    'MoveTasksRequest',
-    'MoveTasksResponse',
+        # Document structure builders
+        'text',
+        'paragraph',
+        'heading',
+        'list_item',
+        'bullet_list',
+        'ordered_list',
+        'task_item',
+        'task_list',
+        'link_text',
+        'horizontal_rule',
+        'blockquote',
+        'details',
+        'details_summary',
+        'details_content',
+        'table',
+        'table_row',
+        'table_cell',
+        'table_header',
+        'mention',
+        'mention_user',
+        'mention_document',
+        'mention_task',
+        'mention_milestone',
+        'image_block',
+        'files_block',
+        'toc_block',
+        'anchors_block',
+        'siblings_block',
+        'code_block',
+        'embed_block',
+        'EmbedType',
+    
+        # Indexed document tree
+        'DocumentTree',
+        'extract_mentions',
+        'ChecklistProgress',
+        'count_checklist',
+    
+        # Document diff and update planning
+        'DocumentUpdatePlan',
+        'plan_document_update',
+    
+        # Client-side image metadata
+        'ImageInfo',
+        'read_image_info',
+        'estimate_dominant_color',
+    
+        # Streaming document builder
+        'DocumentBuilder',
+    
+        # Compiled document templates
+        'DocumentTemplate',
+        'slot',
     
-    # Helper functions for custom fields
-    'make_text_field',
-    'make_number_field',
-    'make_checkbox_field',
-    'make_date_field',
-    'make_member_field',
-    'make_task_relations_field',
-    'make_select_field',
-    'make_url_field',
-    'make_select_option',
-    'add_board_custom_field_select_option',
-    'remove_board_custom_field_select_option',
-    'edit_board_custom_field_select_field_option',
-    'SelectOption',
+        # Tables from rows/CSV and back
+        'TableData',
+        'table_from_rows',
+        'table_from_csv',
+        'extract_tables',
     
-    # Field editing helpers
-    'edit_custom_field_name',
-    'edit_custom_field_description',
-    'edit_custom_field_visibility',
-    'edit_custom_field_complete',
+        # Local node tree validation
+        'DocumentIssue',
+        'validate_document',
     
-    # Task relations helpers
-    'make_task_relation_value',
-    'add_task_relation',
-    'remove_task_relation',
+        # Size-aware content chunking
+        'split_content',
     
-    # Member field helpers
-    'make_member_value',
-    'add_member_to_field',
-    'remove_member_from_field',
+        # Offline Markdown conversion
+        'markdown_to_nodes',
+        'iter_markdown_nodes',
+        'nodes_to_markdown',
     
-    # Date field helpers
-    'make_date_value',
-    'make_date_range_value',
+        # Local full-text search
+        'SearchIndex',
+        'SearchHit',
     
-    # Value formatting helpers
-    'make_text_value',
-    'make_number_value',
-    'make_checkbox_value',
-    'make_url_value',
+        # Mention backlinks
+        'MentionIndex',
     
-    # Document structure builders
-    'text',
-    'paragraph',
-    'heading',
-    'list_item',
-    'bullet_list',
-    'ordered_list',
-    'task_item',
-    'task_list',
-    'link_text',
-    'horizontal_rule',
-    'blockquote',
-    'details',
-    'details_summary',
-    'details_content',
-    'table',
-    'table_row',
-    'table_cell',
-    'table_header',
-    'mention',
-    'mention_user',
-    'mention_document',
-    'mention_task',
-    'mention_milestone',
-    'image_block',
-    'files_block',
-    'toc_block',
-    'anchors_block',
-    'siblings_block',
-    'code_block',
-    'embed_block',
-    'EmbedType',
-]
\ No newline at end of file
+        # Columnar task analytics
+        'TaskTable',
+    ],
+}
+_getattr, __dir__ = attach(__name__, _EXPORTS)
+
+
+def __getattr__(name):
+    if name == "__version__":
+        from importlib import metadata
+
+        try:
+            version = metadata.version("vaiz-sdk")
+        except metadata.PackageNotFoundError:
+            version = "0.0.0"
+        globals()["__version__"] = version
+        return version
+    return _getattr(name)
+
+
+if TYPE_CHECKING:
+    from .client import VaizClient
+    from .models import *  # noqa: F401,F403
+    from .helpers import *  # noqa: F401,F403
+
+__all__ = [name for names in _EXPORTS.values() for name in names]
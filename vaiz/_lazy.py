@@ -0,0 +1,45 @@
+"""
+Lazy attribute loading for package ``__init__`` modules (PEP 562).
+
+A package lists which submodule provides each public name; the submodule is
+imported the first time one of its names is accessed, and the value is then
+stored in the package namespace so later lookups are plain attribute reads.
+"""
+
+import importlib
+import sys
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+
+def attach(
+    package: str,
+    exports: Dict[str, Sequence[str]],
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build module-level ``__getattr__`` and ``__dir__`` functions for a package.
+
+    Args:
+        package: The package's ``__name__``
+        exports: Relative submodule name (e.g. ``".client"``) -> names it provides
+
+    Returns:
+        Tuple of the ``__getattr__`` and ``__dir__`` functions to assign in the package
+
+    Example:
+        >>> __getattr__, __dir__ = attach(__name__, {".client": ["VaizClient"]})
+    """
+    origins = {name: module for module, names in exports.items() for name in names}
+    namespace = sys.modules[package].__dict__
+
+    def __getattr__(name: str) -> Any:
+        module = origins.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module, package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(origins))
+
+    return __getattr__, __dir__
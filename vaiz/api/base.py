@@ -1,8 +1,14 @@
 import requests
-from typing import Dict, Any, Optional, List
+from typing import TYPE_CHECKING, Dict, Any, Optional, List, Union
 from dataclasses import dataclass
 
 from vaiz import __version__
+from vaiz.api.encoding import EncodedJSON, JSONDecoder, encode_json, get_json_decoder
+
+if TYPE_CHECKING:
+    from vaiz.helpers.search import SearchIndex
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
 
 @dataclass
 class ErrorMeta:
@@ -64,6 +70,14 @@ class VaizRateLimitError(VaizSDKError):
     def __init__(self, message: str, api_error: Optional[APIError] = None):
         super().__init__(f"Rate limit exceeded: {message}", api_error)
 
+class VaizChunkedWriteError(VaizSDKError):
+    """A chunked document write failed part-way; earlier chunks were already written."""
+    def __init__(self, message: str, document_id: str, chunk_index: int, total_chunks: int):
+        super().__init__(message)
+        self.document_id = document_id
+        self.chunk_index = chunk_index
+        self.total_chunks = total_chunks
+
 class VaizHTTPError(VaizSDKError):
     def __init__(self, message, status_code=None, url=None, response_text=None):
         super().__init__(message)
@@ -72,7 +86,7 @@ class VaizHTTPError(VaizSDKError):
         self.response_text = response_text
 
 class BaseAPIClient:
-    def __init__(self, api_key: str, space_id: str, base_url: str = "https://api.vaiz.com/v4", verify_ssl: bool = True, verbose: bool = False):
+    def __init__(self, api_key: str, space_id: str, base_url: str = "https://api.vaiz.com/v4", verify_ssl: bool = True, verbose: bool = False, search_index: Optional["SearchIndex"] = None, json_decoder: Union[str, JSONDecoder] = "auto"):
         """
         Initialize the API client.
         
@@ -82,12 +96,24 @@ class BaseAPIClient:
             base_url: Base URL for the API (defaults to production)
             verify_ssl: Whether to verify SSL certificates (defaults to True for security)
             verbose: Whether to enable debug output
+            search_index: Optional local `SearchIndex` kept up to date with the tasks and
+                documents fetched or written through this client
+            json_decoder: How response bodies (and the document JSON embedded in
+                `get_json_document` responses) are decoded: "auto" (default; orjson or
+                msgspec when installed, else the standard library), "orjson", "msgspec",
+                "json", or a function taking bytes/str
+
+        Raises:
+            ValueError: If json_decoder is unknown
+            ImportError: If json_decoder names a library that is not installed
         """
         self.api_key = api_key
         self.space_id = space_id
         self.base_url = base_url
         self.verify_ssl = verify_ssl
         self.verbose = verbose
+        self.search_index = search_index
+        self._decode_json = get_json_decoder(json_decoder)
         self.app_version = f"python-sdk-{__version__}"
         self.session = requests.Session()
         self.session.headers.update({
@@ -128,12 +154,26 @@ class BaseAPIClient:
 
     def _make_request(self, endpoint: str, method: str = "POST", json_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         url = f"{self.base_url}/{endpoint}"
+        # Encoded once; EncodedJSON payloads (e.g. from get_tasks) carry their body already
+        body = None
+        if json_data is not None:
+            body = json_data.body if isinstance(json_data, EncodedJSON) else encode_json(json_data)
         if self.verbose:
-            print(f"Request payload: {json_data}")  # Debug print
+            print(f"Request payload: {body.decode('utf-8') if body is not None else None}")  # Debug print
         
         try:
-            response = self.session.request(method, url, json=json_data, verify=self.verify_ssl)
-            response_data = response.json()
+            response = self.session.request(
+                method, url, data=body, headers=_JSON_HEADERS if body is not None else None, verify=self.verify_ssl
+            )
+            try:
+                # Decoded from the raw bytes, without requests' charset detection
+                response_data = self._decode_json(response.content)
+            except ValueError as e:
+                raise VaizHTTPError(
+                    f"Invalid JSON in response from {url}: {e}",
+                    status_code=getattr(response, "status_code", None),
+                    url=url,
+                ) from e
             
             if self.verbose:
                 print(f"Response data: {response_data}")  # Debug print
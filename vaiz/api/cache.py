@@ -0,0 +1,212 @@
+"""
+Client-side stores used by the document API clients.
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Set, Tuple
+
+
+def write_text_atomic(path: str, text: str) -> None:
+    """
+    Write a text file atomically (temp file in the same directory + rename).
+
+    Readers never see a partially written file, even if the process is killed
+    mid-write.
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".vaiz-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def write_json_atomic(path: str, data: Any) -> None:
+    """Write JSON to a file atomically (see ``write_text_atomic``)."""
+    write_text_atomic(path, json.dumps(data))
+
+
+class DocumentFingerprintStore:
+    """
+    Bounded LRU map of document ID -> fingerprint of the last content written.
+
+    Used to skip writes whose content is identical to what this client last
+    wrote. When a path is given, the store is loaded from and saved to a JSON
+    file so fingerprints survive process restarts (e.g. scheduled jobs).
+    """
+
+    def __init__(self, max_entries: int = 1024, path: Optional[str] = None):
+        """
+        Initialize the store.
+
+        Args:
+            max_entries: Maximum number of documents to remember (least recently written are dropped first)
+            path: Optional JSON file to persist fingerprints to
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.path = os.path.expanduser(path) if path else None
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        if self.path:
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, document_id: str) -> Optional[str]:
+        """Return the last fingerprint written for a document, if known."""
+        return self._entries.get(document_id)
+
+    def set(self, document_id: str, fingerprint: str) -> None:
+        """Remember the fingerprint of content just written to a document."""
+        with self._lock:
+            self._entries[document_id] = fingerprint
+            self._entries.move_to_end(document_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._save()
+
+    def discard(self, document_id: str) -> None:
+        """Forget a document (its content changed in a way that was not fingerprinted)."""
+        with self._lock:
+            if self._entries.pop(document_id, None) is not None:
+                self._save()
+
+    def clear(self) -> None:
+        """Forget all documents."""
+        with self._lock:
+            self._entries.clear()
+            self._save()
+
+    def _load(self) -> None:
+        """Load persisted fingerprints, ignoring a missing or unreadable file."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        for document_id, fingerprint in data.get("entries", [])[-self.max_entries:]:
+            self._entries[document_id] = fingerprint
+
+    def _save(self) -> None:
+        """Atomically write fingerprints to disk (no-op without a path)."""
+        if not self.path:
+            return
+        write_json_atomic(self.path, {"version": 1, "entries": list(self._entries.items())})
+
+
+class DocumentCache:
+    """
+    TTL + LRU cache of document content keyed by (document ID, format).
+
+    Values are stored as strings (the raw JSON document string, or Markdown),
+    so every cache hit can be parsed into a fresh object that callers are free
+    to mutate.
+
+    Each document has a generation that every invalidation advances. A fetch
+    takes ``generation()`` before its request and passes it to ``set()``, so
+    content fetched while a write was in flight is not put back after the
+    write dropped the entry.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl: float = 300.0):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached entries across all documents and formats
+                (least recently used are dropped first)
+            ttl: Time to live of an entry in seconds
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[str, float]]" = OrderedDict()
+        self._formats: Set[str] = set()
+        # Generations of recently invalidated documents; all others are at _base_generation
+        self._generations: Dict[str, int] = {}
+        self._base_generation = 0
+        self._clock = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, document_id: str, format: str) -> Optional[str]:
+        """Return cached content, or None if missing or expired."""
+        key = (document_id, format)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def generation(self, document_id: str) -> int:
+        """Current generation of a document, to pass to ``set()`` with content fetched afterwards."""
+        with self._lock:
+            return self._generations.get(document_id, self._base_generation)
+
+    def set(self, document_id: str, format: str, value: str, generation: Optional[int] = None) -> None:
+        """
+        Cache content fetched for a document.
+
+        Args:
+            document_id: The document ID
+            format: Content format ("json" or "markdown")
+            value: The fetched content
+            generation: ``generation()`` taken before the fetch; the content is
+                dropped if the document was invalidated since
+        """
+        key = (document_id, format)
+        with self._lock:
+            if generation is not None and generation != self._generations.get(document_id, self._base_generation):
+                return
+            self._formats.add(format)
+            self._entries[key] = (value, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, document_id: str) -> None:
+        """Drop all cached formats of a document (its content changed)."""
+        with self._lock:
+            for format in self._formats:
+                self._entries.pop((document_id, format), None)
+            self._clock += 1
+            if len(self._generations) >= self.max_entries:
+                self._advance_all()
+            else:
+                self._generations[document_id] = self._clock
+
+    def clear(self) -> None:
+        """Drop all cached documents."""
+        with self._lock:
+            self._entries.clear()
+            self._clock += 1
+            self._advance_all()
+
+    def _advance_all(self) -> None:
+        """Move every document to a new generation (keeps the generation table bounded)."""
+        self._base_generation = self._clock
+        self._generations.clear()
+
@@ -0,0 +1,698 @@
+"""
+Operations over whole document hierarchies.
+
+- ``get_document_tree``: crawl a scope's documents into a ``DocumentHierarchy``
+- ``export_documents`` / ``import_documents``: bulk Markdown export and import
+- ``refresh_mention_index``: bring a ``MentionIndex`` up to date with a scope
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from vaiz.api.cache import write_json_atomic, write_text_atomic
+from vaiz.api.documents import DocumentsAPIClient
+from vaiz.helpers.document_tree import extract_mentions
+from vaiz.helpers.mention_index import MentionIndex
+from vaiz.models.documents import CreateDocumentRequest, Document, GetDocumentsRequest
+from vaiz.models.enums import Kind
+
+
+# Manifest file written to the root of an export directory
+EXPORT_MANIFEST = ".vaiz-export.json"
+
+# Checkpoint file written to the root of an imported directory
+IMPORT_CHECKPOINT = ".vaiz-import.json"
+
+# Save the manifest after this many completed documents (and at the end)
+_CHECKPOINT_EVERY = 20
+
+_UNSAFE_FILENAME_RE = re.compile(r'[\x00-\x1f<>:"/\\|?*]+')
+_MAX_FILENAME_LENGTH = 120
+
+
+def _safe_filename(title: str) -> str:
+    """Turn a document title into a file name that is valid on all platforms."""
+    name = _UNSAFE_FILENAME_RE.sub("_", title).strip(" .")
+    return name[:_MAX_FILENAME_LENGTH].rstrip(" .") or "Untitled"
+
+
+@dataclass
+class DocumentExportResult:
+    """
+    Outcome of ``export_documents``.
+
+    Attributes:
+        dest_dir: Export directory
+        exported: IDs of documents whose file was written
+        unchanged: IDs of documents skipped because the manifest showed no change
+        failed: Document ID -> error message for documents that could not be exported
+    """
+    dest_dir: str
+    exported: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def total(self) -> int:
+        """Number of documents found in the hierarchy."""
+        return len(self.exported) + len(self.unchanged) + len(self.failed)
+
+
+@dataclass
+class DocumentImportResult:
+    """
+    Outcome of ``import_documents``.
+
+    Attributes:
+        source_dir: Imported directory
+        document_ids: Relative path (file or directory) -> document ID for every imported document
+        created: Relative paths of documents created by this run
+        written: Relative paths of documents whose content was written by this run
+        unchanged: Relative paths skipped because the checkpoint showed the same content
+        failed: Relative path -> error message for documents that could not be created or written
+    """
+    source_dir: str
+    document_ids: Dict[str, str] = field(default_factory=dict)
+    created: List[str] = field(default_factory=list)
+    written: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class MentionRefreshResult:
+    """
+    Outcome of ``refresh_mention_index``.
+
+    Attributes:
+        updated: IDs of documents that were fetched and re-indexed
+        unchanged: IDs of documents skipped because their ``updatedAt`` did not change
+        removed: IDs of documents dropped from the index (with ``prune=True``)
+        failed: Document ID -> error message for documents that could not be fetched
+    """
+    updated: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class _ImportNode:
+    """A document to import: a ``<Title>.md`` file and/or a ``<Title>/`` directory."""
+    key: str
+    title: str
+    markdown_path: Optional[str]
+    parent: Optional["_ImportNode"]
+    index: int
+
+
+def _scan_import_tree(source_dir: str) -> List[_ImportNode]:
+    """
+    Map a directory tree to documents, parents before children (breadth-first).
+
+    ``Guide.md`` and ``Guide/`` are the same document; a directory without a
+    matching file becomes an empty parent document. Hidden entries are ignored.
+    """
+    ordered: List[_ImportNode] = []
+    queue = deque([("", None)])
+    while queue:
+        rel_dir, parent = queue.popleft()
+        abs_dir = os.path.join(source_dir, rel_dir)
+        files: Dict[str, str] = {}
+        dirs: Dict[str, str] = {}
+        for entry in sorted(os.listdir(abs_dir)):
+            if entry.startswith("."):
+                continue
+            path = os.path.join(abs_dir, entry)
+            if os.path.isdir(path):
+                dirs[entry] = entry
+            elif entry.lower().endswith(".md"):
+                files[entry[:-len(".md")]] = entry
+        for index, title in enumerate(sorted(set(files) | set(dirs))):
+            key = f"{rel_dir}/{title}" if rel_dir else title
+            markdown_path = os.path.join(abs_dir, files[title]) if title in files else None
+            node = _ImportNode(key=key, title=title, markdown_path=markdown_path, parent=parent, index=index)
+            ordered.append(node)
+            if title in dirs:
+                queue.append((key, node))
+    return ordered
+
+
+class DocumentHierarchy:
+    """
+    In-memory tree of nested documents returned by ``get_document_tree``.
+
+    Documents are indexed by ID, with parent and child indexes in both
+    directions. Top-level documents have a parent of ``None``; children keep
+    the order the API returned them in.
+
+    Example:
+        >>> tree = client.get_document_tree(Kind.Project, project_id)
+        >>> for document, depth in tree.walk():
+        ...     print("  " * depth + document.title)
+    """
+
+    def __init__(self, kind: Kind, kind_id: str):
+        self.kind = kind
+        self.kind_id = kind_id
+        self.documents: Dict[str, Document] = {}
+        self.parents: Dict[str, Optional[str]] = {}
+        self.children: Dict[Optional[str], List[str]] = {None: []}
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def __contains__(self, document_id: object) -> bool:
+        return document_id in self.documents
+
+    def __getitem__(self, document_id: str) -> Document:
+        return self.documents[document_id]
+
+    def _add(self, document: Document, parent_id: Optional[str]) -> None:
+        self.documents[document.id] = document
+        self.parents[document.id] = parent_id
+        self.children.setdefault(parent_id, []).append(document.id)
+        self.children.setdefault(document.id, [])
+
+    def _reparent(self, document_id: str, parent_id: str) -> None:
+        self.children[self.parents[document_id]].remove(document_id)
+        self.parents[document_id] = parent_id
+        self.children.setdefault(parent_id, []).append(document_id)
+
+    def _is_within(self, document_id: str, ancestor_id: str) -> bool:
+        """Whether ``document_id`` is ``ancestor_id`` or one of its descendants."""
+        while document_id is not None:
+            if document_id == ancestor_id:
+                return True
+            document_id = self.parents[document_id]
+        return False
+
+    @property
+    def roots(self) -> List[Document]:
+        """Top-level documents of the scope."""
+        return [self.documents[document_id] for document_id in self.children[None]]
+
+    def get_children(self, document_id: Optional[str]) -> List[Document]:
+        """Return the direct children of a document (``None`` for top-level documents)."""
+        return [self.documents[child_id] for child_id in self.children.get(document_id, [])]
+
+    def get_parent(self, document_id: str) -> Optional[Document]:
+        """Return the parent of a document, or ``None`` for a top-level document."""
+        parent_id = self.parents[document_id]
+        return self.documents[parent_id] if parent_id is not None else None
+
+    def get_ancestors(self, document_id: str) -> List[Document]:
+        """Return the ancestors of a document, nearest parent first."""
+        ancestors = []
+        parent_id = self.parents[document_id]
+        while parent_id is not None:
+            ancestors.append(self.documents[parent_id])
+            parent_id = self.parents[parent_id]
+        return ancestors
+
+    def walk(self, document_id: Optional[str] = None) -> Iterator[Tuple[Document, int]]:
+        """
+        Yield ``(document, depth)`` pairs depth-first, in document order.
+
+        Args:
+            document_id: Subtree to walk (default: the whole tree). The
+                starting document itself is not included.
+        """
+        stack = [(child_id, 0) for child_id in reversed(self.children.get(document_id, []))]
+        while stack:
+            child_id, depth = stack.pop()
+            yield self.documents[child_id], depth
+            stack.extend((grandchild_id, depth + 1) for grandchild_id in reversed(self.children[child_id]))
+
+    def iter_breadth_first(self) -> Iterator[Tuple[Document, Optional[str]]]:
+        """Yield ``(document, parent_id)`` pairs level by level, parents before children."""
+        queue = deque(self.children[None])
+        while queue:
+            document_id = queue.popleft()
+            yield self.documents[document_id], self.parents[document_id]
+            queue.extend(self.children[document_id])
+
+
+class DocumentSyncAPIClient(DocumentsAPIClient):
+    """API client for bulk document export and import."""
+
+    def get_document_tree(
+        self,
+        kind: Kind,
+        kind_id: str,
+        max_depth: Optional[int] = None,
+        concurrency: int = 4
+    ) -> DocumentHierarchy:
+        """
+        Fetch the full tree of nested documents of a space, project, member, etc.
+
+        `getDocuments` lists one level of one parent per request, so the tree is
+        crawled breadth-first: all documents of a level are expanded with up to
+        `concurrency` parallel requests before moving to the next level. Each
+        document is fetched once; a document listed at the top level that turns
+        out to be nested is moved under its parent.
+
+        Args:
+            kind: Scope of the documents (e.g. `Kind.Project`, `Kind.Space`)
+            kind_id: ID of the project, space, member, ...
+            max_depth: Deepest level to include, 0 being top-level documents
+                (default: no limit)
+            concurrency: Maximum number of parallel requests (default: 4)
+
+        Returns:
+            DocumentHierarchy: Documents with parent and child indexes
+
+        Raises:
+            ValueError: If concurrency is less than 1
+            VaizSDKError: If any listing request fails
+
+        Example:
+            >>> tree = client.get_document_tree(Kind.Project, project_id, concurrency=8)
+            >>> [child.title for child in tree.get_children(tree.roots[0].id)]
+            ['Setup', 'Usage']
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        tree = DocumentHierarchy(kind, kind_id)
+
+        def list_children(list_kind: Kind, list_kind_id: str) -> List[Document]:
+            response = self.get_documents(GetDocumentsRequest(kind=list_kind, kind_id=list_kind_id))
+            return response.payload.documents
+
+        for document in list_children(kind, kind_id):
+            if document.id not in tree:
+                tree._add(document, None)
+
+        frontier = list(tree.children[None])
+        depth = 0
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            while frontier and (max_depth is None or depth < max_depth):
+                # map() keeps results in frontier order, so the tree is deterministic
+                levels = executor.map(lambda parent_id: list_children(Kind.Document, parent_id), frontier)
+                next_frontier = []
+                for parent_id, documents in zip(frontier, levels):
+                    for document in documents:
+                        if document.id not in tree:
+                            tree._add(document, parent_id)
+                            next_frontier.append(document.id)
+                        elif tree.parents[document.id] is None and not tree._is_within(parent_id, document.id):
+                            tree._reparent(document.id, parent_id)
+                frontier = next_frontier
+                depth += 1
+        return tree
+
+    @staticmethod
+    def _export_paths(documents: List[Tuple[Document, Optional[str]]]) -> Dict[str, str]:
+        """
+        Map document IDs to relative file paths mirroring the hierarchy.
+
+        A document is written to ``<Title>.md`` and its children go into a
+        ``<Title>/`` directory next to it. Sibling name clashes get the end
+        of the document ID appended.
+        """
+        paths: Dict[str, str] = {}
+        used: Dict[str, set] = {}
+        for document, parent_id in documents:
+            directory = ""
+            if parent_id is not None and parent_id in paths:
+                directory = paths[parent_id][:-len(".md")]
+            name = _safe_filename(document.title)
+            taken = used.setdefault(directory, set())
+            if name.lower() in taken:
+                name = f"{name} ({document.id[-6:]})"
+            taken.add(name.lower())
+            paths[document.id] = f"{directory}/{name}.md" if directory else f"{name}.md"
+        return paths
+
+    def export_documents(
+        self,
+        kind: Kind,
+        kind_id: str,
+        dest_dir: str,
+        concurrency: int = 4,
+        force: bool = False
+    ) -> DocumentExportResult:
+        """
+        Export all documents of a space, project, member, etc. to Markdown files.
+
+        The document hierarchy is crawled with `get_document_tree`, then
+        document content is fetched with `concurrency` parallel requests and
+        written as soon as each document arrives. A manifest (`.vaiz-export.json`) in `dest_dir`
+        records each document's path, content hash and `updatedAt`, so a rerun
+        skips documents that have not changed and an interrupted export resumes
+        where it stopped.
+
+        Args:
+            kind: Scope of the documents (e.g. `Kind.Project`, `Kind.Space`)
+            kind_id: ID of the project, space, member, ...
+            dest_dir: Directory to write files to (created if missing)
+            concurrency: Maximum number of parallel content requests (default: 4)
+            force: Fetch and rewrite every document, ignoring the manifest
+
+        Returns:
+            DocumentExportResult: IDs of exported, unchanged and failed documents
+
+        Raises:
+            VaizSDKError: If listing the documents fails (content errors are
+                reported per document in the result instead)
+
+        Example:
+            >>> result = client.export_documents(Kind.Project, project_id, "backup/wiki", concurrency=8)
+            >>> len(result.exported), len(result.unchanged), result.failed
+            (12, 230, {})
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        dest_dir = os.path.expanduser(dest_dir)
+        manifest_path = os.path.join(dest_dir, EXPORT_MANIFEST)
+        manifest = self._load_export_manifest(manifest_path)
+        entries: Dict[str, Dict[str, Any]] = manifest["documents"]
+
+        documents = list(self.get_document_tree(kind, kind_id, concurrency=concurrency).iter_breadth_first())
+        paths = self._export_paths(documents)
+        result = DocumentExportResult(dest_dir=dest_dir)
+        lock = threading.Lock()
+        completed = 0
+
+        def export_one(document: Document) -> bool:
+            """Write one document; returns False if it was unchanged."""
+            rel_path = paths[document.id]
+            abs_path = os.path.join(dest_dir, rel_path)
+            updated_at = document.updated_at.isoformat()
+            with lock:
+                entry = dict(entries.get(document.id) or {})
+            in_place = entry.get("path") == rel_path and os.path.exists(abs_path)
+
+            if not force and in_place and entry.get("updatedAt") == updated_at:
+                return False
+
+            markdown = self.get_markdown_document(document.id)
+            digest = hashlib.sha256(markdown.encode("utf-8")).hexdigest()
+            changed = force or not in_place or entry.get("hash") != digest
+            if changed:
+                write_text_atomic(abs_path, markdown)
+                old_path = entry.get("path")
+                if old_path and old_path != rel_path:
+                    try:
+                        os.remove(os.path.join(dest_dir, old_path))
+                    except OSError:
+                        pass
+
+            with lock:
+                entries[document.id] = {
+                    "path": rel_path,
+                    "title": document.title,
+                    "hash": digest,
+                    "updatedAt": updated_at,
+                }
+            return changed
+
+        try:
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                futures = {executor.submit(export_one, document): document for document, _ in documents}
+                for future in as_completed(futures):
+                    document = futures[future]
+                    try:
+                        changed = future.result()
+                    except Exception as e:
+                        result.failed[document.id] = str(e)
+                        if self.verbose:
+                            print(f"Failed to export document {document.id}: {e}")
+                        continue
+                    (result.exported if changed else result.unchanged).append(document.id)
+                    completed += 1
+                    if completed % _CHECKPOINT_EVERY == 0:
+                        with lock:
+                            write_json_atomic(manifest_path, manifest)
+        finally:
+            with lock:
+                write_json_atomic(manifest_path, manifest)
+
+        if self.verbose:
+            print(
+                f"Exported {len(result.exported)} document(s), {len(result.unchanged)} unchanged, "
+                f"{len(result.failed)} failed to {dest_dir}"
+            )
+        return result
+
+    @staticmethod
+    def _load_export_manifest(path: str) -> Dict[str, Any]:
+        """Load an export manifest, starting fresh if it is missing or unreadable."""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            manifest = None
+        if not isinstance(manifest, dict) or not isinstance(manifest.get("documents"), dict):
+            manifest = {"version": 1, "documents": {}}
+        return manifest
+
+    def import_documents(
+        self,
+        kind: Kind,
+        kind_id: str,
+        source_dir: str,
+        concurrency: int = 4,
+        checkpoint_path: Optional[str] = None
+    ) -> DocumentImportResult:
+        """
+        Import a directory tree of Markdown files as a document hierarchy.
+
+        Every `<Title>.md` file becomes a document titled `<Title>`; files in a
+        `<Title>/` directory become its children (a directory without a
+        matching file becomes an empty parent). This is the layout written by
+        `export_documents`.
+
+        Documents are created level by level, so parents always exist before
+        their children, with up to `concurrency` requests in parallel; content
+        is then written with `replace_markdown_document`, also in parallel.
+        Progress is checkpointed to a JSON file (by default
+        `.vaiz-import.json` in `source_dir`) after every created document, so
+        rerunning a crashed import reuses the documents already created instead
+        of creating duplicates, and skips content that was already written.
+
+        Args:
+            kind: Scope to import into (e.g. `Kind.Project`, `Kind.Space`)
+            kind_id: ID of the project, space, member, ...
+            source_dir: Directory to import
+            concurrency: Maximum number of parallel requests (default: 4)
+            checkpoint_path: Where to keep import progress (default: `<source_dir>/.vaiz-import.json`)
+
+        Returns:
+            DocumentImportResult: Document IDs by relative path and per-path outcome
+
+        Example:
+            >>> result = client.import_documents(Kind.Project, project_id, "wiki/", concurrency=8)
+            >>> result.document_ids["Guide/Setup"]
+            '68fa67d262f676bcd1bc162f'
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        source_dir = os.path.expanduser(source_dir)
+        checkpoint_path = os.path.expanduser(checkpoint_path or os.path.join(source_dir, IMPORT_CHECKPOINT))
+        checkpoint = self._load_import_checkpoint(checkpoint_path)
+        entries: Dict[str, Dict[str, Any]] = checkpoint["documents"]
+
+        nodes = _scan_import_tree(source_dir)
+        result = DocumentImportResult(source_dir=source_dir)
+        lock = threading.Lock()
+
+        def save_checkpoint() -> None:
+            with lock:
+                write_json_atomic(checkpoint_path, checkpoint)
+
+        def create_one(node: _ImportNode) -> str:
+            parent_id = None
+            if node.parent is not None:
+                parent_id = result.document_ids[node.parent.key]
+            response = self.create_document(CreateDocumentRequest(
+                kind=kind,
+                kind_id=kind_id,
+                title=node.title,
+                index=node.index,
+                parent_document_id=parent_id,
+            ))
+            document_id = response.payload.document.id
+            with lock:
+                entries[node.key] = {"id": document_id}
+            # Persist immediately: a crash after this point must not create the document again
+            save_checkpoint()
+            return document_id
+
+        def write_one(node: _ImportNode) -> bool:
+            with open(node.markdown_path, "r", encoding="utf-8") as f:
+                markdown = f.read()
+            digest = hashlib.sha256(markdown.encode("utf-8")).hexdigest()
+            with lock:
+                entry = entries[node.key]
+                if entry.get("hash") == digest:
+                    return False
+            self.replace_markdown_document(result.document_ids[node.key], markdown)
+            with lock:
+                entry["hash"] = digest
+            return True
+
+        # Group nodes by depth (they are already ordered parents first)
+        levels: List[List[_ImportNode]] = []
+        depth_of: Dict[str, int] = {}
+        for node in nodes:
+            depth = depth_of[node.parent.key] + 1 if node.parent is not None else 0
+            depth_of[node.key] = depth
+            if depth == len(levels):
+                levels.append([])
+            levels[depth].append(node)
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            # Create documents one level at a time so parents exist before children
+            for level in levels:
+                pending = {}
+                for node in level:
+                    if node.parent is not None and node.parent.key not in result.document_ids:
+                        result.failed[node.key] = f"Parent '{node.parent.key}' was not imported"
+                        continue
+                    entry = entries.get(node.key)
+                    if entry and entry.get("id"):
+                        result.document_ids[node.key] = entry["id"]
+                        continue
+                    pending[executor.submit(create_one, node)] = node
+                for future in as_completed(pending):
+                    node = pending[future]
+                    try:
+                        result.document_ids[node.key] = future.result()
+                    except Exception as e:
+                        result.failed[node.key] = str(e)
+                        if self.verbose:
+                            print(f"Failed to create document for {node.key}: {e}")
+                        continue
+                    result.created.append(node.key)
+
+            # Write content concurrently
+            pending = {
+                executor.submit(write_one, node): node
+                for node in nodes
+                if node.markdown_path is not None and node.key in result.document_ids
+            }
+            try:
+                completed = 0
+                for future in as_completed(pending):
+                    node = pending[future]
+                    try:
+                        written = future.result()
+                    except Exception as e:
+                        result.failed[node.key] = str(e)
+                        if self.verbose:
+                            print(f"Failed to write content for {node.key}: {e}")
+                        continue
+                    (result.written if written else result.unchanged).append(node.key)
+                    completed += 1
+                    if completed % _CHECKPOINT_EVERY == 0:
+                        save_checkpoint()
+            finally:
+                save_checkpoint()
+
+        if self.verbose:
+            print(
+                f"Imported {len(result.document_ids)} document(s) from {source_dir}: "
+                f"{len(result.created)} created, {len(result.written)} written, "
+                f"{len(result.unchanged)} unchanged, {len(result.failed)} failed"
+            )
+        return result
+
+    @staticmethod
+    def _load_import_checkpoint(path: str) -> Dict[str, Any]:
+        """Load an import checkpoint, starting fresh if it is missing or unreadable."""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                checkpoint = json.load(f)
+        except (OSError, ValueError):
+            checkpoint = None
+        if not isinstance(checkpoint, dict) or not isinstance(checkpoint.get("documents"), dict):
+            checkpoint = {"version": 1, "documents": {}}
+        return checkpoint
+
+    def refresh_mention_index(
+        self,
+        index: MentionIndex,
+        kind: Kind,
+        kind_id: str,
+        concurrency: int = 4,
+        prune: bool = False
+    ) -> MentionRefreshResult:
+        """
+        Bring a `MentionIndex` up to date with the documents of a space, project, etc.
+
+        The document tree is crawled with `get_document_tree`; only documents
+        whose `updatedAt` differs from the indexed one are fetched (with
+        `concurrency` parallel requests) and have their mentions re-extracted.
+        The index is saved when it has a path.
+
+        Args:
+            index: The index to update
+            kind: Scope of the documents (e.g. `Kind.Project`, `Kind.Space`)
+            kind_id: ID of the project, space, member, ...
+            concurrency: Maximum number of parallel requests (default: 4)
+            prune: Drop indexed documents that are no longer in the tree. Only use
+                this when the index covers this single scope.
+
+        Returns:
+            MentionRefreshResult: IDs of updated, unchanged, removed and failed documents
+
+        Raises:
+            VaizSDKError: If listing the documents fails (content errors are
+                reported per document in the result instead)
+
+        Example:
+            >>> index = MentionIndex(path="mentions.json")
+            >>> client.refresh_mention_index(index, Kind.Space, space_id)
+            >>> index.get_backlinks(task_id, kind="Task")
+            ['68fa6c7b62f676bcd1bcecae', '68fa6d0e62f676bcd1bced01']
+        """
+        tree = self.get_document_tree(kind, kind_id, concurrency=concurrency)
+        result = MentionRefreshResult()
+
+        stale: List[Document] = []
+        for document, _ in tree.iter_breadth_first():
+            if document.id in index and index.get_version(document.id) == document.updated_at.isoformat():
+                result.unchanged.append(document.id)
+            else:
+                stale.append(document)
+
+        def refresh_one(document: Document) -> None:
+            content = self.get_json_document(document.id)
+            index.update(document.id, extract_mentions(content), document.updated_at.isoformat())
+
+        try:
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                futures = {executor.submit(refresh_one, document): document for document in stale}
+                for future in as_completed(futures):
+                    document = futures[future]
+                    try:
+                        future.result()
+                    except Exception as e:
+                        result.failed[document.id] = str(e)
+                        if self.verbose:
+                            print(f"Failed to index mentions of document {document.id}: {e}")
+                        continue
+                    result.updated.append(document.id)
+
+            if prune:
+                for document_id in index.document_ids:
+                    if document_id not in tree:
+                        index.remove(document_id)
+                        result.removed.append(document_id)
+        finally:
+            index.save()
+
+        if self.verbose:
+            print(
+                f"Mention index: {len(result.updated)} updated, {len(result.unchanged)} unchanged, "
+                f"{len(result.removed)} removed, {len(result.failed)} failed"
+            )
+        return result
@@ -1,7 +1,23 @@
 from typing import Any, Dict, List, Union, Optional
-import json
-
-from vaiz.api.base import BaseAPIClient
+import hashlib
+import time
+
+import requests
+from urllib3.exceptions import NewConnectionError
+
+from vaiz.api.base import (
+    BaseAPIClient,
+    VaizSDKError,
+    VaizAuthError,
+    VaizValidationError,
+    VaizNotFoundError,
+    VaizPermissionError,
+    VaizRateLimitError,
+    VaizHTTPError,
+    VaizChunkedWriteError,
+)
+from vaiz.api.cache import DocumentCache, DocumentFingerprintStore
+from vaiz.api.encoding import EncodedJSON
 from vaiz.models.documents import (
     GetDocumentRequest, 
     ReplaceDocumentRequest, 
@@ -26,15 +42,225 @@ from vaiz.models.documents import (
     EditDocumentResponse
 )
 
+from vaiz.helpers.document_diff import DocumentUpdatePlan, plan_document_update, content_fingerprint
+from vaiz.helpers.document_chunks import split_content
+from vaiz.helpers.document_validation import validate_document
+
 # Import Document Structure types for better type hints
 try:
     from vaiz.helpers.document_structure import DocumentNode
 except ImportError:
     DocumentNode = Dict[str, Any]  # Fallback if typing_extensions not available
 
+# Errors that a retry cannot fix
+_NON_RETRYABLE_ERRORS = (VaizAuthError, VaizValidationError, VaizNotFoundError, VaizPermissionError)
+
+# HTTP statuses returned for requests the server did not process
+_UNPROCESSED_STATUSES = (429, 503)
+
+
+def _was_not_applied(error: VaizSDKError) -> bool:
+    """
+    Check whether a failed request is known not to have been applied by the server.
+
+    True for rate limiting, 429/503 responses and connection failures (refused,
+    DNS, connect timeout). Read timeouts and dropped connections are ambiguous:
+    the server may have applied the request before the response was lost.
+    """
+    if isinstance(error, VaizRateLimitError):
+        return True
+    if isinstance(error, VaizHTTPError):
+        return error.status_code in _UNPROCESSED_STATUSES
+    cause = error.__cause__
+    if isinstance(cause, requests.exceptions.ConnectTimeout):
+        return True
+    if isinstance(cause, requests.exceptions.ConnectionError) and cause.args:
+        return isinstance(getattr(cause.args[0], "reason", None), NewConnectionError)
+    return False
+
+
 class DocumentsAPIClient(BaseAPIClient):
     """API client for document content operations."""
 
+    def __init__(
+        self,
+        *args,
+        skip_unchanged_writes: bool = False,
+        fingerprint_limit: int = 1024,
+        fingerprint_path: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        chunk_retries: int = 2,
+        chunk_retry_delay: float = 1.0,
+        document_cache: bool = False,
+        document_cache_size: int = 256,
+        document_cache_ttl: float = 300.0,
+        **kwargs
+    ):
+        """
+        Initialize DocumentsAPIClient.
+
+        Args:
+            skip_unchanged_writes: Skip `replace_json_document` / `replace_markdown_document`
+                calls whose content is identical to what this client last wrote to the
+                same document (default: False). Pass `force=True` to write anyway.
+            fingerprint_limit: Maximum number of documents to remember fingerprints for
+            fingerprint_path: Optional JSON file to persist fingerprints across runs
+            chunk_size: Default byte budget for `replace_json_document` / `append_json_document`
+                content. Larger content is split at top-level nodes and sent as one replace
+                followed by ordered appends (default: None, always send in one request)
+            chunk_retries: How many times a failed chunk is retried before giving up. Appends
+                are only retried when the failure shows they were not applied (rate limit,
+                429/503, connection failure), so a timed-out append is never sent twice
+            chunk_retry_delay: Delay in seconds before the first retry (doubled for each further retry)
+            document_cache: Cache `get_json_document` / `get_markdown_document` results
+                (default: False). Writes made through this client drop the cached entry.
+            document_cache_size: Maximum number of cached entries, counting each format of a
+                document separately
+            document_cache_ttl: How long cached content stays valid, in seconds
+        """
+        super().__init__(*args, **kwargs)
+        self._document_fingerprints: Optional[DocumentFingerprintStore] = None
+        if skip_unchanged_writes:
+            self._document_fingerprints = DocumentFingerprintStore(
+                max_entries=fingerprint_limit,
+                path=fingerprint_path,
+            )
+        self._chunk_size = chunk_size
+        self._chunk_retries = chunk_retries
+        self._chunk_retry_delay = chunk_retry_delay
+        self._document_cache: Optional[DocumentCache] = None
+        if document_cache:
+            self._document_cache = DocumentCache(max_entries=document_cache_size, ttl=document_cache_ttl)
+
+    def _is_unchanged_write(self, document_id: str, fingerprint: str, force: bool) -> bool:
+        """Check whether this exact content was the last thing written to the document."""
+        store = self._document_fingerprints
+        if store is None or force or store.get(document_id) != fingerprint:
+            return False
+        if self.verbose:
+            print(f"Skipping unchanged write to document {document_id}")
+        return True
+
+    def _remember_write(self, document_id: str, fingerprint: Optional[str] = None) -> None:
+        """
+        Record that document content was written: drop cached content and record
+        the write fingerprint (or forget the document if the write was not fingerprinted).
+        """
+        if self._document_cache is not None:
+            self._document_cache.invalidate(document_id)
+        store = self._document_fingerprints
+        if store is None:
+            return
+        if fingerprint is None:
+            store.discard(document_id)
+        else:
+            store.set(document_id, fingerprint)
+
+    def _index_document(self, document_id: str, content: Any = None, title: Optional[str] = None, append: bool = False) -> None:
+        """Update the client's search index, if one is attached, with document text or title."""
+        index = self.search_index
+        if index is None:
+            return
+        if append:
+            index.append_document(document_id, content)
+        else:
+            index.add_document(document_id, content, title=title)
+
+    def _validate_content(self, content: Any) -> None:
+        """Reject invalid node trees before anything is sent."""
+        issues = validate_document(content, limit=10)
+        if issues:
+            details = "; ".join(f"{issue.path}: {issue.message}" for issue in issues)
+            raise VaizValidationError(f"Invalid document content: {details}")
+
+    def _request_with_retries(self, endpoint: str, json_data: Dict[str, Any], idempotent: bool) -> Dict[str, Any]:
+        """
+        Send one request, retrying transient failures (network, rate limit, server errors).
+
+        Idempotent requests (replaces) are retried after any transient failure.
+        Others (appends) are only retried when the failure shows the request was
+        not applied, so a chunk is never appended twice.
+        """
+        attempt = 0
+        while True:
+            try:
+                return self._make_request(endpoint, json_data=json_data)
+            except _NON_RETRYABLE_ERRORS:
+                raise
+            except VaizSDKError as e:
+                if attempt >= self._chunk_retries or not (idempotent or _was_not_applied(e)):
+                    raise
+                delay = self._chunk_retry_delay * (2 ** attempt)
+                attempt += 1
+                if self.verbose:
+                    print(f"{endpoint} failed ({e}); retry {attempt}/{self._chunk_retries} in {delay}s")
+                time.sleep(delay)
+
+    def _write_json_chunks(
+        self,
+        document_id: str,
+        content: List[Dict[str, Any]],
+        chunk_size: int,
+        replace: bool
+    ) -> Dict[str, Any]:
+        """
+        Write content as size-bounded chunks: an optional replace, then ordered appends.
+
+        Each chunk is retried on its own, so a transient failure never resends
+        chunks that were already written. An append that failed ambiguously
+        (e.g. a read timeout) is not retried and ends the write with
+        ``VaizChunkedWriteError``; that chunk may or may not be in the document.
+        """
+        chunks = split_content(content, chunk_size)
+        if replace and not chunks:
+            chunks = [[]]
+        if self.verbose and len(chunks) > 1:
+            print(f"Writing document {document_id} in {len(chunks)} chunks")
+
+        response_data: Dict[str, Any] = {}
+        for index, chunk in enumerate(chunks):
+            if replace and index == 0:
+                endpoint = "replaceJSONDocument"
+                request = ReplaceJSONDocumentRequest(document_id=document_id, content=chunk)
+            else:
+                endpoint = "appendJSONDocument"
+                request = AppendJSONDocumentRequest(document_id=document_id, content=chunk)
+            try:
+                # Encoded once, however many times the chunk is retried
+                response_data = self._request_with_retries(
+                    endpoint, EncodedJSON(request.model_dump()), idempotent=endpoint == "replaceJSONDocument"
+                )
+            except VaizSDKError as e:
+                if index == 0:
+                    # Nothing was written yet
+                    raise
+                # Earlier chunks are in the document; its content is now partial
+                self._remember_write(document_id)
+                raise VaizChunkedWriteError(
+                    f"Writing document {document_id} failed at chunk {index + 1}/{len(chunks)} "
+                    f"({index} chunk(s) already written): {e}",
+                    document_id=document_id,
+                    chunk_index=index,
+                    total_chunks=len(chunks),
+                ) from e
+        return response_data
+
+    def clear_document_cache(self, document_id: Optional[str] = None) -> None:
+        """
+        Drop cached document content.
+
+        Args:
+            document_id: Only drop this document (default: drop everything)
+        """
+        if self._document_cache is None:
+            return
+        if document_id is None:
+            self._document_cache.clear()
+        else:
+            self._document_cache.invalidate(document_id)
+        if self.verbose:
+            print("Document cache cleared")
+
     def get_json_document(self, document_id: str) -> Dict[str, Any]:
         """
         Fetch JSON document content by document ID.
@@ -47,16 +273,40 @@ class DocumentsAPIClient(BaseAPIClient):
 
         Returns:
             Dict[str, Any]: The JSON document as returned by the API (unmodeled)
+
+        Note:
+            With `VaizClient(..., document_cache=True)` repeated reads are served from
+            the cache until the TTL expires or this client writes to the document.
+
+        Tip:
+            Wrap the result in `DocumentTree` for indexed lookups by uid and node type:
+            >>> from vaiz import DocumentTree
+            >>> tree = DocumentTree(client.get_json_document(document_id))
+            >>> tree.headings
         """
-        request = GetDocumentRequest(document_id=document_id)
-        response_data = self._make_request("getJSONDocument", json_data=request.model_dump())
-        # API returns shape: { payload: { json: "{...}" }, type: "GetJSONDocument" }
-        payload = response_data.get("payload", {})
-        json_str = payload.get("json", "{}")
+        cache = self._document_cache
+        json_str = cache.get(document_id, "json") if cache is not None else None
+        if json_str is None:
+            generation = cache.generation(document_id) if cache is not None else None
+            request = GetDocumentRequest(document_id=document_id)
+            response_data = self._make_request("getJSONDocument", json_data=request.model_dump())
+            # API returns shape: { payload: { json: "{...}" }, type: "GetJSONDocument" }
+            payload = response_data.get("payload", {})
+            json_str = payload.get("json", "{}")
+            if cache is not None and isinstance(json_str, str):
+                cache.set(document_id, "json", json_str, generation)
+            fetched = True
+        else:
+            fetched = False
+            if self.verbose:
+                print(f"Cache hit for getJSONDocument ({document_id})")
+        # Parse on every call so callers always get their own copy
         try:
-            parsed = json.loads(json_str)
-        except (TypeError, json.JSONDecodeError):
+            parsed = self._decode_json(json_str)
+        except (TypeError, ValueError):
             parsed = {}
+        if fetched and isinstance(parsed, dict):
+            self._index_document(document_id, parsed)
         return parsed
 
     def replace_document(self, document_id: str, description: str) -> ReplaceDocumentResponse:
@@ -79,12 +329,17 @@ class DocumentsAPIClient(BaseAPIClient):
         )
         
         response_data = self._make_request("replaceDocument", json_data=request.model_dump())
+        self._remember_write(document_id)
+        self._index_document(document_id, description)
         return ReplaceDocumentResponse(**response_data)
 
     def replace_json_document(
         self, 
         document_id: str, 
-        content: Union[List[DocumentNode], List[Dict[str, Any]]]
+        content: Union[List[DocumentNode], List[Dict[str, Any]]],
+        force: bool = False,
+        chunk_size: Optional[int] = None,
+        validate: bool = False
     ) -> ReplaceJSONDocumentResponse:
         """
         Replace document content with structured JSON content.
@@ -99,12 +354,21 @@ class DocumentsAPIClient(BaseAPIClient):
         Args:
             document_id: The document ID to replace content for
             content: JSONContent array in document structure format, or use helper functions
+            force: Write even if the client was created with `skip_unchanged_writes=True`
+                and this content matches the last write to the document
+            chunk_size: Byte budget per request (overrides the client's `chunk_size`).
+                Larger content is sent as one replace followed by ordered appends,
+                retrying only the chunk that failed
+            validate: Check the content with `validate_document` first and raise
+                instead of sending an invalid node tree
 
         Returns:
-            ReplaceJSONDocumentResponse: Empty response object on success
+            ReplaceJSONDocumentResponse: Empty response object on success (also when the write was skipped)
 
         Raises:
+            VaizValidationError: If `validate` is set and the content is invalid
             VaizSDKError: If the API request fails
+            VaizChunkedWriteError: If a chunk after the first one fails; earlier chunks stay written
             
         Example with raw JSON:
             >>> content = [
@@ -128,13 +392,34 @@ class DocumentsAPIClient(BaseAPIClient):
             ...     )
             ... ]
             >>> client.replace_json_document(document_id, content)
+
+        Example with chunking for very large content:
+            >>> client.replace_json_document(document_id, huge_report, chunk_size=512 * 1024)
         """
+        if validate:
+            self._validate_content(content)
+
+        fingerprint = None
+        if self._document_fingerprints is not None:
+            fingerprint = "json:" + content_fingerprint(content)
+            if self._is_unchanged_write(document_id, fingerprint, force):
+                return ReplaceJSONDocumentResponse()
+
+        chunk_size = self._chunk_size if chunk_size is None else chunk_size
+        if chunk_size:
+            response_data = self._write_json_chunks(document_id, list(content), chunk_size, replace=True)
+            self._remember_write(document_id, fingerprint)
+            self._index_document(document_id, content)
+            return ReplaceJSONDocumentResponse(**response_data)
+
         request = ReplaceJSONDocumentRequest(
             document_id=document_id,
             content=content
         )
         
         response_data = self._make_request("replaceJSONDocument", json_data=request.model_dump())
+        self._remember_write(document_id, fingerprint)
+        self._index_document(document_id, content)
         return ReplaceJSONDocumentResponse(**response_data)
 
     def append_document(
@@ -172,12 +457,17 @@ class DocumentsAPIClient(BaseAPIClient):
         )
         
         response_data = self._make_request("appendDocument", json_data=request.model_dump())
+        self._remember_write(document_id)
+        if description:
+            self._index_document(document_id, description, append=True)
         return AppendDocumentResponse(**response_data)
 
     def append_json_document(
         self,
         document_id: str,
-        content: Union[List[DocumentNode], List[Dict[str, Any]]]
+        content: Union[List[DocumentNode], List[Dict[str, Any]]],
+        chunk_size: Optional[int] = None,
+        validate: bool = False
     ) -> AppendJSONDocumentResponse:
         """
         Append structured JSON content to an existing document.
@@ -188,12 +478,18 @@ class DocumentsAPIClient(BaseAPIClient):
         Args:
             document_id: The document ID to append content to
             content: JSONContent array in document structure format
+            chunk_size: Byte budget per request (overrides the client's `chunk_size`).
+                Larger content is sent as ordered appends, retrying only the chunk that failed
+            validate: Check the content with `validate_document` first and raise
+                instead of sending an invalid node tree
 
         Returns:
             AppendJSONDocumentResponse: Empty response object on success
 
         Raises:
+            VaizValidationError: If `validate` is set and the content is invalid
             VaizSDKError: If the API request fails
+            VaizChunkedWriteError: If a chunk after the first one fails; earlier chunks stay written
             
         Example with raw JSON:
             >>> content = [
@@ -211,15 +507,85 @@ class DocumentsAPIClient(BaseAPIClient):
             ... ]
             >>> client.append_json_document(document_id, content)
         """
+        if validate:
+            self._validate_content(content)
+
+        chunk_size = self._chunk_size if chunk_size is None else chunk_size
+        if chunk_size:
+            response_data = self._write_json_chunks(document_id, list(content), chunk_size, replace=False)
+            self._remember_write(document_id)
+            self._index_document(document_id, content, append=True)
+            return AppendJSONDocumentResponse(**response_data)
+
         request = AppendJSONDocumentRequest(
             document_id=document_id,
             content=content
         )
         
         response_data = self._make_request("appendJSONDocument", json_data=request.model_dump())
+        self._remember_write(document_id)
+        self._index_document(document_id, content, append=True)
         return AppendJSONDocumentResponse(**response_data)
 
-    def replace_markdown_document(self, document_id: str, markdown: str) -> ReplaceMarkdownDocumentResponse:
+    def update_json_document(
+        self,
+        document_id: str,
+        content: Union[List[DocumentNode], List[Dict[str, Any]]],
+        validate: bool = False
+    ) -> DocumentUpdatePlan:
+        """
+        Bring a document to the desired content with the smallest possible write.
+
+        The current content is fetched and compared with `content` node by node
+        (ignoring generated uids). If nothing changed, no write is made; if the
+        desired content only adds nodes at the end, just those nodes are sent
+        with `append_json_document`; otherwise the document is replaced.
+
+        Args:
+            document_id: The document ID to update
+            content: The full desired JSONContent array
+            validate: Check the content with `validate_document` before fetching anything
+
+        Returns:
+            DocumentUpdatePlan: The action taken ("none", "append" or "replace"),
+            the nodes sent and the number of bytes saved compared to a full replace
+
+        Raises:
+            VaizValidationError: If `validate` is set and the content is invalid
+            VaizSDKError: If an API request fails
+
+        Example:
+            >>> plan = client.update_json_document(document_id, [
+            ...     *report_sections,
+            ...     heading(2, "Week 42"),
+            ...     paragraph("New numbers"),
+            ... ])
+            >>> plan.action, plan.bytes_saved
+            ('append', 48213)
+        """
+        if validate:
+            self._validate_content(content)
+
+        current = self.get_json_document(document_id)
+        plan = plan_document_update(current, list(content))
+
+        if plan.action == "append":
+            self.append_json_document(document_id, plan.content)
+        elif plan.action == "replace":
+            # The plan was made against the live content, so a matching fingerprint
+            # of this client's last write is stale (the document changed since)
+            self.replace_json_document(document_id, plan.content, force=True)
+
+        if self.verbose:
+            print(f"update_json_document: {plan.action} ({plan.bytes_saved} bytes saved)")
+        return plan
+
+    def replace_markdown_document(
+        self,
+        document_id: str,
+        markdown: str,
+        force: bool = False
+    ) -> ReplaceMarkdownDocumentResponse:
         """
         Replace document content with Markdown content.
 
@@ -230,9 +596,11 @@ class DocumentsAPIClient(BaseAPIClient):
         Args:
             document_id: The document ID to replace content for
             markdown: New content as a Markdown string
+            force: Write even if the client was created with `skip_unchanged_writes=True`
+                and this content matches the last write to the document
 
         Returns:
-            ReplaceMarkdownDocumentResponse: Empty response object on success
+            ReplaceMarkdownDocumentResponse: Empty response object on success (also when the write was skipped)
 
         Raises:
             VaizSDKError: If the API request fails
@@ -243,12 +611,20 @@ class DocumentsAPIClient(BaseAPIClient):
             ...     markdown="# Title\\n\\nSome **bold** text\\n\\n- item 1\\n- item 2"
             ... )
         """
+        fingerprint = None
+        if self._document_fingerprints is not None:
+            fingerprint = "markdown:" + hashlib.sha256(markdown.encode("utf-8")).hexdigest()
+            if self._is_unchanged_write(document_id, fingerprint, force):
+                return ReplaceMarkdownDocumentResponse()
+
         request = ReplaceMarkdownDocumentRequest(
             document_id=document_id,
             markdown=markdown
         )
 
         response_data = self._make_request("replaceMarkdownDocument", json_data=request.model_dump())
+        self._remember_write(document_id, fingerprint)
+        self._index_document(document_id, markdown)
         return ReplaceMarkdownDocumentResponse(**response_data)
 
     def append_markdown_document(self, document_id: str, markdown: str) -> AppendMarkdownDocumentResponse:
@@ -281,6 +657,8 @@ class DocumentsAPIClient(BaseAPIClient):
         )
 
         response_data = self._make_request("appendMarkdownDocument", json_data=request.model_dump())
+        self._remember_write(document_id)
+        self._index_document(document_id, markdown, append=True)
         return AppendMarkdownDocumentResponse(**response_data)
 
     def get_markdown_document(self, document_id: str) -> str:
@@ -296,6 +674,9 @@ class DocumentsAPIClient(BaseAPIClient):
         Returns:
             str: The document content as a Markdown string
 
+        Note:
+            Cached like `get_json_document` when the client has `document_cache=True`.
+
         Raises:
             VaizSDKError: If the API request fails
 
@@ -305,9 +686,21 @@ class DocumentsAPIClient(BaseAPIClient):
             # Title
             Some **bold** text
         """
+        cache = self._document_cache
+        if cache is not None:
+            markdown = cache.get(document_id, "markdown")
+            if markdown is not None:
+                if self.verbose:
+                    print(f"Cache hit for getMarkdownDocument ({document_id})")
+                return markdown
+            generation = cache.generation(document_id)
+
         request = GetMarkdownDocumentRequest(document_id=document_id)
         response_data = self._make_request("getMarkdownDocument", json_data=request.model_dump())
         response = GetMarkdownDocumentResponse(**response_data)
+        if cache is not None:
+            cache.set(document_id, "markdown", response.markdown, generation)
+        self._index_document(document_id, response.markdown)
         return response.markdown
 
     def get_documents(self, request: GetDocumentsRequest) -> GetDocumentsResponse:
@@ -324,7 +717,10 @@ class DocumentsAPIClient(BaseAPIClient):
             VaizSDKError: If the API request fails
         """
         response_data = self._make_request("getDocuments", json_data=request.model_dump())
-        return GetDocumentsResponse(**response_data)
+        response = GetDocumentsResponse(**response_data)
+        for document in response.payload.documents:
+            self._index_document(document.id, title=document.title)
+        return response
 
     def create_document(self, request: CreateDocumentRequest) -> CreateDocumentResponse:
         """
@@ -340,7 +736,9 @@ class DocumentsAPIClient(BaseAPIClient):
             VaizSDKError: If the API request fails
         """
         response_data = self._make_request("createDocument", json_data=request.model_dump())
-        return CreateDocumentResponse(**response_data)
+        response = CreateDocumentResponse(**response_data)
+        self._index_document(response.payload.document.id, title=response.payload.document.title)
+        return response
 
     def edit_document(self, request: EditDocumentRequest) -> EditDocumentResponse:
         """
@@ -356,6 +754,7 @@ class DocumentsAPIClient(BaseAPIClient):
             VaizSDKError: If the API request fails
         """
         response_data = self._make_request("editDocument", json_data=request.model_dump())
+        self._index_document(request.document_id, title=request.title)
         return EditDocumentResponse(**response_data)
 
 
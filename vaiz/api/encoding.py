@@ -0,0 +1,136 @@
+"""
+JSON encoding of request bodies and decoding of responses.
+
+A request payload is encoded once, to compact UTF-8 JSON with sorted keys, and
+the same bytes serve as the HTTP body, the input of cache keys and the verbose
+log line. orjson is used when it is installed; otherwise the standard library
+``json`` module produces the same canonical form.
+
+Responses are decoded straight from the body bytes by a pluggable decoder:
+orjson or msgspec when installed, the standard library otherwise.
+"""
+
+import json
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # msgspec is optional
+    msgspec = None
+
+
+JSONDecoder = Callable[[Union[bytes, str]], Any]
+
+JSON_DECODERS = ("auto", "orjson", "msgspec", "json")
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def encode_json(data: Any) -> bytes:
+    """
+    Encode data as canonical JSON: compact, sorted keys, UTF-8.
+
+    Args:
+        data: JSON-compatible data; datetimes and dates are written as ISO 8601 strings
+
+    Returns:
+        bytes: The encoded JSON
+
+    Raises:
+        TypeError: If the data contains a value that cannot be encoded
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # e.g. integers beyond 64 bits, which the standard library still encodes
+            pass
+    return json.dumps(
+        data, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=_default
+    ).encode("utf-8")
+
+
+class EncodedJSON(dict):
+    """
+    A request payload together with its encoded body.
+
+    Behaves like the payload dict, so it can be passed anywhere ``json_data``
+    is accepted; ``_make_request`` then sends ``body`` instead of encoding the
+    payload again. Treat it as read-only: ``body`` is not updated when the
+    dict changes.
+
+    Example:
+        >>> payload = EncodedJSON(request.model_dump(by_alias=True))
+        >>> cache_key = hashlib.md5(payload.body).hexdigest()
+        >>> client._make_request("getTasks", json_data=payload)
+    """
+
+    __slots__ = ("body",)
+
+    def __init__(self, data: Dict[str, Any]):
+        super().__init__(data)
+        self.body = encode_json(data)
+
+
+def get_json_decoder(name: Union[str, JSONDecoder] = "auto") -> JSONDecoder:
+    """
+    Return a function that decodes JSON from bytes or str.
+
+    The orjson and msgspec decoders fall back to the standard library for
+    input they reject but ``json`` accepts (e.g. integers beyond 64 bits or
+    ``NaN``), so every decoder accepts the same documents.
+
+    Args:
+        name: "auto" (orjson, then msgspec, then the standard library, whichever
+            is installed first), "orjson", "msgspec", "json", or a decoder function
+            to use as-is
+
+    Returns:
+        JSONDecoder: The decoder; it raises ``ValueError`` for invalid JSON
+
+    Raises:
+        ValueError: If the name is not one of ``JSON_DECODERS``
+        ImportError: If the requested library is not installed
+    """
+    if callable(name):
+        return name
+    if name not in JSON_DECODERS:
+        raise ValueError(f"json_decoder must be one of {JSON_DECODERS} or a callable, got {name!r}")
+    if name == "auto":
+        name = "orjson" if orjson is not None else "msgspec" if msgspec is not None else "json"
+
+    if name == "json":
+        return json.loads
+    if name == "orjson":
+        if orjson is None:
+            raise ImportError("json_decoder='orjson' requires the orjson package")
+        fast, errors = orjson.loads, (ValueError,)
+    else:
+        if msgspec is None:
+            raise ImportError("json_decoder='msgspec' requires the msgspec package")
+        fast, errors = msgspec.json.decode, (ValueError, msgspec.DecodeError)
+
+    def decode(data: Union[bytes, str]) -> Any:
+        try:
+            return fast(data)
+        except errors:
+            return json.loads(data)
+    return decode
+
+
+__all__ = [
+    'encode_json',
+    'EncodedJSON',
+    'get_json_decoder',
+    'JSON_DECODERS',
+]
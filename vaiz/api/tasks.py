@@ -1,5 +1,9 @@
 from vaiz.api.base import BaseAPIClient
+from vaiz.api.encoding import EncodedJSON
+from vaiz.helpers.document_tree import ChecklistProgress, count_checklist
 from vaiz.models import (
+    Task,
+    TaskView,
     CreateTaskRequest,
     TaskResponse,
     EditTaskRequest,
@@ -12,18 +16,38 @@ from vaiz.models import (
     MoveTasksRequest,
     MoveTasksResponse,
 )
-from typing import Optional, Dict, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any, Optional, Dict, Iterable, Iterator, List, Tuple, Union
 from datetime import datetime, timedelta
 import os
 import hashlib
-import json
+
+
+# getTasks returns at most this many tasks per request
+_TASKS_PAGE_SIZE = 50
+
+
+@dataclass
+class ChecklistProgressResult:
+    """
+    Outcome of ``checklist_progress``.
+
+    Attributes:
+        tasks: Task ID -> checklist counts of its description, in the order the tasks were given
+        total: Counts summed over all tasks in ``tasks``
+        failed: Task ID -> error message for tasks that were not found or whose description could not be fetched
+    """
+    tasks: Dict[str, ChecklistProgress] = field(default_factory=dict)
+    total: ChecklistProgress = field(default_factory=ChecklistProgress)
+    failed: Dict[str, str] = field(default_factory=dict)
 
 
 class TasksAPIClient(BaseAPIClient):
     def __init__(self, *args, **kwargs):
         """Initialize TasksAPIClient with caching support."""
         super().__init__(*args, **kwargs)
-        self._tasks_cache: Dict[str, Tuple[GetTasksResponse, datetime]] = {}
+        self._tasks_cache: Dict[str, Tuple[Any, datetime]] = {}
         self._cache_ttl = timedelta(minutes=5)  # 5 minutes cache TTL
     def create_task(
         self,
@@ -88,7 +112,7 @@ class TasksAPIClient(BaseAPIClient):
         response_data = self._make_request(
             "createTask", json_data=task.model_dump(by_alias=True)
         )
-        return TaskResponse(**response_data)
+        return self._index_task_response(TaskResponse(**response_data))
 
     def edit_task(self, task: EditTaskRequest) -> TaskResponse:
         """
@@ -103,7 +127,7 @@ class TasksAPIClient(BaseAPIClient):
         response_data = self._make_request(
             "editTask", json_data=task.model_dump(by_alias=True)
         )
-        return TaskResponse(**response_data)
+        return self._index_task_response(TaskResponse(**response_data))
 
     def get_task(self, slug: str) -> TaskResponse:
         """
@@ -116,7 +140,14 @@ class TasksAPIClient(BaseAPIClient):
             TaskResponse: The task information
         """
         response_data = self._make_request("getTask", json_data={"slug": slug})
-        return TaskResponse(**response_data)
+        return self._index_task_response(TaskResponse(**response_data))
+
+    def _index_task_response(self, response: TaskResponse) -> TaskResponse:
+        """Add the returned task to the client's search index, if one is attached."""
+        task = response.payload.get("task")
+        if self.search_index is not None and task:
+            self.search_index.add_task(task)
+        return response
 
     def get_history(self, request: GetHistoryRequest) -> GetHistoryResponse:
         """
@@ -147,15 +178,98 @@ class TasksAPIClient(BaseAPIClient):
         )
         return MoveTasksResponse(**response_data)
 
-    def _get_cache_key(self, request: GetTasksRequest) -> str:
-        """Generate a unique cache key for the request."""
-        # Create a deterministic string from request parameters
-        request_dict = request.model_dump(by_alias=True)
-        request_str = json.dumps(request_dict, sort_keys=True)
-        # Add space_id to make cache unique per space
-        cache_str = f"{self.space_id}:{request_str}"
-        # Create a hash for the cache key
-        return hashlib.md5(cache_str.encode()).hexdigest()
+    def checklist_progress(
+        self,
+        tasks: Iterable[Union[str, Task]],
+        concurrency: int = 4
+    ) -> ChecklistProgressResult:
+        """
+        Count checked and unchecked checklist items in the descriptions of many tasks.
+
+        Task IDs are resolved with batched `get_tasks` calls (`Task` objects are
+        used as they are), then the description documents are fetched with
+        `concurrency` parallel requests, or taken from the document cache when
+        the client has one. Each description is counted as soon as it arrives.
+
+        Args:
+            tasks: Task IDs and/or `Task` objects (e.g. from `get_tasks`)
+            concurrency: Maximum number of parallel requests (default: 4)
+
+        Returns:
+            ChecklistProgressResult: Per-task and aggregate counts, plus failures
+
+        Raises:
+            ValueError: If concurrency is less than 1
+            VaizSDKError: If resolving task IDs fails (description errors are
+                reported per task in the result instead)
+
+        Example:
+            >>> progress = client.checklist_progress(task_ids, concurrency=8)
+            >>> progress.total.checked, progress.total.total, progress.total.percent
+            (42, 60, 70.0)
+            >>> progress.tasks[task_ids[0]].unchecked
+            2
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        documents: Dict[str, str] = {}
+        order: Dict[str, None] = {}
+        unresolved: List[str] = []
+        for task in tasks:
+            task_id = task if isinstance(task, str) else task.id
+            if task_id in order:
+                continue
+            order[task_id] = None
+            if isinstance(task, str):
+                unresolved.append(task_id)
+            else:
+                documents[task_id] = task.document
+
+        result = ChecklistProgressResult()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            batches = [
+                unresolved[start:start + _TASKS_PAGE_SIZE]
+                for start in range(0, len(unresolved), _TASKS_PAGE_SIZE)
+            ]
+            for response in executor.map(
+                lambda batch: self.get_tasks(GetTasksRequest(ids=batch, limit=len(batch))), batches
+            ):
+                for task in response.payload.tasks:
+                    documents[task.id] = task.document
+            for task_id in unresolved:
+                if task_id not in documents:
+                    result.failed[task_id] = "Task not found"
+
+            counts: Dict[str, ChecklistProgress] = {}
+            checked = total = 0
+            futures = {
+                executor.submit(self.get_json_document, documents[task_id]): task_id
+                for task_id in order if task_id in documents
+            }
+            for future in as_completed(futures):
+                task_id = futures[future]
+                try:
+                    progress = count_checklist(future.result())
+                except Exception as e:
+                    result.failed[task_id] = str(e)
+                    if self.verbose:
+                        print(f"Failed to fetch description of task {task_id}: {e}")
+                    continue
+                counts[task_id] = progress
+                checked += progress.checked
+                total += progress.total
+
+        result.tasks = {task_id: counts[task_id] for task_id in order if task_id in counts}
+        result.total = ChecklistProgress(checked, total)
+        return result
+
+    def _get_cache_key(self, request: GetTasksRequest, payload: Optional[EncodedJSON] = None) -> str:
+        """Generate a unique cache key for the request (reusing its encoded body when given)."""
+        if payload is None:
+            payload = EncodedJSON(request.model_dump(by_alias=True))
+        # The body is canonical JSON (sorted keys); space_id makes the key unique per space
+        return hashlib.md5(self.space_id.encode() + b":" + payload.body).hexdigest()
     
     def _is_cache_valid(self, cached_time: datetime) -> bool:
         """Check if cached data is still valid (within TTL)."""
@@ -182,35 +296,106 @@ class TasksAPIClient(BaseAPIClient):
             Caching is mandatory for API protection. The same request will return cached
             results for 5 minutes to prevent excessive API calls.
         """
-        # Generate cache key
-        cache_key = self._get_cache_key(request)
+        payload = EncodedJSON(request.model_dump(by_alias=True))
+        cache_key = self._get_cache_key(request, payload)
+        cached = self._get_cached_tasks(cache_key)
+        if cached is not None:
+            return cached
+
+        response_data = self._make_request("getTasks", json_data=payload)
+        response = GetTasksResponse(**response_data)
+        if self.search_index is not None:
+            self.search_index.add_tasks(response.payload.tasks)
         
-        # Check cache (mandatory for API protection)
+        self._cache_tasks(cache_key, response)
+        return response
+
+    def get_task_views(self, request: GetTasksRequest) -> List[TaskView]:
+        """
+        Get tasks as lazy `TaskView` objects instead of validated `Task` models.
+
+        Same request, filters and caching as `get_tasks`, but no field is
+        converted until it is read, which makes reading a few fields of many
+        tasks much cheaper. Call `to_model()` on a view to get a full `Task`.
+
+        Args:
+            request (GetTasksRequest): The request containing filter and pagination parameters
+
+        Returns:
+            List[TaskView]: The tasks of the page (max 50)
+
+        Example:
+            >>> views = client.get_task_views(GetTasksRequest(board=board_id))
+            >>> load = Counter(user for view in views for user in view.assignees)
+        """
+        payload = EncodedJSON(request.model_dump(by_alias=True))
+        cache_key = "views:" + self._get_cache_key(request, payload)
+        cached = self._get_cached_tasks(cache_key)
+        if cached is not None:
+            return cached
+
+        response_data = self._make_request("getTasks", json_data=payload)
+        tasks = response_data.get("payload", {}).get("tasks", [])
+        if self.search_index is not None:
+            self.search_index.add_tasks(tasks)
+        views = [TaskView(task) for task in tasks]
+        self._cache_tasks(cache_key, views)
+        return views
+
+    def iter_tasks(
+        self,
+        request: Optional[GetTasksRequest] = None,
+        views: bool = False
+    ) -> Iterator[Union[Task, TaskView]]:
+        """
+        Iterate over all tasks matching a request, fetching pages as needed.
+
+        Pages of `request.limit` tasks (default 50) are requested with an
+        increasing `skip` until a short page is returned. Each page goes
+        through `get_tasks` (or `get_task_views`), so pages are cached.
+
+        Args:
+            request (Optional[GetTasksRequest]): Filters and starting `skip` (default: all tasks)
+            views (bool): Yield lazy `TaskView` objects instead of `Task` models
+
+        Yields:
+            Task or TaskView: Tasks in server order
+
+        Example:
+            >>> for view in client.iter_tasks(GetTasksRequest(project=project_id), views=True):
+            ...     if view.due_end and not view.completed:
+            ...         ...
+        """
+        page = request.model_copy() if request is not None else GetTasksRequest()
+        while True:
+            if views:
+                tasks: List[Any] = self.get_task_views(page)
+            else:
+                tasks = self.get_tasks(page).payload.tasks
+            yield from tasks
+            if len(tasks) < (page.limit or _TASKS_PAGE_SIZE):
+                return
+            page = page.model_copy(update={"skip": (page.skip or 0) + len(tasks)})
+
+    def _get_cached_tasks(self, cache_key: str) -> Any:
+        """Return a cached getTasks result if it is still valid (None otherwise)."""
+        # Caching is mandatory for API protection
         if cache_key in self._tasks_cache:
             cached_response, cached_time = self._tasks_cache[cache_key]
             if self._is_cache_valid(cached_time):
                 if self.verbose:
                     print(f"Cache hit for getTasks (key: {cache_key[:8]}...)")
                 return cached_response
-            else:
-                # Remove expired cache entry
-                del self._tasks_cache[cache_key]
-                if self.verbose:
-                    print(f"Cache expired for getTasks (key: {cache_key[:8]}...)")
-        
-        # Make API request
+            # Remove expired cache entry
+            del self._tasks_cache[cache_key]
+            if self.verbose:
+                print(f"Cache expired for getTasks (key: {cache_key[:8]}...)")
         if self.verbose:
             print(f"Cache miss for getTasks (key: {cache_key[:8]}...)")
-        
-        response_data = self._make_request(
-            "getTasks", json_data=request.model_dump(by_alias=True)
-        )
-        response = GetTasksResponse(**response_data)
-        
-        # Store in cache (mandatory for API protection)
+        return None
+
+    def _cache_tasks(self, cache_key: str, response: Any) -> None:
         self._tasks_cache[cache_key] = (response, datetime.now())
         if self.verbose:
             print(f"Cached getTasks response (key: {cache_key[:8]}...)")
-        
-        return response
 
@@ -1,6 +1,7 @@
 from vaiz.api.base import BaseAPIClient
 from vaiz.models import UploadFileResponse
 from vaiz.models.enums import UploadFileType
+from vaiz.helpers.image_metadata import read_image_info
 from typing import IO, Optional
 import os
 import requests
@@ -33,7 +34,9 @@ class UploadAPIClient(BaseAPIClient):
             response = self.session.post(url, files=files, verify=self.verify_ssl)
         response.raise_for_status()
         response_data = response.json()
-        return UploadFileResponse(**response_data)
+        upload_response = UploadFileResponse(**response_data)
+        self._fill_image_metadata(upload_response, file_path)
+        return upload_response
 
     def upload_file_from_url(self, file_url: str, file_type: Optional[UploadFileType] = None, filename: Optional[str] = None) -> UploadFileResponse:
         """
@@ -82,7 +85,9 @@ class UploadAPIClient(BaseAPIClient):
                     response = self.session.post(url, files=files, verify=self.verify_ssl)
                 response.raise_for_status()
                 response_data = response.json()
-                return UploadFileResponse(**response_data)
+                upload_response = UploadFileResponse(**response_data)
+                self._fill_image_metadata(upload_response, temp_file.name)
+                return upload_response
             finally:
                 # Clean up temporary file
                 try:
@@ -90,6 +95,29 @@ class UploadAPIClient(BaseAPIClient):
                 except OSError:
                     pass
 
+    def _fill_image_metadata(self, upload_response: UploadFileResponse, file_path: str) -> None:
+        """
+        Fill in image dimensions and MIME type from the local file header
+        when the server response does not include them.
+
+        Args:
+            upload_response (UploadFileResponse): The parsed upload response.
+            file_path (str): Path to the local copy of the uploaded file.
+        """
+        uploaded_file = upload_response.file
+        if uploaded_file.type != UploadFileType.Image:
+            return
+        if uploaded_file.dimension and uploaded_file.mime:
+            return
+
+        info = read_image_info(file_path)
+        if info is None:
+            return
+        if not uploaded_file.dimension:
+            uploaded_file.dimension = info.dimensions
+        if not uploaded_file.mime:
+            uploaded_file.mime = info.mime
+
     def _detect_file_type_from_url_and_content(self, file_url: str, content_type: Optional[str]) -> UploadFileType:
         """
         Detect file type from URL extension and content type.
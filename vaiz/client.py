@@ -7,11 +7,12 @@ from vaiz.api.milestones import MilestonesAPIClient
 from vaiz.api.upload import UploadAPIClient
 from vaiz.api.comments import CommentsAPIClient
 from vaiz.api.documents import DocumentsAPIClient
+from vaiz.api.document_sync import DocumentSyncAPIClient
 from vaiz.api.spaces import SpacesAPIClient
 from vaiz.api.members import MembersAPIClient
 
 
-class VaizClient(TasksAPIClient, BoardsAPIClient, ProfileAPIClient, ProjectsAPIClient, MilestonesAPIClient, UploadAPIClient, CommentsAPIClient, DocumentsAPIClient, SpacesAPIClient, MembersAPIClient):
+class VaizClient(TasksAPIClient, BoardsAPIClient, ProfileAPIClient, ProjectsAPIClient, MilestonesAPIClient, UploadAPIClient, CommentsAPIClient, DocumentSyncAPIClient, DocumentsAPIClient, SpacesAPIClient, MembersAPIClient):
     """
     Main client for interacting with the Vaiz API.
     This class inherits all task-related operations from TasksAPIClient,
@@ -22,6 +23,7 @@ class VaizClient(TasksAPIClient, BoardsAPIClient, ProfileAPIClient, ProjectsAPIC
     upload-related operations from UploadAPIClient,
     comment-related operations from CommentsAPIClient,
     document-related operations from DocumentsAPIClient,
+    bulk document export from DocumentSyncAPIClient,
     space-related operations from SpacesAPIClient,
     and member-related operations from MembersAPIClient.
     """
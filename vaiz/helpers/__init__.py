@@ -5,247 +5,218 @@ This module provides convenient helper functions for common operations
 with the Vaiz SDK, making it easier to work with complex API requests.
 """
 
-from .custom_fields import (
-    # Field creation helpers
-    make_text_field,
-    make_number_field,
-    make_checkbox_field,
-    make_date_field,
-    make_member_field,
-    make_task_relations_field,
-    make_select_field,
-    make_url_field,
-    
-    # Select field option helpers
-    make_select_option,
-    SelectOption,
-    add_board_custom_field_select_option,
-    remove_board_custom_field_select_option,
-    edit_board_custom_field_select_field_option,
-    
-    # Field editing helpers
-    edit_custom_field_name,
-    edit_custom_field_description,
-    edit_custom_field_visibility,
-    edit_custom_field_complete,
-    
-    # Task relations helpers
-    make_task_relation_value,
-    add_task_relation,
-    remove_task_relation,
-    
-    # Member field helpers
-    make_member_value,
-    add_member_to_field,
-    remove_member_from_field,
-    
-    # Date field helpers
-    make_date_value,
-    make_date_range_value,
-    
-    # Value formatting helpers
-    make_text_value,
-    make_number_value,
-    make_checkbox_value,
-    make_url_value,
-)
+from typing import TYPE_CHECKING
 
-from .document_structure import (
-    # Document structure node builders
-    text,
-    paragraph,
-    heading,
-    list_item,
-    bullet_list,
-    ordered_list,
-    task_item,
-    task_list,
-    link_text,
-    horizontal_rule,
-    blockquote,
-    details,
-    details_summary,
-    details_content,
-    table,
-    table_row,
-    table_cell,
-    table_header,
-    mention,
-    mention_user,
-    mention_document,
-    mention_task,
-    mention_milestone,
-    image_block,
-    files_block,
-    toc_block,
-    anchors_block,
-    siblings_block,
-    code_block,
-    embed_block,
-    
-    # Document structure types
-    DocumentNode,
-    TextNode,
-    ParagraphNode,
-    HeadingNode,
-    BulletListNode,
-    OrderedListNode,
-    ListItemNode,
-    TaskListNode,
-    TaskItemNode,
-    TaskListAttrs,
-    TaskItemAttrs,
-    TableNode,
-    TableRowNode,
-    TableCellNode,
-    TableHeaderNode,
-    TableCellOrHeader,
-    HorizontalRuleNode,
-    BlockquoteNode,
-    DetailsNode,
-    DetailsSummaryNode,
-    DetailsContentNode,
-    Mark,
-    MentionNode,
-    MentionAttrs,
-    MentionData,
-    MentionItem,
-    ImageBlockNode,
-    ImageBlockAttrs,
-    ImageBlockData,
-    FilesBlockNode,
-    FilesBlockAttrs,
-    FilesBlockData,
-    FileItem,
-    DocSiblingsNode,
-    DocSiblingsAttrs,
-    DocSiblingsData,
-    CodeBlockNode,
-    CodeBlockAttrs,
-    EmbedBlockNode,
-    EmbedBlockAttrs,
-    EmbedBlockData,
-    EmbedType,
-)
+from .._lazy import attach
 
-__all__ = [
-    # Document structure builders
-    'text',
-    'paragraph', 
-    'heading',
-    'list_item',
-    'bullet_list',
-    'ordered_list',
-    'task_item',
-    'task_list',
-    'link_text',
-    'horizontal_rule',
-    'blockquote',
-    'details',
-    'details_summary',
-    'details_content',
-    'table',
-    'table_row',
-    'table_cell',
-    'table_header',
-    'mention',
-    'mention_user',
-    'mention_document',
-    'mention_task',
-    'mention_milestone',
-    'image_block',
-    'files_block',
-    'toc_block',
-    'anchors_block',
-    'siblings_block',
-    'code_block',
-    'embed_block',
-    
-    # Document structure types
-    'DocumentNode',
-    'TextNode',
-    'ParagraphNode',
-    'HeadingNode',
-    'BulletListNode',
-    'OrderedListNode',
-    'ListItemNode',
-    'TaskListNode',
-    'TaskItemNode',
-    'TaskListAttrs',
-    'TaskItemAttrs',
-    'TableNode',
-    'TableRowNode',
-    'TableCellNode',
-    'TableHeaderNode',
-    'TableCellOrHeader',
-    'HorizontalRuleNode',
-    'BlockquoteNode',
-    'DetailsNode',
-    'DetailsSummaryNode',
-    'DetailsContentNode',
-    'Mark',
-    'MentionNode',
-    'MentionAttrs',
-    'MentionData',
-    'MentionItem',
-    'ImageBlockNode',
-    'ImageBlockAttrs',
-    'ImageBlockData',
-    'FilesBlockNode',
-    'FilesBlockAttrs',
-    'FilesBlockData',
-    'FileItem',
-    'DocSiblingsNode',
-    'DocSiblingsAttrs',
-    'DocSiblingsData',
-    'CodeBlockNode',
-    'CodeBlockAttrs',
-    'EmbedBlockNode',
-    'EmbedBlockAttrs',
-    'EmbedBlockData',
-    'EmbedType',
+# Helper modules are imported on first use of one of their names
+_EXPORTS = {
+    '.custom_fields': [
+        # Field creation helpers
+        'make_text_field',
+        'make_number_field',
+        'make_checkbox_field',
+        'make_date_field',
+        'make_member_field',
+        'make_task_relations_field',
+        'make_select_field',
+        'make_url_field',
     
-    # Custom fields (existing)
-    # Field creation helpers
-    'make_text_field',
-    'make_number_field', 
-    'make_checkbox_field',
-    'make_date_field',
-    'make_member_field',
-    'make_task_relations_field',
-    'make_select_field',
-    'make_url_field',
+        # Select field option helpers
+        'make_select_option',
+        'SelectOption',
+        'add_board_custom_field_select_option',
+        'remove_board_custom_field_select_option',
+        'edit_board_custom_field_select_field_option',
     
-    # Select field option helpers
-    'make_select_option',
-    'SelectOption',
-    'add_board_custom_field_select_option',
-    'remove_board_custom_field_select_option',
-    'edit_board_custom_field_select_field_option',
+        # Field editing helpers
+        'edit_custom_field_name',
+        'edit_custom_field_description',
+        'edit_custom_field_visibility',
+        'edit_custom_field_complete',
     
-    # Field editing helpers
-    'edit_custom_field_name',
-    'edit_custom_field_description',
-    'edit_custom_field_visibility',
-    'edit_custom_field_complete',
+        # Task relations helpers
+        'make_task_relation_value',
+        'add_task_relation',
+        'remove_task_relation',
     
-    # Task relations helpers
-    'make_task_relation_value',
-    'add_task_relation',
-    'remove_task_relation',
+        # Member field helpers
+        'make_member_value',
+        'add_member_to_field',
+        'remove_member_from_field',
     
-    # Member field helpers
-    'make_member_value',
-    'add_member_to_field',
-    'remove_member_from_field',
+        # Date field helpers
+        'make_date_value',
+        'make_date_range_value',
     
-    # Date field helpers
-    'make_date_value',
-    'make_date_range_value',
+        # Value formatting helpers
+        'make_text_value',
+        'make_number_value',
+        'make_checkbox_value',
+        'make_url_value',
+    ],
+    '.document_structure': [
+        # Document structure node builders
+        'text',
+        'paragraph',
+        'heading',
+        'list_item',
+        'bullet_list',
+        'ordered_list',
+        'task_item',
+        'task_list',
+        'link_text',
+        'horizontal_rule',
+        'blockquote',
+        'details',
+        'details_summary',
+        'details_content',
+        'table',
+        'table_row',
+        'table_cell',
+        'table_header',
+        'mention',
+        'mention_user',
+        'mention_document',
+        'mention_task',
+        'mention_milestone',
+        'image_block',
+        'files_block',
+        'toc_block',
+        'anchors_block',
+        'siblings_block',
+        'code_block',
+        'embed_block',
     
-    # Value formatting helpers
-    'make_text_value',
-    'make_number_value',
-    'make_checkbox_value',
-    'make_url_value',
-] 
\ No newline at end of file
+        # Document structure types
+        'DocumentNode',
+        'TextNode',
+        'ParagraphNode',
+        'HeadingNode',
+        'BulletListNode',
+        'OrderedListNode',
+        'ListItemNode',
+        'TaskListNode',
+        'TaskItemNode',
+        'TaskListAttrs',
+        'TaskItemAttrs',
+        'TableNode',
+        'TableRowNode',
+        'TableCellNode',
+        'TableHeaderNode',
+        'TableCellOrHeader',
+        'HorizontalRuleNode',
+        'BlockquoteNode',
+        'DetailsNode',
+        'DetailsSummaryNode',
+        'DetailsContentNode',
+        'Mark',
+        'MentionNode',
+        'MentionAttrs',
+        'MentionData',
+        'MentionItem',
+        'ImageBlockNode',
+        'ImageBlockAttrs',
+        'ImageBlockData',
+        'FilesBlockNode',
+        'FilesBlockAttrs',
+        'FilesBlockData',
+        'FileItem',
+        'DocSiblingsNode',
+        'DocSiblingsAttrs',
+        'DocSiblingsData',
+        'CodeBlockNode',
+        'CodeBlockAttrs',
+        'EmbedBlockNode',
+        'EmbedBlockAttrs',
+        'EmbedBlockData',
+        'EmbedType',
+    ],
+    '.document_tree': [
+        # Indexed document tree
+        'DocumentTree',
+        'extract_mentions',
+        'ChecklistProgress',
+        'count_checklist',
+    ],
+    '.document_diff': [
+        # Document diff and update planning
+        'DocumentUpdatePlan',
+        'plan_document_update',
+        'canonical_json',
+        'content_fingerprint',
+    ],
+    '.image_metadata': [
+        # Client-side image metadata
+        'ImageInfo',
+        'read_image_info',
+        'estimate_dominant_color',
+    ],
+    '.document_builder': [
+        # Streaming document builder
+        'DocumentBuilder',
+        'UidPool',
+    ],
+    '.document_template': [
+        # Compiled document templates
+        'DocumentTemplate',
+        'slot',
+    ],
+    '.document_tables': [
+        # Tables from rows/CSV and back
+        'TableData',
+        'table_from_rows',
+        'table_from_csv',
+        'table_rows',
+        'extract_tables',
+    ],
+    '.document_validation': [
+        # Local node tree validation
+        'DocumentIssue',
+        'validate_document',
+    ],
+    '.document_chunks': [
+        # Size-aware content chunking
+        'split_content',
+    ],
+    '.markdown': [
+        # Offline Markdown conversion
+        'markdown_to_nodes',
+        'iter_markdown_nodes',
+        'nodes_to_markdown',
+        'iter_markdown',
+    ],
+    '.search': [
+        # Local full-text search
+        'SearchIndex',
+        'SearchHit',
+        'tokenize',
+    ],
+    '.mention_index': [
+        # Mention backlinks
+        'MentionIndex',
+    ],
+    '.task_table': [
+        # Columnar task analytics
+        'TaskTable',
+    ],
+}
+__getattr__, __dir__ = attach(__name__, _EXPORTS)
+
+if TYPE_CHECKING:
+    from .custom_fields import *  # noqa: F401,F403
+    from .document_structure import *  # noqa: F401,F403
+    from .document_tree import *  # noqa: F401,F403
+    from .document_diff import *  # noqa: F401,F403
+    from .image_metadata import *  # noqa: F401,F403
+    from .document_builder import *  # noqa: F401,F403
+    from .document_template import *  # noqa: F401,F403
+    from .document_tables import *  # noqa: F401,F403
+    from .document_validation import *  # noqa: F401,F403
+    from .document_chunks import *  # noqa: F401,F403
+    from .markdown import *  # noqa: F401,F403
+    from .search import *  # noqa: F401,F403
+    from .mention_index import *  # noqa: F401,F403
+    from .task_table import *  # noqa: F401,F403
+
+__all__ = [name for names in _EXPORTS.values() for name in names]
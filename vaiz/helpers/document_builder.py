@@ -0,0 +1,404 @@
+"""
+Incremental builder for large documents.
+
+The builder functions in ``document_structure`` return complete dict trees,
+which is convenient for small documents but means a 50,000-row table exists in
+memory as several hundred thousand dicts before it is serialized.
+``DocumentBuilder`` instead records tables and lists as lazy blocks over the
+caller's rows/items and serializes them row by row, so output can be streamed
+to a file (or any writer) with memory bounded by a single batch of rows.
+"""
+
+import json
+import os
+import threading
+from json.encoder import encode_basestring
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple, Union
+
+from .document_structure import (
+    DocumentNode,
+    bullet_list,
+    heading,
+    list_item,
+    ordered_list,
+    paragraph,
+    table,
+    table_cell,
+    table_header,
+    table_row,
+    task_item,
+    task_list,
+)
+
+
+# Number of rows/items serialized per output chunk
+_CHUNK_ROWS = 256
+# Hex characters per uid, as generated by ``document_structure._short_id``
+_UID_LENGTH = 11
+
+_dumps = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
+_PARAGRAPH_OPEN = '{"type":"paragraph","content":[{"type":"text","text":'
+_PARAGRAPH_CLOSE = '}]}'
+_CELL_OPEN = '{"type":"tableCell","attrs":{"colspan":1,"rowspan":1},"content":['
+_HEADER_OPEN = '{"type":"tableHeader","attrs":{"colspan":1,"rowspan":1},"content":['
+_CELL_CLOSE = ']}'
+_LIST_ITEM_OPEN = '{"type":"listItem","content":['
+_LIST_ITEM_CLOSE = ']}'
+
+CellValue = Union[str, int, float, bool, None, Dict[str, Any]]
+TaskItemValue = Union[str, Tuple[str, bool], Dict[str, Any]]
+
+
+class UidPool:
+    """
+    Batched generator of block uids in the ``_short_id()`` format (11 hex characters).
+
+    Draws random bytes for many uids at once and slices them out, which is
+    several times faster than generating each uid separately. A pool can be
+    shared between threads.
+
+    Example:
+        >>> next_uid = UidPool()
+        >>> len(next_uid())
+        11
+    """
+
+    __slots__ = ("_batch_size", "_buffer", "_position", "_lock")
+
+    def __init__(self, batch_size: int = 512):
+        """
+        Initialize the pool.
+
+        Args:
+            batch_size: Number of uids generated per refill
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self._batch_size = batch_size
+        self._buffer = ""
+        self._position = 0
+        self._lock = threading.Lock()
+
+    def __call__(self) -> str:
+        with self._lock:
+            position = self._position
+            if position + _UID_LENGTH > len(self._buffer):  # the hex buffer may end in one spare character
+                self._buffer = os.urandom((_UID_LENGTH * self._batch_size + 1) // 2).hex()
+                position = 0
+            self._position = position + _UID_LENGTH
+            return self._buffer[position:position + _UID_LENGTH]
+
+
+def _text_paragraph_json(value: str) -> str:
+    """Serialize ``paragraph(value)`` (empty text is sent as a single space, like ``text()``)."""
+    return _PARAGRAPH_OPEN + encode_basestring(value or " ") + _PARAGRAPH_CLOSE
+
+
+def _cell_content_json(value: CellValue) -> str:
+    if isinstance(value, dict):
+        if value.get("type") == "paragraph":
+            return _dumps(value)
+        return '{"type":"paragraph","content":[' + _dumps(value) + ']}'
+    if value is None:
+        return _text_paragraph_json("")
+    if isinstance(value, str):
+        return _text_paragraph_json(value)
+    return _text_paragraph_json(str(value))
+
+
+def _cell_content_node(value: CellValue) -> Dict[str, Any]:
+    """Build ``paragraph(value)`` for a table cell as a single literal."""
+    if isinstance(value, dict):
+        return value if value.get("type") == "paragraph" else {"type": "paragraph", "content": [value]}
+    text_value = "" if value is None else str(value)
+    return {"type": "paragraph", "content": [{"type": "text", "text": text_value or " "}]}
+
+
+class _TableBlock:
+    """Lazy table over an iterable of row sequences."""
+
+    __slots__ = ("rows", "header", "show_row_numbers", "uid")
+
+    def __init__(self, rows: Iterable[Sequence[CellValue]], header: Optional[Sequence[CellValue]],
+                 show_row_numbers: bool, uid: str):
+        self.rows = rows
+        self.header = header
+        self.show_row_numbers = show_row_numbers
+        self.uid = uid
+
+    def iter_json(self) -> Iterator[str]:
+        row_open = '{"type":"tableRow","attrs":{"showRowNumbers":%s},"content":[' % (
+            "true" if self.show_row_numbers else "false"
+        )
+        yield '{"type":"extension-table","attrs":{"uid":%s,"showRowNumbers":%s},"content":[' % (
+            encode_basestring(self.uid), "true" if self.show_row_numbers else "false"
+        )
+        first = True
+        if self.header is not None:
+            yield row_open + ",".join(
+                _HEADER_OPEN + _cell_content_json(value) + _CELL_CLOSE for value in self.header
+            ) + "]}"
+            first = False
+
+        batch: List[str] = []
+        for row in self.rows:
+            batch.append(row_open + ",".join(
+                _CELL_OPEN + _cell_content_json(value) + _CELL_CLOSE for value in row
+            ) + "]}")
+            if len(batch) >= _CHUNK_ROWS:
+                yield ("" if first else ",") + ",".join(batch)
+                first = False
+                batch = []
+        if batch:
+            yield ("" if first else ",") + ",".join(batch)
+        yield "]}"
+
+    def to_node(self) -> Dict[str, Any]:
+        rows = []
+        if self.header is not None:
+            rows.append(table_row(
+                *(table_header(_cell_content_node(value)) for value in self.header),
+                show_row_numbers=self.show_row_numbers,
+            ))
+        for row in self.rows:
+            rows.append(table_row(
+                *(table_cell(_cell_content_node(value)) for value in row),
+                show_row_numbers=self.show_row_numbers,
+            ))
+        node = table(*rows, show_row_numbers=self.show_row_numbers)
+        node["attrs"]["uid"] = self.uid
+        return node
+
+
+class _ListBlock:
+    """Lazy bullet, ordered or task list over an iterable of items."""
+
+    __slots__ = ("kind", "items", "start", "uid")
+
+    def __init__(self, kind: str, items: Iterable[Any], start: int = 1, uid: Optional[str] = None):
+        self.kind = kind
+        self.items = items
+        self.start = start
+        self.uid = uid
+
+    def _item_json(self, item: Any) -> str:
+        if isinstance(item, dict):
+            return _dumps(item)
+        if self.kind == "taskList":
+            label, checked = (item, False) if isinstance(item, str) else item
+            return '{"type":"taskItem","attrs":{"checked":%s},"content":[%s]}' % (
+                "true" if checked else "false", _text_paragraph_json(label)
+            )
+        return _LIST_ITEM_OPEN + _text_paragraph_json(item) + _LIST_ITEM_CLOSE
+
+    def iter_json(self) -> Iterator[str]:
+        if self.kind == "taskList":
+            yield '{"type":"taskList","attrs":{"uid":%s},"content":[' % encode_basestring(self.uid)
+        else:
+            yield '{"type":"%s","content":[' % self.kind
+
+        item_json = self._item_json
+        first = True
+        batch: List[str] = []
+        for item in self.items:
+            batch.append(item_json(item))
+            if len(batch) >= _CHUNK_ROWS:
+                yield ("" if first else ",") + ",".join(batch)
+                first = False
+                batch = []
+        if batch:
+            yield ("" if first else ",") + ",".join(batch)
+
+        if self.kind == "orderedList" and self.start != 1:
+            yield '],"attrs":{"start":%d}}' % self.start
+        else:
+            yield "]}"
+
+    def to_node(self) -> Dict[str, Any]:
+        if self.kind == "taskList":
+            items = []
+            for item in self.items:
+                if isinstance(item, dict):
+                    items.append(item)
+                else:
+                    label, checked = (item, False) if isinstance(item, str) else item
+                    items.append(task_item(label, checked=checked))
+            node = task_list(*items)
+            node["attrs"]["uid"] = self.uid
+            return node
+        items = [item if isinstance(item, dict) else list_item(paragraph(item)) for item in self.items]
+        if self.kind == "orderedList":
+            return ordered_list(*items, start=self.start)
+        return bullet_list(*items)
+
+
+class DocumentBuilder:
+    """
+    Append-only document builder that serializes content incrementally.
+
+    Regular nodes (from any builder function) are added as-is. Tables and
+    lists are added as lazy blocks over the given rows/items, which are only
+    walked when the document is serialized. Iterables (e.g. generators or a
+    ``csv.reader``) are consumed at that point, so pass lists if the document
+    is serialized more than once.
+
+    Example:
+        >>> builder = DocumentBuilder()
+        >>> builder.heading(1, "Inventory").paragraph("Generated nightly")
+        >>> builder.table(((sku, name, qty) for sku, name, qty in rows), header=["SKU", "Name", "Qty"])
+        >>> with open("inventory.json", "w", encoding="utf-8") as f:
+        ...     builder.write(f)
+        >>> # Or send it
+        >>> client.replace_json_document(document_id, builder.build())
+    """
+
+    def __init__(self):
+        self._blocks: List[Any] = []
+        self._uid = UidPool()
+
+    def __len__(self) -> int:
+        return len(self._blocks)
+
+    def add(self, *nodes: DocumentNode) -> "DocumentBuilder":
+        """
+        Append ready-made nodes (e.g. ``image_block()``, ``mention_user()`` in a paragraph).
+
+        Returns:
+            DocumentBuilder: The builder, for chaining
+        """
+        self._blocks.extend(nodes)
+        return self
+
+    def extend(self, nodes: Iterable[DocumentNode]) -> "DocumentBuilder":
+        """
+        Append nodes from an iterable (e.g. ``iter_markdown_nodes()``).
+
+        Returns:
+            DocumentBuilder: The builder, for chaining
+        """
+        self._blocks.extend(nodes)
+        return self
+
+    def heading(self, level: int, *content: Union[str, Dict[str, Any]]) -> "DocumentBuilder":
+        """Append a heading (see ``heading()``)."""
+        self._blocks.append(heading(level, *content))
+        return self
+
+    def paragraph(self, *content: Union[str, Dict[str, Any]]) -> "DocumentBuilder":
+        """Append a paragraph (see ``paragraph()``)."""
+        self._blocks.append(paragraph(*content))
+        return self
+
+    def table(
+        self,
+        rows: Iterable[Sequence[CellValue]],
+        header: Optional[Sequence[CellValue]] = None,
+        show_row_numbers: bool = False,
+    ) -> "DocumentBuilder":
+        """
+        Append a table whose rows are serialized lazily.
+
+        Args:
+            rows: Iterable of rows; each row is a sequence of cell values
+                (strings, numbers, None, text nodes or paragraphs)
+            header: Optional header row values (rendered as header cells)
+            show_row_numbers: Show row numbers (default: False)
+
+        Returns:
+            DocumentBuilder: The builder, for chaining
+        """
+        self._blocks.append(_TableBlock(rows, header, show_row_numbers, self._uid()))
+        return self
+
+    def bullet_list(self, items: Iterable[Union[str, Dict[str, Any]]]) -> "DocumentBuilder":
+        """
+        Append a bullet list whose items are serialized lazily.
+
+        Args:
+            items: Strings or ``list_item()`` nodes
+
+        Returns:
+            DocumentBuilder: The builder, for chaining
+        """
+        self._blocks.append(_ListBlock("bulletList", items))
+        return self
+
+    def ordered_list(self, items: Iterable[Union[str, Dict[str, Any]]], start: int = 1) -> "DocumentBuilder":
+        """
+        Append an ordered list whose items are serialized lazily.
+
+        Args:
+            items: Strings or ``list_item()`` nodes
+            start: Starting number (default: 1)
+
+        Returns:
+            DocumentBuilder: The builder, for chaining
+        """
+        self._blocks.append(_ListBlock("orderedList", items, start=start))
+        return self
+
+    def task_list(self, items: Iterable[TaskItemValue]) -> "DocumentBuilder":
+        """
+        Append a checklist whose items are serialized lazily.
+
+        Args:
+            items: Strings (unchecked), ``(label, checked)`` tuples or ``task_item()`` nodes
+
+        Returns:
+            DocumentBuilder: The builder, for chaining
+        """
+        self._blocks.append(_ListBlock("taskList", items, uid=self._uid()))
+        return self
+
+    def iter_json(self) -> Iterator[str]:
+        """
+        Serialize the content array incrementally.
+
+        Returns:
+            Iterator[str]: Chunks of compact JSON that concatenate to the content array
+        """
+        yield "["
+        for index, block in enumerate(self._blocks):
+            if index:
+                yield ","
+            if isinstance(block, dict):
+                yield _dumps(block)
+            else:
+                yield from block.iter_json()
+        yield "]"
+
+    def write(self, fp: TextIO) -> int:
+        """
+        Stream the content array as JSON to a text file-like object.
+
+        Args:
+            fp: Object with a ``write(str)`` method
+
+        Returns:
+            int: Number of characters written
+        """
+        written = 0
+        for chunk in self.iter_json():
+            fp.write(chunk)
+            written += len(chunk)
+        return written
+
+    def to_json(self) -> str:
+        """Serialize the content array to a JSON string."""
+        return "".join(self.iter_json())
+
+    def build(self) -> List[DocumentNode]:
+        """
+        Materialize the content as a list of nodes for ``replace_json_document``.
+
+        Returns:
+            List[DocumentNode]: Top-level document nodes
+        """
+        return [block if isinstance(block, dict) else block.to_node() for block in self._blocks]
+
+
+__all__ = [
+    'DocumentBuilder',
+    'UidPool',
+]
@@ -0,0 +1,69 @@
+"""
+Size-aware splitting of document content into request-sized chunks.
+
+Very large generated documents can exceed what a single request body should
+carry. ``split_content`` packs top-level nodes, in order, into chunks whose
+serialized size stays under a byte budget, so a document can be written as
+one replace followed by ordered appends.
+"""
+
+import json
+from typing import Any, Dict, List, Sequence
+
+
+_dumps = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
+
+def node_size(node: Dict[str, Any]) -> int:
+    """Return the size in bytes of a node serialized as compact JSON."""
+    return len(_dumps(node).encode("utf-8"))
+
+
+def split_content(content: Sequence[Dict[str, Any]], max_bytes: int) -> List[List[Dict[str, Any]]]:
+    """
+    Split content at top-level node boundaries into chunks under a byte budget.
+
+    Sizes are measured on the compact JSON array (``[node,node,...]``) sent as
+    the ``content`` field. Nodes are never split, so a single node larger than
+    the budget is sent as a chunk of its own.
+
+    Args:
+        content: Top-level document nodes
+        max_bytes: Maximum serialized size of each chunk's content array
+
+    Returns:
+        List[List[Dict[str, Any]]]: Chunks in document order (empty list for empty content)
+
+    Raises:
+        ValueError: If max_bytes is not positive
+
+    Example:
+        >>> chunks = split_content(content, max_bytes=512 * 1024)
+        >>> [len(chunk) for chunk in chunks]
+        [1800, 1750, 412]
+    """
+    if max_bytes < 1:
+        raise ValueError("max_bytes must be positive")
+
+    chunks: List[List[Dict[str, Any]]] = []
+    current: List[Dict[str, Any]] = []
+    current_size = 2  # "[" and "]"
+    for node in content:
+        size = node_size(node)
+        added = size + (1 if current else 0)  # separating comma
+        if current and current_size + added > max_bytes:
+            chunks.append(current)
+            current = []
+            current_size = 2
+            added = size
+        current.append(node)
+        current_size += added
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+__all__ = [
+    'node_size',
+    'split_content',
+]
@@ -0,0 +1,189 @@
+"""
+Structural comparison of document content and minimal-update planning.
+
+Builder functions generate fresh random uids on every call, so two renders of
+the same content never compare equal as raw JSON. Nodes are therefore compared
+in a canonical form that ignores uids (and the random ids embedded in custom
+block payloads), which is what ``plan_document_update`` uses to decide whether
+a write can be skipped, sent as an append, or has to replace the document.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Literal, Union
+
+
+# Attributes regenerated by the builders on every call
+_VOLATILE_ATTRS = frozenset(("uid",))
+
+# Keys inside custom block JSON payloads regenerated on every call
+_VOLATILE_BLOCK_KEYS = frozenset(("id", "createAt"))
+
+UpdateAction = Literal["none", "append", "replace"]
+
+
+def _normalize_block_payload(text: str) -> Any:
+    """Decode a custom block payload and drop its volatile keys."""
+    try:
+        data = json.loads(text)
+    except (TypeError, ValueError):
+        return text
+    if isinstance(data, dict):
+        if isinstance(data.get("files"), list):
+            data["files"] = [
+                {k: v for k, v in item.items() if k not in _VOLATILE_BLOCK_KEYS}
+                if isinstance(item, dict) else item
+                for item in data["files"]
+            ]
+        return {k: v for k, v in data.items() if k not in _VOLATILE_BLOCK_KEYS}
+    return data
+
+
+def _normalize(node: Any) -> Any:
+    """Return a copy of a node without uids, null attributes and volatile block ids."""
+    if isinstance(node, list):
+        return [_normalize(item) for item in node]
+    if not isinstance(node, dict):
+        return node
+
+    result: Dict[str, Any] = {}
+    attrs = node.get("attrs")
+    is_custom = isinstance(attrs, dict) and attrs.get("custom") == 1
+    for key, value in node.items():
+        if key == "attrs" and isinstance(value, dict):
+            value = {
+                k: _normalize(v) for k, v in value.items()
+                if k not in _VOLATILE_ATTRS and v is not None
+            }
+            if not value:
+                continue
+        elif key == "content" and is_custom and isinstance(value, list):
+            value = [
+                {**item, "text": _normalize_block_payload(item.get("text", ""))}
+                if isinstance(item, dict) and item.get("type") == "text" else _normalize(item)
+                for item in value
+            ]
+        else:
+            value = _normalize(value)
+        result[key] = value
+    return result
+
+
+def canonical_json(content: Any) -> str:
+    """
+    Serialize content in a canonical, uid-independent form.
+
+    Keys are sorted, uids and null attributes are dropped, and the random ids
+    inside custom block payloads are ignored, so re-rendering the same content
+    with the builder functions yields the same string.
+
+    Args:
+        content: A node, a list of nodes, or a whole document
+
+    Returns:
+        str: Canonical JSON string
+    """
+    return json.dumps(_normalize(content), sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def content_fingerprint(content: Any) -> str:
+    """
+    Return a stable SHA-256 fingerprint of document content.
+
+    Args:
+        content: A node, a list of nodes, or a whole document
+
+    Returns:
+        str: Hex digest of the canonical JSON form
+    """
+    return hashlib.sha256(canonical_json(content).encode("utf-8")).hexdigest()
+
+
+def payload_size(content: List[Dict[str, Any]]) -> int:
+    """Return the size in bytes of content serialized as a compact JSON request body."""
+    return len(json.dumps(content, separators=(",", ":"), ensure_ascii=False).encode("utf-8"))
+
+
+def _top_level_content(document: Union[Dict[str, Any], List[Dict[str, Any]], None]) -> List[Dict[str, Any]]:
+    """Extract top-level nodes from a document dict or node list."""
+    if document is None:
+        return []
+    if isinstance(document, list):
+        return document
+    return document.get("content") or []
+
+
+@dataclass
+class DocumentUpdatePlan:
+    """
+    The cheapest write that turns the current document into the desired one.
+
+    Attributes:
+        action: "none" (nothing changed), "append" (desired content extends the
+            current content) or "replace" (anything else)
+        content: Nodes to send: empty for "none", the new suffix for "append",
+            the whole desired content for "replace"
+        full_bytes: Size of a full replace request body
+        sent_bytes: Size of the request body actually needed
+    """
+    action: UpdateAction
+    content: List[Dict[str, Any]] = field(default_factory=list)
+    full_bytes: int = 0
+    sent_bytes: int = 0
+
+    @property
+    def bytes_saved(self) -> int:
+        """Bytes not sent compared to always replacing the whole document."""
+        return self.full_bytes - self.sent_bytes
+
+
+def plan_document_update(
+    current: Union[Dict[str, Any], List[Dict[str, Any]], None],
+    desired: List[Dict[str, Any]],
+) -> DocumentUpdatePlan:
+    """
+    Compare current document content with the desired node list.
+
+    Top-level nodes are compared in canonical form (see ``canonical_json``).
+
+    Args:
+        current: Current document as returned by ``get_json_document`` (or its node list)
+        desired: Desired top-level nodes
+
+    Returns:
+        DocumentUpdatePlan: The action to take and the nodes to send
+
+    Example:
+        >>> current = client.get_json_document(document_id)
+        >>> plan = plan_document_update(current, [*existing_nodes, heading(2, "New section")])
+        >>> plan.action, len(plan.content)
+        ('append', 1)
+    """
+    current_nodes = _top_level_content(current)
+    full_bytes = payload_size(desired)
+
+    if not current_nodes and not desired:
+        return DocumentUpdatePlan("none", [], full_bytes, 0)
+
+    if current_nodes and len(desired) >= len(current_nodes):
+        prefix_matches = all(
+            canonical_json(old) == canonical_json(new)
+            for old, new in zip(current_nodes, desired)
+        )
+        if prefix_matches:
+            suffix = desired[len(current_nodes):]
+            if not suffix:
+                return DocumentUpdatePlan("none", [], full_bytes, 0)
+            return DocumentUpdatePlan("append", list(suffix), full_bytes, payload_size(suffix))
+
+    return DocumentUpdatePlan("replace", list(desired), full_bytes, full_bytes)
+
+
+__all__ = [
+    'DocumentUpdatePlan',
+    'canonical_json',
+    'content_fingerprint',
+    'payload_size',
+    'plan_document_update',
+]
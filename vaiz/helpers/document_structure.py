@@ -5,6 +5,13 @@ This module provides type-safe builders for document nodes and marks,
 ensuring only validated elements are used with the replace_json_document API.
 """
 
+import json
+import mimetypes
+import random
+import re
+import string
+import time
+import uuid
 from typing import List, Optional, Literal, Union
 from typing_extensions import TypedDict, NotRequired
 from enum import Enum
@@ -440,6 +447,10 @@ def paragraph(*content: Union[TextNode, str]) -> ParagraphNode:
     return node
 
 
+# Characters used in heading/embed uids: a-z, A-Z, 0-9
+_UID_CHARS = string.ascii_letters + string.digits
+
+
 def _generate_uid() -> str:
     """
     Generate a unique identifier for document elements.
@@ -449,13 +460,18 @@ def _generate_uid() -> str:
     Returns:
         str: A unique identifier string
     """
-    import random
-    import string
+    return ''.join(random.choices(_UID_CHARS, k=12))
+
+
+def _short_id() -> str:
+    """
+    Generate a short random identifier for tables, task lists and custom blocks.
+    Format: 11 lowercase hex characters.
     
-    # Generate random string with letters (upper + lower) and digits
-    chars = string.ascii_letters + string.digits  # a-z, A-Z, 0-9
-    uid = ''.join(random.choice(chars) for _ in range(12))
-    return uid
+    Returns:
+        str: A unique identifier string
+    """
+    return uuid.uuid4().hex[:11]
 
 
 def heading(level: Literal[1, 2, 3, 4, 5, 6], *content: Union[TextNode, str]) -> HeadingNode:
@@ -614,8 +630,6 @@ def task_list(*items: Union[TaskItemNode, str], checked: bool = False) -> TaskLi
         ... )
         {'type': 'taskList', 'content': [...]}
     """
-    import uuid
-    
     content: List[TaskItemNode] = []
     for item in items:
         if isinstance(item, str):
@@ -625,7 +639,7 @@ def task_list(*items: Union[TaskItemNode, str], checked: bool = False) -> TaskLi
     
     return {
         "type": "taskList",
-        "attrs": {"uid": str(uuid.uuid4())[:12].replace('-', '')},
+        "attrs": {"uid": _short_id()},
         "content": content
     }
 
@@ -898,11 +912,10 @@ def table(*rows: TableRowNode, show_row_numbers: bool = False) -> TableNode:
         ... )
         {'type': 'extension-table', 'attrs': {'showRowNumbers': False}, 'content': [...]}
     """
-    import uuid
     return {
         "type": "extension-table",
         "attrs": {
-            "uid": str(uuid.uuid4())[:12].replace('-', ''),
+            "uid": _short_id(),
             "showRowNumbers": show_row_numbers
         },
         "content": list(rows)
@@ -927,11 +940,10 @@ def mention(item_id: str, kind: Literal["User", "Document", "Task", "Milestone"]
         >>> mention("68fa67d262f676bcd1bc162f", "Task")
         {'type': 'custom-mention', 'attrs': {..., 'data': {'item': {'id': '68fa67d262f676bcd1bc162f', 'kind': 'Task'}}}, ...}
     """
-    import uuid
     return {
         "type": "custom-mention",
         "attrs": {
-            "uid": str(uuid.uuid4())[:12].replace('-', ''),
+            "uid": _short_id(),
             "custom": 1,
             "inline": True,
             "data": {
@@ -1016,7 +1028,8 @@ def mention_milestone(milestone_id: str) -> MentionNode:
 def image_block(
     file,
     width_percent: int = 100,
-    caption: str = ""
+    caption: str = "",
+    source=None
 ) -> ImageBlockNode:
     """
     Create an image block node from an uploaded file.
@@ -1025,6 +1038,9 @@ def image_block(
         file: UploadedFile object from client.upload_file() response (use uploaded.file)
         width_percent: Width as percentage (default: 100)
         caption: Optional image caption
+        source: Optional local copy of the image (path, bytes or binary stream).
+            When the uploaded file has no dimensions, MIME type or dominant color,
+            they are read from the image header locally instead.
     
     Returns:
         ImageBlockNode: A valid image block node
@@ -1042,11 +1058,10 @@ def image_block(
         ...     caption="Product photo",
         ...     width_percent=75
         ... )
+        >>> 
+        >>> # Fill in missing metadata from the local file
+        >>> image_block(file=uploaded.file, source="path/to/image.png")
     """
-    import uuid
-    import json
-    import mimetypes
-    
     # Extract data from uploaded file object
     file_id = file.id
     src = file.url
@@ -1055,17 +1070,30 @@ def image_block(
     extension = file.ext
     dimensions = file.dimension if hasattr(file, 'dimension') and file.dimension else None
     dominant_color = file.dominant_color if hasattr(file, 'dominant_color') and file.dominant_color else None
+    file_mime = file.mime if hasattr(file, 'mime') and file.mime else None
+    
+    # Read missing metadata from the local image header
+    if source is not None:
+        from .image_metadata import read_image_info, estimate_dominant_color
+        
+        if not dimensions or not file_mime:
+            info = read_image_info(source)
+            if info is not None:
+                dimensions = dimensions or info.dimensions
+                file_mime = file_mime or info.mime
+        if not dominant_color:
+            dominant_color = estimate_dominant_color(source)
     
     # Auto-detect MIME type from extension or use mime from file
-    if hasattr(file, 'mime') and file.mime:
-        file_type = file.mime
+    if file_mime:
+        file_type = file_mime
     else:
         mime_type = mimetypes.guess_type(f"file.{extension}")[0]
         file_type = mime_type if mime_type else "image/png"
     
     # Generate unique IDs
-    block_uid = str(uuid.uuid4())[:12].replace('-', '')
-    image_id = str(uuid.uuid4())[:12].replace('-', '')
+    block_uid = _short_id()
+    image_id = _short_id()
     
     # Build image data
     image_data: ImageBlockData = {
@@ -1143,18 +1171,14 @@ def files_block(*file_items: dict) -> FilesBlockNode:
         >>> # Create files block
         >>> files_block(file1, file2)
     """
-    import uuid
-    import json
-    import time
-    
-    block_uid = str(uuid.uuid4())[:12].replace('-', '')
+    block_uid = _short_id()
     current_timestamp = int(time.time() * 1000)
     
     # Build file items list
     files_list = []
     for item in file_items:
         file_item: FileItem = {
-            "id": str(uuid.uuid4())[:12].replace('-', ''),
+            "id": _short_id(),
             "fileId": item["fileId"],
             "createAt": current_timestamp,
             "url": item["url"],
@@ -1203,10 +1227,7 @@ def toc_block() -> DocSiblingsNode:
         ... ]
         >>> client.replace_json_document(document_id, content)
     """
-    import uuid
-    import json
-    
-    block_uid = str(uuid.uuid4())[:12].replace('-', '')
+    block_uid = _short_id()
     
     toc_data: DocSiblingsData = {"type": "toc"}
     
@@ -1245,10 +1266,7 @@ def anchors_block() -> DocSiblingsNode:
         ... ]
         >>> client.replace_json_document(document_id, content)
     """
-    import uuid
-    import json
-    
-    block_uid = str(uuid.uuid4())[:12].replace('-', '')
+    block_uid = _short_id()
     
     anchors_data: DocSiblingsData = {"type": "anchors"}
     
@@ -1287,10 +1305,7 @@ def siblings_block() -> DocSiblingsNode:
         ... ]
         >>> client.replace_json_document(document_id, content)
     """
-    import uuid
-    import json
-    
-    block_uid = str(uuid.uuid4())[:12].replace('-', '')
+    block_uid = _short_id()
     
     siblings_data: DocSiblingsData = {"type": "siblings"}
     
@@ -1333,9 +1348,7 @@ def code_block(code: str = "", language: str = "") -> CodeBlockNode:
         >>> # Or create an empty code block
         >>> empty_code = code_block()
     """
-    import uuid
-    
-    block_uid = str(uuid.uuid4())[:12].replace('-', '')
+    block_uid = _short_id()
     
     node: CodeBlockNode = {
         "type": "codeBlock",
@@ -1365,8 +1378,6 @@ def _extract_embed_url(url: str, embed_type: EmbedType) -> str:
     Returns:
         str: Extracted embed URL
     """
-    import re
-    
     if embed_type == EmbedType.YOUTUBE:
         # Convert YouTube watch URL to embed URL
         # https://www.youtube.com/watch?v=VIDEO_ID -> https://www.youtube.com/embed/VIDEO_ID
@@ -1444,8 +1455,6 @@ def embed_block(
         >>> # Generic iframe embed (default type)
         >>> iframe = embed_block(url="https://example.com/embed")
     """
-    import json
-    
     # Default to Iframe if not specified
     if embed_type is None:
         embed_type = EmbedType.IFRAME
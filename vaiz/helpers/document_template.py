@@ -0,0 +1,345 @@
+"""
+Compiled document templates for rendering the same layout many times.
+
+Building a description with the helper functions runs every helper (and its
+uid generation) again for each instance. ``DocumentTemplate`` walks a node
+tree once and compiles it into JSON fragments: every part that does not
+depend on the instance is serialized up front, so ``render_json`` only
+escapes the placeholder values and new uids and joins them with the
+precompiled fragments. ``render`` parses that JSON into fresh nodes.
+
+Placeholders are written as ``{{name}}`` inside any string of the tree
+(text, link hrefs, attribute values), or as a whole node with ``slot(name)``
+to splice in nodes that are only known per instance (extra table rows,
+checklist items, ...).
+"""
+
+import json
+import re
+from json.encoder import encode_basestring
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple
+
+from .document_builder import UidPool
+from .document_structure import DocumentNode, _generate_uid
+
+
+SLOT = "template-slot"
+
+# Node types whose helpers generate 12-character uids (``heading()``, ``embed_block()``);
+# the uids of all other nodes use the 11-character short format
+_LONG_UID_TYPES = frozenset({"heading", "embed"})
+
+_PLACEHOLDER_RE = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+
+_dumps = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
+# Produces the JSON of one part of a rendered instance from the placeholder values
+_Emit = Callable[[Mapping[str, Any]], str]
+
+
+def slot(name: str) -> Dict[str, Any]:
+    """
+    Create a placeholder for nodes supplied when the template is rendered.
+
+    The rendered value may be a node, a list of nodes, or None / an empty
+    list to leave the slot empty.
+
+    Example:
+        >>> template = DocumentTemplate([heading(2, "Checklist"), task_list(slot("items"))])
+        >>> template.render(items=[task_item("Write tests"), task_item("Ship", checked=True)])
+    """
+    return {"type": SLOT, "attrs": {"name": name}}
+
+
+def _is_slot(item: Any) -> bool:
+    return isinstance(item, dict) and item.get("type") == SLOT
+
+
+def _text_value(value: Any) -> str:
+    """Text node content for a placeholder value (text nodes cannot be empty)."""
+    return str(value) if value is not None and value != "" else " "
+
+
+def _slot_json(value: Any) -> List[str]:
+    """JSON of the nodes to splice in for a slot value (a node, a list of nodes, or nothing)."""
+    if not value:
+        return []
+    return [_dumps(value)] if isinstance(value, dict) else [_dumps(node) for node in value]
+
+
+def _join(parts: List[Any]) -> _Emit:
+    """Emitter for a sequence of precompiled JSON strings and emitters."""
+    statics: List[str] = [""]
+    emitters: List[_Emit] = []
+    for part in parts:
+        if isinstance(part, str):
+            statics[-1] += part
+        else:
+            emitters.append(part)
+            statics.append("")
+    if not emitters:
+        constant = statics[0]
+        return lambda values: constant
+    if len(emitters) == 1:
+        head, emit, tail = statics[0], emitters[0], statics[1]
+        return lambda values: head + emit(values) + tail
+    pairs = list(zip(emitters, statics[1:]))
+    head = statics[0]
+
+    def emit_all(values: Mapping[str, Any]) -> str:
+        pieces = [head]
+        for emit, static in pairs:
+            pieces.append(emit(values))
+            pieces.append(static)
+        return "".join(pieces)
+    return emit_all
+
+
+def _text_placeholder(name: str) -> _Emit:
+    return lambda values: encode_basestring(_text_value(values[name]))
+
+
+def _value_placeholder(name: str) -> _Emit:
+    return lambda values: _dumps(values[name])
+
+
+def _interpolation(pieces: List[Tuple[bool, str]]) -> _Emit:
+    return lambda values: encode_basestring(
+        "".join(str(values[piece]) if is_name else piece for is_name, piece in pieces)
+    )
+
+
+def _list_with_slots(elements: List[Tuple[bool, Any]]) -> _Emit:
+    def emit(values: Mapping[str, Any]) -> str:
+        items: List[str] = []
+        for is_slot, element in elements:
+            if is_slot:
+                items.extend(_slot_json(values[element]))
+            else:
+                items.append(element(values))
+        return "[" + ",".join(items) + "]"
+    return emit
+
+
+def _embedded_json(emit: _Emit) -> _Emit:
+    """A JSON document serialized as a string value (the payload of a custom block)."""
+    return lambda values: encode_basestring(emit(values))
+
+
+class DocumentTemplate:
+    """
+    A node tree compiled once and rendered into fresh document content per instance.
+
+    Each render gets new uids wherever the helpers generate them (``uid``
+    attributes of headings, task lists, tables, mentions and custom blocks,
+    and the ``id`` of images and files inside custom block payloads), so
+    rendered instances can be written to many documents. Templates can be
+    rendered from several threads at once.
+
+    Example:
+        >>> template = DocumentTemplate([
+        ...     heading(1, "{{title}}"),
+        ...     paragraph("Owner: ", text("{{owner}}", bold=True)),
+        ...     table(table_row("Estimate", "{{estimate}}"), table_row("Due", "{{due}}")),
+        ...     task_list(task_item("Reviewed", checked="{{reviewed}}")),
+        ... ])
+        >>> content = template.render(title="Checkout", owner="Ann", estimate=3, due="Fri", reviewed=False)
+        >>> client.replace_json_document(task.document, content)
+    """
+
+    __slots__ = ("_emit", "_names", "_short_id", "_long_uid_types")
+
+    def __init__(self, content: Iterable[DocumentNode], long_uid_types: Iterable[str] = _LONG_UID_TYPES):
+        """
+        Compile a template.
+
+        Args:
+            content: Top-level nodes, built with the helper functions, containing
+                ``{{name}}`` placeholders and/or ``slot(name)`` nodes
+            long_uid_types: Node types whose ``uid`` attribute is regenerated in the
+                12-character format of ``heading()`` (default: "heading" and "embed",
+                like the helpers); other uids get 11 hex characters
+        """
+        names: set = set()
+        self._short_id = UidPool()
+        self._long_uid_types = frozenset(long_uid_types)
+        parts: List[Any] = []
+        self._compile(list(content), None, None, False, names, parts)
+        self._emit = _join(parts)
+        self._names: FrozenSet[str] = frozenset(names)
+
+    @property
+    def names(self) -> FrozenSet[str]:
+        """Names of all placeholders and slots in the template."""
+        return self._names
+
+    # Compilation: each step appends precompiled JSON strings and emitters to ``parts``
+
+    def _compile(
+        self, value: Any, key: Optional[str], owner: Optional[str], in_payload: bool, names: set, parts: List[Any]
+    ) -> None:
+        if isinstance(value, str):
+            parts.append(self._compile_string(value, key, names))
+        elif isinstance(value, dict):
+            self._compile_dict(value, owner, in_payload, names, parts)
+        elif isinstance(value, (list, tuple)):
+            self._compile_list(value, in_payload, names, parts)
+        else:
+            # Numbers, booleans and None
+            parts.append(_dumps(value))
+
+    def _compile_list(self, items: Any, in_payload: bool, names: set, parts: List[Any]) -> None:
+        if not any(_is_slot(item) for item in items):
+            parts.append("[")
+            for index, item in enumerate(items):
+                if index:
+                    parts.append(",")
+                self._compile(item, None, None, in_payload, names, parts)
+            parts.append("]")
+            return
+        elements: List[Tuple[bool, Any]] = []
+        for item in items:
+            if _is_slot(item):
+                name = item["attrs"]["name"]
+                names.add(name)
+                elements.append((True, name))
+            else:
+                item_parts: List[Any] = []
+                self._compile(item, None, None, in_payload, names, item_parts)
+                elements.append((False, _join(item_parts)))
+        parts.append(_list_with_slots(elements))
+
+    def _compile_dict(
+        self, node: Dict[str, Any], owner: Optional[str], in_payload: bool, names: set, parts: List[Any]
+    ) -> None:
+        custom = isinstance(node.get("attrs"), dict) and node["attrs"].get("custom") == 1
+        parts.append("{")
+        for index, (key, value) in enumerate(node.items()):
+            parts.append(("," if index else "") + encode_basestring(key) + ":")
+            if key == "uid" and isinstance(value, str):
+                parts.append(self._new_long_uid if owner in self._long_uid_types else self._new_short_id)
+            elif key == "id" and in_payload and isinstance(value, str):
+                parts.append(self._new_short_id)
+            elif key == "content" and custom and isinstance(value, list):
+                parts.append("[")
+                for position, child in enumerate(value):
+                    if position:
+                        parts.append(",")
+                    self._compile_custom_child(child, names, parts)
+                parts.append("]")
+            else:
+                self._compile(value, key, node.get("type") if key == "attrs" else None, in_payload, names, parts)
+        parts.append("}")
+
+    def _compile_custom_child(self, child: Any, names: set, parts: List[Any]) -> None:
+        """Compile the JSON payload of a custom block so its ids are regenerated too."""
+        if isinstance(child, dict) and child.get("type") == "text" and isinstance(child.get("text"), str):
+            try:
+                payload = json.loads(child["text"])
+            except ValueError:
+                payload = None
+            if isinstance(payload, dict):
+                payload_parts: List[Any] = []
+                self._compile(payload, None, None, True, names, payload_parts)
+                parts.append("{")
+                for index, (key, value) in enumerate(child.items()):
+                    parts.append(("," if index else "") + encode_basestring(key) + ":")
+                    if key == "text":
+                        parts.append(_embedded_json(_join(payload_parts)))
+                    else:
+                        self._compile(value, key, None, False, names, parts)
+                parts.append("}")
+                return
+        self._compile(child, None, None, False, names, parts)
+
+    @staticmethod
+    def _compile_string(value: str, key: Optional[str], names: set) -> Any:
+        matches = list(_PLACEHOLDER_RE.finditer(value))
+        if not matches:
+            return encode_basestring(value)
+        names.update(match.group(1) for match in matches)
+        if len(matches) == 1 and matches[0].span() == (0, len(value)):
+            name = matches[0].group(1)
+            return _text_placeholder(name) if key == "text" else _value_placeholder(name)
+        pieces: List[Tuple[bool, str]] = []
+        position = 0
+        for match in matches:
+            if match.start() > position:
+                pieces.append((False, value[position:match.start()]))
+            pieces.append((True, match.group(1)))
+            position = match.end()
+        if position < len(value):
+            pieces.append((False, value[position:]))
+        return _interpolation(pieces)
+
+    def _new_short_id(self, values: Mapping[str, Any]) -> str:
+        return '"' + self._short_id() + '"'
+
+    @staticmethod
+    def _new_long_uid(values: Mapping[str, Any]) -> str:
+        return '"' + _generate_uid() + '"'
+
+    # Rendering
+
+    def _values(self, values: Optional[Mapping[str, Any]], kwargs: Dict[str, Any]) -> Mapping[str, Any]:
+        if values is None:
+            values = kwargs
+        elif kwargs:
+            values = {**values, **kwargs}
+        missing = self._names.difference(values)
+        if missing:
+            raise ValueError(f"Missing template values: {', '.join(sorted(missing))}")
+        return values
+
+    def render_json(self, values: Optional[Mapping[str, Any]] = None, **kwargs: Any) -> str:
+        """
+        Render an instance as a JSON array string.
+
+        Only placeholder values and uids are serialized per call; everything
+        else is joined from JSON compiled with the template.
+
+        Args:
+            values: Placeholder values (may be combined with keyword arguments)
+            **kwargs: Placeholder values
+
+        Returns:
+            str: Compact JSON of the top-level nodes
+
+        Raises:
+            ValueError: If a placeholder has no value
+            TypeError: If a value placed as a whole attribute or slot is not JSON serializable
+        """
+        return self._emit(self._values(values, kwargs))
+
+    def render(self, values: Optional[Mapping[str, Any]] = None, **kwargs: Any) -> List[DocumentNode]:
+        """
+        Render an instance as document content for ``replace_json_document``.
+
+        Placeholders in text are replaced with ``str(value)``; a placeholder
+        that is a whole attribute value keeps the value's JSON type (so
+        ``checked="{{done}}"`` renders a boolean). The nodes are parsed from
+        ``render_json()``, so instances never share dicts or lists with each
+        other or with the values passed in.
+
+        Args:
+            values: Placeholder values (may be combined with keyword arguments)
+            **kwargs: Placeholder values
+
+        Returns:
+            List[DocumentNode]: Freshly allocated top-level nodes
+
+        Raises:
+            ValueError: If a placeholder has no value
+            TypeError: If a value placed as a whole attribute or slot is not JSON serializable
+
+        Example:
+            >>> for task in tasks:
+            ...     client.replace_json_document(task.document, template.render(title=task.name, owner=owner))
+        """
+        return json.loads(self._emit(self._values(values, kwargs)))
+
+
+__all__ = [
+    'DocumentTemplate',
+    'slot',
+]
@@ -0,0 +1,361 @@
+"""
+Indexed, read-only view over document JSON content.
+
+``DocumentTree`` wraps the dict returned by ``get_json_document`` (or a plain
+list of nodes) and indexes it in a single pass, so looking up nodes by uid or
+type does not require walking the document again.
+"""
+
+import json
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Union
+
+
+# Node types that get a dedicated convenience property
+HEADING = "heading"
+TASK_LIST = "taskList"
+TASK_ITEM = "taskItem"
+TABLE = "extension-table"
+MENTION = "custom-mention"
+IMAGE_BLOCK = "image-block"
+FILES_BLOCK = "files"
+
+
+class DocumentTree:
+    """
+    Indexed document tree built from ``get_json_document`` output.
+
+    The tree is built in one pass over the parsed JSON. Nodes are kept as the
+    original dicts (nothing is copied), and indexes map uids, node types and
+    parents to them.
+
+    Example:
+        >>> tree = DocumentTree(client.get_json_document(document_id))
+        >>> [tree.text(h) for h in tree.headings]
+        ['Overview', 'Details']
+        >>> tree.get("sEeaN9ddIDsL")["type"]
+        'heading'
+        >>> sum(1 for _ in tree.iter_nodes(type="taskItem"))
+        12
+    """
+
+    __slots__ = ("root", "_nodes", "_parents", "_by_uid", "_by_type")
+
+    def __init__(self, document: Union[Dict[str, Any], List[Dict[str, Any]]]):
+        """
+        Build the tree indexes.
+
+        Args:
+            document: Parsed document (``{"type": "doc", "content": [...]}``) or a list of top-level nodes
+        """
+        if isinstance(document, list):
+            document = {"type": "doc", "content": document}
+        self.root: Dict[str, Any] = document
+        self._nodes: List[Dict[str, Any]] = []
+        self._parents: Dict[int, Dict[str, Any]] = {}
+        self._by_uid: Dict[str, Dict[str, Any]] = {}
+        self._by_type: Dict[str, List[Dict[str, Any]]] = {}
+        self._index()
+
+    def _index(self) -> None:
+        """Walk the document once (pre-order, iteratively) and fill all indexes."""
+        nodes_append = self._nodes.append
+        parents = self._parents
+        by_uid = self._by_uid
+        by_type = self._by_type
+
+        stack = [(child, self.root) for child in reversed(self.root.get("content") or ())]
+        while stack:
+            node, parent = stack.pop()
+            if not isinstance(node, dict):
+                continue
+            nodes_append(node)
+            parents[id(node)] = parent
+
+            node_type = node.get("type")
+            bucket = by_type.get(node_type)
+            if bucket is None:
+                by_type[node_type] = [node]
+            else:
+                bucket.append(node)
+
+            attrs = node.get("attrs")
+            if attrs:
+                uid = attrs.get("uid")
+                if uid:
+                    by_uid[uid] = node
+
+            children = node.get("content")
+            if children:
+                stack.extend((child, node) for child in reversed(children))
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self._nodes)
+
+    def __contains__(self, uid: object) -> bool:
+        return uid in self._by_uid
+
+    @property
+    def content(self) -> List[Dict[str, Any]]:
+        """Top-level nodes of the document."""
+        return self.root.get("content") or []
+
+    def get(self, uid: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a node by its ``attrs.uid``.
+
+        Args:
+            uid: Node uid (headings, task lists, tables, custom blocks, ...)
+
+        Returns:
+            Optional[Dict[str, Any]]: The node, or None if no node has this uid
+        """
+        return self._by_uid.get(uid)
+
+    def parent(self, node: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Return the parent of a node (the document root for top-level nodes).
+
+        Args:
+            node: A node belonging to this tree
+
+        Returns:
+            Optional[Dict[str, Any]]: Parent node, or None for the root or unknown nodes
+        """
+        return self._parents.get(id(node))
+
+    def ancestors(self, node: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """Yield the ancestors of a node, nearest first, ending with the document root."""
+        parent = self._parents.get(id(node))
+        while parent is not None:
+            yield parent
+            parent = self._parents.get(id(parent))
+
+    def iter_nodes(self, type: Union[str, Iterable[str], None] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily iterate nodes in document order.
+
+        Args:
+            type: Node type or collection of node types to include (default: all nodes)
+
+        Returns:
+            Iterator[Dict[str, Any]]: Matching nodes in document order
+        """
+        if type is None:
+            return iter(self._nodes)
+        if isinstance(type, str):
+            return iter(self._by_type.get(type, ()))
+        wanted = frozenset(type)
+        return (node for node in self._nodes if node.get("type") in wanted)
+
+    def nodes_of_type(self, type: str) -> List[Dict[str, Any]]:
+        """Return all nodes of one type in document order (empty list if none)."""
+        return list(self._by_type.get(type, ()))
+
+    def count(self, type: str) -> int:
+        """Return the number of nodes of a type."""
+        return len(self._by_type.get(type, ()))
+
+    @property
+    def headings(self) -> List[Dict[str, Any]]:
+        """Heading nodes in document order."""
+        return self.nodes_of_type(HEADING)
+
+    @property
+    def task_lists(self) -> List[Dict[str, Any]]:
+        """Task list (checklist) nodes in document order."""
+        return self.nodes_of_type(TASK_LIST)
+
+    @property
+    def task_items(self) -> List[Dict[str, Any]]:
+        """Task item (checklist entry) nodes in document order."""
+        return self.nodes_of_type(TASK_ITEM)
+
+    @property
+    def tables(self) -> List[Dict[str, Any]]:
+        """Table nodes in document order."""
+        return self.nodes_of_type(TABLE)
+
+    @property
+    def mentions(self) -> List[Dict[str, Any]]:
+        """Mention nodes in document order."""
+        return self.nodes_of_type(MENTION)
+
+    @property
+    def image_blocks(self) -> List[Dict[str, Any]]:
+        """Image block nodes in document order."""
+        return self.nodes_of_type(IMAGE_BLOCK)
+
+    @property
+    def file_blocks(self) -> List[Dict[str, Any]]:
+        """Files block nodes in document order."""
+        return self.nodes_of_type(FILES_BLOCK)
+
+    def text(self, node: Optional[Dict[str, Any]] = None, separator: str = "") -> str:
+        """
+        Concatenate the text of a node and its descendants.
+
+        Custom blocks (image, files, embeds, ...) store JSON in their text
+        content; that payload is skipped.
+
+        Args:
+            node: Node to extract text from (default: the whole document)
+            separator: String inserted between text fragments (default: "")
+
+        Returns:
+            str: Plain text content
+        """
+        return node_text(self.root if node is None else node, separator)
+
+    @staticmethod
+    def block_data(node: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Decode the JSON payload of a custom block (image, files, embed, doc-siblings).
+
+        Args:
+            node: A custom block node
+
+        Returns:
+            Optional[Dict[str, Any]]: Decoded payload, or None if the node carries none
+        """
+        content = node.get("content")
+        if not content:
+            return None
+        try:
+            data = json.loads(content[0].get("text", ""))
+        except (TypeError, ValueError):
+            return None
+        return data if isinstance(data, dict) else None
+
+    @staticmethod
+    def mention_item(node: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Return the ``{"id": ..., "kind": ...}`` item referenced by a mention node.
+
+        Args:
+            node: A ``custom-mention`` node
+
+        Returns:
+            Optional[Dict[str, Any]]: The mentioned item, or None if missing
+        """
+        attrs = node.get("attrs") or {}
+        data = attrs.get("data") or {}
+        item = data.get("item")
+        return item if isinstance(item, dict) else None
+
+
+def node_text(node: Dict[str, Any], separator: str = "") -> str:
+    """
+    Concatenate the text of a node and its descendants (see ``DocumentTree.text``).
+
+    Args:
+        node: Any document node
+        separator: String inserted between text fragments (default: "")
+
+    Returns:
+        str: Plain text content
+    """
+    parts: List[str] = []
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if current.get("type") == "text":
+            parts.append(current.get("text", ""))
+            continue
+        attrs = current.get("attrs")
+        if attrs and attrs.get("custom") == 1:
+            continue
+        children = current.get("content")
+        if children:
+            stack.extend(reversed(children))
+    return separator.join(parts)
+
+
+def extract_mentions(document: Union[Dict[str, Any], List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """
+    Collect the items referenced by mention nodes, without indexing the whole tree.
+
+    Each mentioned item is returned once, in order of first appearance.
+
+    Args:
+        document: Parsed document as returned by ``get_json_document``, or a list of nodes
+
+    Returns:
+        List[Dict[str, Any]]: ``{"id": ..., "kind": ...}`` items (kind is "User", "Document", "Task" or "Milestone")
+
+    Example:
+        >>> extract_mentions(client.get_json_document(document_id))
+        [{'id': '68fa67d262f676bcd1bc162f', 'kind': 'Task'}, {'id': '68fa5e14...', 'kind': 'User'}]
+    """
+    stack = list(reversed(document)) if isinstance(document, list) else [document]
+    items: List[Dict[str, Any]] = []
+    seen = set()
+    while stack:
+        node = stack.pop()
+        if node.get("type") == MENTION:
+            item = DocumentTree.mention_item(node)
+            if item is not None and "id" in item:
+                key = (item.get("kind"), item["id"])
+                if key not in seen:
+                    seen.add(key)
+                    items.append({"id": item["id"], "kind": item.get("kind")})
+            continue
+        children = node.get("content")
+        if children:
+            stack.extend(reversed(children))
+    return items
+
+
+class ChecklistProgress(NamedTuple):
+    """Checked and total checklist items."""
+    checked: int = 0
+    total: int = 0
+
+    @property
+    def unchecked(self) -> int:
+        return self.total - self.checked
+
+    @property
+    def percent(self) -> Optional[float]:
+        """Completion percentage, or None when there are no checklist items."""
+        return 100.0 * self.checked / self.total if self.total else None
+
+
+def count_checklist(document: Union[Dict[str, Any], List[Dict[str, Any]]]) -> ChecklistProgress:
+    """
+    Count checked and unchecked checklist items, including nested ones, in one pass.
+
+    Args:
+        document: Parsed document as returned by ``get_json_document``, or a list of nodes
+
+    Returns:
+        ChecklistProgress: Checked and total task items
+
+    Example:
+        >>> progress = count_checklist(client.get_json_document(task.document))
+        >>> progress.checked, progress.total, progress.percent
+        (3, 4, 75.0)
+    """
+    stack = list(document) if isinstance(document, list) else [document]
+    checked = total = 0
+    while stack:
+        node = stack.pop()
+        if node.get("type") == TASK_ITEM:
+            total += 1
+            if (node.get("attrs") or {}).get("checked"):
+                checked += 1
+        children = node.get("content")
+        if children:
+            stack.extend(children)
+    return ChecklistProgress(checked, total)
+
+
+__all__ = [
+    'DocumentTree',
+    'node_text',
+    'extract_mentions',
+    'ChecklistProgress',
+    'count_checklist',
+]
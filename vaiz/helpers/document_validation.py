@@ -0,0 +1,254 @@
+"""
+Local validation of document node trees.
+
+The node shapes are defined once, as the TypedDicts in
+``document_structure``. On first use they are compiled into a dispatch table
+keyed by node ``type``: each entry knows the required keys, a checker per
+known key and which node types its ``content`` may contain. Validation then
+walks the tree iteratively, visiting every node once, and reports each
+problem with the path to the offending value.
+"""
+
+from typing import Any, Callable, Dict, FrozenSet, List, NamedTuple, Optional, Tuple, Union
+
+from typing_extensions import Literal, get_args, get_origin, get_type_hints
+
+from . import document_structure
+from .document_structure import DocumentNode, Mark, TextNode
+
+
+# (parent path, key or index); None is the root
+_Path = Optional[Tuple[Any, Union[str, int]]]
+# checker(value, path, issues, stack)
+_Checker = Callable[[Any, _Path, List["DocumentIssue"], list], None]
+
+
+class DocumentIssue(NamedTuple):
+    """A problem found in a node tree."""
+    path: str
+    message: str
+
+
+def _format_path(path: _Path) -> str:
+    segments = []
+    while path is not None:
+        path, segment = path
+        segments.append(f"[{segment}]" if isinstance(segment, int) else f".{segment}")
+    return "".join(reversed(segments)).lstrip(".") or "$"
+
+
+def _type_name(value: Any) -> str:
+    return "null" if value is None else type(value).__name__
+
+
+class _Compiler:
+    """Turns the TypedDict definitions into checkers and a per-type dispatch table."""
+
+    def __init__(self):
+        self.specs: Dict[str, _Checker] = {}
+        self._pending: Dict[str, type] = {}
+        self._namespace = vars(document_structure)
+
+    @staticmethod
+    def _node_type(tp: Any) -> Optional[str]:
+        """The ``type`` literal of a node/mark TypedDict (None for plain structs)."""
+        annotations = getattr(tp, "__annotations__", None)
+        if not annotations or not hasattr(tp, "__required_keys__"):
+            return None
+        hint = annotations.get("type")
+        if get_origin(hint) is Literal and len(get_args(hint)) == 1:
+            return get_args(hint)[0]
+        return None
+
+    def _hints(self, tp: type) -> Dict[str, Any]:
+        return get_type_hints(tp, globalns=self._namespace)
+
+    def node_types(self, tp: Any) -> FrozenSet[str]:
+        """Register every node TypedDict in a union and return their ``type`` names."""
+        members = get_args(tp) if get_origin(tp) is Union else (tp,)
+        names = set()
+        for member in members:
+            if isinstance(member, str):
+                member = self._namespace[member]
+            name = self._node_type(member)
+            if name is None:
+                raise TypeError(f"{member!r} is not a node type")
+            names.add(name)
+            if name not in self.specs and name not in self._pending:
+                self._pending[name] = member
+        return frozenset(names)
+
+    def build(self) -> Dict[str, _Checker]:
+        while self._pending:
+            name, tp = self._pending.popitem()
+            self.specs[name] = self._struct(tp, is_node=True)
+        return self.specs
+
+    def _is_node_union(self, tp: Any) -> bool:
+        members = get_args(tp) if get_origin(tp) is Union else (tp,)
+        return all(
+            self._node_type(self._namespace[m] if isinstance(m, str) else m) is not None
+            for m in members
+        )
+
+    def checker(self, tp: Any) -> _Checker:
+        """Compile a field annotation into a checker."""
+        origin = get_origin(tp)
+        if origin is Literal:
+            allowed = frozenset((type(value), value) for value in get_args(tp))
+            expected = " | ".join(repr(value) for value in get_args(tp))
+
+            def check_literal(value, path, issues, stack):
+                if not isinstance(value, (str, int, float, bool)) or (type(value), value) not in allowed:
+                    issues.append(DocumentIssue(_format_path(path), f"expected {expected}, got {value!r}"))
+            return check_literal
+
+        if origin in (list, List):
+            (item_type,) = get_args(tp) or (Any,)
+            if self._is_node_union(item_type):
+                allowed_types = self.node_types(item_type)
+
+                def check_nodes(value, path, issues, stack):
+                    if not isinstance(value, list):
+                        issues.append(DocumentIssue(_format_path(path), f"expected a list, got {_type_name(value)}"))
+                        return
+                    for index in range(len(value) - 1, -1, -1):
+                        stack.append((value[index], allowed_types, (path, index)))
+                return check_nodes
+
+            item_checker = self.checker(item_type)
+
+            def check_list(value, path, issues, stack):
+                if not isinstance(value, list):
+                    issues.append(DocumentIssue(_format_path(path), f"expected a list, got {_type_name(value)}"))
+                    return
+                for index, item in enumerate(value):
+                    item_checker(item, (path, index), issues, stack)
+            return check_list
+
+        if hasattr(tp, "__required_keys__"):
+            return self._struct(tp, is_node=False)
+
+        if tp is bool:
+            return self._instance(bool, "boolean")
+        if tp is int:
+            return self._instance(int, "integer", exclude_bool=True)
+        if tp is float:
+            return self._instance((int, float), "number", exclude_bool=True)
+        if tp is str:
+            return self._instance(str, "string")
+        if tp is dict or origin is dict:
+            return self._instance(dict, "object")
+
+        def check_any(value, path, issues, stack):
+            return None
+        return check_any
+
+    @staticmethod
+    def _instance(types: Any, label: str, exclude_bool: bool = False) -> _Checker:
+        def check_instance(value, path, issues, stack):
+            if not isinstance(value, types) or (exclude_bool and isinstance(value, bool)):
+                issues.append(DocumentIssue(_format_path(path), f"expected {label}, got {_type_name(value)}"))
+        return check_instance
+
+    def _struct(self, tp: type, is_node: bool) -> _Checker:
+        """Compile a TypedDict: required keys plus a checker per declared key."""
+        hints = self._hints(tp)
+        # A node's ``type`` was already checked by the dispatch
+        required = tuple(sorted(key for key in tp.__required_keys__ if not (is_node and key == "type")))
+        fields = tuple(
+            (key, self.checker(hint)) for key, hint in hints.items()
+            if not (is_node and key == "type")
+        )
+        node_type = self._node_type(tp) if is_node else None
+
+        def check_struct(value, path, issues, stack):
+            if not isinstance(value, dict):
+                issues.append(DocumentIssue(_format_path(path), f"expected an object, got {_type_name(value)}"))
+                return
+            for key in required:
+                if key not in value:
+                    owner = f"'{node_type}' node" if node_type else "object"
+                    issues.append(DocumentIssue(_format_path(path), f"{owner} is missing required '{key}'"))
+            for key, check in fields:
+                if key in value:
+                    check(value[key], (path, key), issues, stack)
+        return check_struct
+
+
+_TABLES: Optional[Tuple[Dict[str, _Checker], FrozenSet[str]]] = None
+
+
+def _dispatch_tables() -> Tuple[Dict[str, _Checker], FrozenSet[str]]:
+    """Compile the node definitions on first use."""
+    global _TABLES
+    if _TABLES is None:
+        compiler = _Compiler()
+        top_level = compiler.node_types(DocumentNode)
+        compiler.node_types(TextNode)
+        compiler.node_types(Mark)
+        _TABLES = (compiler.build(), top_level)
+    return _TABLES
+
+
+def validate_document(
+    document: Union[Dict[str, Any], List[Dict[str, Any]]],
+    limit: Optional[int] = None,
+) -> List[DocumentIssue]:
+    """
+    Check a node tree against the document node definitions.
+
+    Checks that every node has a known ``type`` allowed where it appears
+    (e.g. only ``listItem`` inside ``bulletList``), that required keys and
+    attrs are present with the right types and values (heading levels,
+    ``taskItem.attrs.checked``, mention kinds, ...), that marks are known mark
+    types, and that text nodes are not empty. Unknown extra keys are ignored.
+
+    Args:
+        document: List of top-level nodes, or a ``{"type": "doc", "content": [...]}`` document
+        limit: Stop after this many issues (default: report all)
+
+    Returns:
+        List[DocumentIssue]: Issues, each node's before those of its children; empty if the tree is valid
+
+    Example:
+        >>> validate_document([heading(7, "Title"), bullet_list("a", paragraph("b"))])
+        [DocumentIssue(path='[0].attrs.level', message='expected 1 | 2 | 3 | 4 | 5 | 6, got 7')]
+    """
+    specs, top_level = _dispatch_tables()
+    issues: List[DocumentIssue] = []
+    if isinstance(document, dict) and document.get("type") == "doc":
+        content = document.get("content", [])
+        root: _Path = (None, "content")
+    else:
+        content = document
+        root = None
+    if not isinstance(content, list):
+        return [DocumentIssue(_format_path(root), f"expected a list of nodes, got {_type_name(content)}")]
+
+    stack: list = [(content[index], top_level, (root, index)) for index in range(len(content) - 1, -1, -1)]
+    while stack:
+        if limit is not None and len(issues) >= limit:
+            return issues[:limit]
+        node, allowed, path = stack.pop()
+        if not isinstance(node, dict):
+            issues.append(DocumentIssue(_format_path(path), f"expected a node object, got {_type_name(node)}"))
+            continue
+        node_type = node.get("type")
+        if node_type not in allowed:
+            if isinstance(node_type, str) and node_type in specs:
+                message = f"'{node_type}' is not allowed here"
+            else:
+                message = f"unknown type {node_type!r}"
+            issues.append(DocumentIssue(_format_path(path), message))
+            continue
+        if node_type == "text" and not node.get("text"):
+            issues.append(DocumentIssue(_format_path((path, "text")), "text nodes cannot be empty"))
+        specs[node_type](node, path, issues, stack)
+    return issues if limit is None else issues[:limit]
+
+
+__all__ = [
+    'DocumentIssue',
+    'validate_document',
+]
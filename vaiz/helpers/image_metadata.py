@@ -0,0 +1,241 @@
+"""
+Client-side image metadata extraction.
+
+Reads image dimensions and MIME type straight from PNG, JPEG, GIF and WebP
+file headers, so image blocks can be assembled without asking the server
+for metadata. Only the first bytes of the file are read (JPEG files are
+walked segment by segment until the frame header is found).
+"""
+
+import io
+import os
+import struct
+from dataclasses import dataclass
+from typing import IO, Any, Dict, Optional, Union
+
+
+ImageSource = Union[str, "os.PathLike[str]", bytes, bytearray, memoryview, IO[bytes]]
+
+# Enough for every fixed-offset header we support (WebP VP8X needs 30 bytes)
+_HEADER_SIZE = 32
+
+# JPEG start-of-frame markers carrying the image dimensions
+# (C4 = DHT, C8 = JPG extension and CC = DAC are not frame headers)
+_JPEG_SOF_MARKERS = frozenset(
+    (0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF)
+)
+
+
+@dataclass(frozen=True)
+class ImageInfo:
+    """Basic image metadata read from a file header."""
+    width: int
+    height: int
+    mime: str
+    extension: str
+
+    @property
+    def dimensions(self) -> list:
+        """Dimensions in the ``[width, height]`` form used by ``UploadedFile.dimension``."""
+        return [self.width, self.height]
+
+    @property
+    def aspect_ratio(self) -> Optional[float]:
+        """Width divided by height, or None for a zero-height image."""
+        return self.width / self.height if self.height else None
+
+
+class _opened:
+    """Context manager yielding a readable binary stream for any ImageSource."""
+
+    def __init__(self, source: ImageSource):
+        self._source = source
+        self._owned: Optional[IO[bytes]] = None
+        self._position: Optional[int] = None
+
+    def __enter__(self) -> IO[bytes]:
+        source = self._source
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            self._owned = io.BytesIO(source)
+            return self._owned
+        if isinstance(source, (str, os.PathLike)):
+            self._owned = open(source, "rb")
+            return self._owned
+        # File-like object: remember the position so callers can reuse the stream
+        try:
+            self._position = source.tell()
+        except (AttributeError, OSError):
+            self._position = None
+        return source
+
+    def __exit__(self, *exc_info) -> None:
+        if self._owned is not None:
+            self._owned.close()
+        elif self._position is not None:
+            self._source.seek(self._position)
+
+
+def _read_jpeg_size(stream: IO[bytes]) -> Optional[tuple]:
+    """Walk JPEG segments until a start-of-frame marker and return (width, height)."""
+    stream.seek(2, io.SEEK_CUR)  # Skip SOI marker
+    while True:
+        byte = stream.read(1)
+        # Skip fill bytes between segments
+        while byte == b"\xff":
+            marker = stream.read(1)
+            if marker != b"\xff":
+                break
+            byte = marker
+        else:
+            return None
+        if not marker:
+            return None
+        code = marker[0]
+        # Standalone markers without a length field
+        if code == 0x01 or 0xD0 <= code <= 0xD7:
+            continue
+        if code in (0xD9, 0xDA):  # EOI / start of scan: no frame header found
+            return None
+        length_bytes = stream.read(2)
+        if len(length_bytes) != 2:
+            return None
+        (length,) = struct.unpack(">H", length_bytes)
+        if code in _JPEG_SOF_MARKERS:
+            frame = stream.read(5)
+            if len(frame) != 5:
+                return None
+            height, width = struct.unpack(">xHH", frame)
+            return width, height
+        stream.seek(length - 2, io.SEEK_CUR)
+
+
+def _parse_header(header: bytes, stream: IO[bytes], start: int) -> Optional[ImageInfo]:
+    """Detect the format from ``header`` and return its metadata."""
+    if header.startswith(b"\x89PNG\r\n\x1a\n") and header[12:16] == b"IHDR":
+        width, height = struct.unpack(">II", header[16:24])
+        return ImageInfo(width, height, "image/png", "png")
+
+    if header[:6] in (b"GIF87a", b"GIF89a"):
+        width, height = struct.unpack("<HH", header[6:10])
+        return ImageInfo(width, height, "image/gif", "gif")
+
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        chunk = header[12:16]
+        if chunk == b"VP8 " and header[23:26] == b"\x9d\x01\x2a":
+            width, height = struct.unpack("<HH", header[26:30])
+            return ImageInfo(width & 0x3FFF, height & 0x3FFF, "image/webp", "webp")
+        if chunk == b"VP8L" and header[20:21] == b"\x2f":
+            (bits,) = struct.unpack("<I", header[21:25])
+            width = (bits & 0x3FFF) + 1
+            height = ((bits >> 14) & 0x3FFF) + 1
+            return ImageInfo(width, height, "image/webp", "webp")
+        if chunk == b"VP8X":
+            width = int.from_bytes(header[24:27], "little") + 1
+            height = int.from_bytes(header[27:30], "little") + 1
+            return ImageInfo(width, height, "image/webp", "webp")
+        return None
+
+    if header[:2] == b"\xff\xd8":
+        stream.seek(start)
+        size = _read_jpeg_size(stream)
+        if size is None:
+            return None
+        return ImageInfo(size[0], size[1], "image/jpeg", "jpg")
+
+    return None
+
+
+def read_image_info(source: ImageSource) -> Optional[ImageInfo]:
+    """
+    Read image dimensions and MIME type from a file header.
+
+    Supports PNG, JPEG, GIF and WebP. Only the header is read, so this is
+    cheap even for very large files. File-like objects are left at the
+    position they were passed in with.
+
+    Args:
+        source: File path, raw bytes, or a binary file-like object
+
+    Returns:
+        Optional[ImageInfo]: Image metadata, or None if the format is not
+        recognized or the header is truncated
+
+    Example:
+        >>> info = read_image_info("photo.png")
+        >>> info.dimensions
+        [1920, 1080]
+        >>> info.mime
+        'image/png'
+    """
+    with _opened(source) as stream:
+        start = stream.tell()
+        header = stream.read(_HEADER_SIZE)
+        try:
+            return _parse_header(header, stream, start)
+        except (struct.error, ValueError, OSError):
+            return None
+
+
+def estimate_dominant_color(source: ImageSource, sample_size: int = 32) -> Optional[Dict[str, Any]]:
+    """
+    Estimate the dominant color of an image from a downsampled copy.
+
+    Decoding compressed pixel data is delegated to Pillow, which is an optional
+    dependency. When Pillow is not installed (or cannot decode the image)
+    None is returned, and image blocks are simply built without a dominant color.
+
+    Args:
+        source: File path, raw bytes, or a binary file-like object
+        sample_size: Edge length in pixels of the thumbnail used for sampling (default: 32)
+
+    Returns:
+        Optional[Dict[str, Any]]: ``{"color": "#rrggbb", "isDark": bool}`` or None
+
+    Example:
+        >>> estimate_dominant_color("photo.jpg")
+        {'color': '#3a5f8c', 'isDark': True}
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        return None
+
+    with _opened(source) as stream:
+        try:
+            with Image.open(stream) as image:
+                # draft() lets the JPEG decoder skip work by decoding at a reduced scale
+                image.draft("RGB", (sample_size, sample_size))
+                image = image.convert("RGB")
+                image.thumbnail((sample_size, sample_size))
+                data = image.tobytes()
+        except (OSError, ValueError):
+            return None
+
+    if not data:
+        return None
+
+    # Bucket colors into a coarse 4-bit-per-channel grid and average the most common bucket
+    buckets: Dict[int, list] = {}
+    for r, g, b in zip(data[0::3], data[1::3], data[2::3]):
+        key = ((r >> 4) << 8) | ((g >> 4) << 4) | (b >> 4)
+        bucket = buckets.get(key)
+        if bucket is None:
+            buckets[key] = [r, g, b, 1]
+        else:
+            bucket[0] += r
+            bucket[1] += g
+            bucket[2] += b
+            bucket[3] += 1
+    r_sum, g_sum, b_sum, count = max(buckets.values(), key=lambda bucket: bucket[3])
+    r, g, b = r_sum // count, g_sum // count, b_sum // count
+
+    # Perceived luminance (ITU-R BT.601)
+    luminance = 0.299 * r + 0.587 * g + 0.114 * b
+    return {"color": f"#{r:02x}{g:02x}{b:02x}", "isDark": luminance < 128}
+
+
+__all__ = [
+    'ImageInfo',
+    'read_image_info',
+    'estimate_dominant_color',
+]
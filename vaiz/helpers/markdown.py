@@ -0,0 +1,921 @@
+"""
+Offline conversion between Markdown and document JSON content.
+
+``markdown_to_nodes`` turns Markdown into the same nodes the builder functions
+in ``document_structure`` produce, so the result can be mixed with
+``image_block()``, ``mention_user()`` and friends and sent with
+``replace_json_document``. ``nodes_to_markdown`` renders nodes back to Markdown
+for previews.
+
+Both directions are streaming: input is consumed line by line (Markdown) or
+node by node (JSON), and top-level output is produced as soon as each block is
+complete, so large documents convert in linear time without the network.
+
+Supported Markdown: ATX headings, paragraphs, bold/italic/inline code/links,
+bullet, ordered and task lists (nested by indentation), GFM pipe tables, fenced
+code blocks, blockquotes, horizontal rules and ``<details>``/``<summary>``
+sections. Custom blocks without a Markdown equivalent (image and files blocks,
+embeds, mentions) are rendered as links or plain text, and TOC/anchors/siblings
+blocks are omitted.
+"""
+
+import json
+import re
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Union
+
+from .document_structure import (
+    DocumentNode,
+    TextNode,
+    blockquote,
+    bullet_list,
+    code_block,
+    details,
+    details_content,
+    details_summary,
+    heading,
+    horizontal_rule,
+    list_item,
+    ordered_list,
+    paragraph,
+    table,
+    table_cell,
+    table_header,
+    table_row,
+    task_item,
+    task_list,
+    text,
+)
+
+
+_HEADING_RE = re.compile(r"^ {0,3}(#{1,6})(?:[ \t]+(.*?))?(?:[ \t]+#+)?[ \t]*$")
+_FENCE_RE = re.compile(r"^ {0,3}(`{3,}|~{3,})[ \t]*([^`\s]*)")
+_HR_RE = re.compile(r"^ {0,3}([-*_])(?:[ \t]*\1){2,}[ \t]*$")
+_BLOCKQUOTE_RE = re.compile(r"^ {0,3}> ?(.*)$")
+_BULLET_RE = re.compile(r"^( *)([-*+])(?:([ \t]+)(.*))?$")
+_ORDERED_RE = re.compile(r"^( *)(\d{1,9})([.)])(?:([ \t]+)(.*))?$")
+_TASK_RE = re.compile(r"^\[([ xX])\](?:[ \t]+(.*))?$")
+_TABLE_SEP_RE = re.compile(r"^ {0,3}\|?[ \t]*:?-+:?[ \t]*(?:\|[ \t]*:?-+:?[ \t]*)*\|?[ \t]*$")
+_SUMMARY_RE = re.compile(r"^\s*<summary>(.*?)</summary>\s*$", re.IGNORECASE)
+_DETAILS_OPEN_RE = re.compile(r"<details\b", re.IGNORECASE)
+_DETAILS_CLOSE_RE = re.compile(r"</details\s*>", re.IGNORECASE)
+
+# ASCII punctuation that may be backslash-escaped
+_ESCAPABLE = frozenset("!\"#$%&'()*+,-./:;<=>?@[\\]^_`{|}~")
+
+# Characters escaped when rendering plain text (underscores only at word boundaries)
+_TEXT_ESCAPE_RE = re.compile(r"([\\`*\[\]]|(?<![0-9A-Za-z])_|_(?![0-9A-Za-z]))")
+
+_DELIMITERS = {"bold": "**", "italic": "*"}
+
+
+# ---------------------------------------------------------------------------
+# Markdown -> nodes
+# ---------------------------------------------------------------------------
+
+class _Lines:
+    """Line stream with lookahead, fed lazily from a string or an iterable of lines."""
+
+    def __init__(self, source: Iterable[str]):
+        self._source = iter(source)
+        self._buffer: Deque[str] = deque()
+
+    def _fill(self, count: int) -> bool:
+        while len(self._buffer) < count:
+            try:
+                line = next(self._source)
+            except StopIteration:
+                return False
+            line = line.rstrip("\r\n")
+            # Expand tabs in the indentation only
+            stripped = line.lstrip(" \t")
+            if "\t" in line[:len(line) - len(stripped)]:
+                line = line[:len(line) - len(stripped)].expandtabs(4) + stripped
+            self._buffer.append(line)
+        return True
+
+    def peek(self, offset: int = 0) -> Optional[str]:
+        if not self._fill(offset + 1):
+            return None
+        return self._buffer[offset]
+
+    def next(self) -> Optional[str]:
+        if not self._fill(1):
+            return None
+        return self._buffer.popleft()
+
+
+def _split_lines(markdown: Union[str, Iterable[str]]) -> Iterable[str]:
+    if isinstance(markdown, str):
+        return markdown.splitlines()
+    return markdown
+
+
+def _is_blank(line: str) -> bool:
+    return not line.strip()
+
+
+def _indent(line: str) -> int:
+    return len(line) - len(line.lstrip(" "))
+
+
+class _Item:
+    """A matched list item marker."""
+    __slots__ = ("indent", "kind", "offset", "text", "number", "checked")
+
+    def __init__(self, indent: int, kind: str, offset: int, text: str, number: int = 1, checked: bool = False):
+        self.indent = indent
+        self.kind = kind
+        self.offset = offset
+        self.text = text
+        self.number = number
+        self.checked = checked
+
+
+def _match_item(line: str) -> Optional[_Item]:
+    """Match a bullet, task or ordered list item marker."""
+    match = _BULLET_RE.match(line)
+    if match:
+        indent, _, gap, rest = match.groups()
+        if len(indent) > 3 or _HR_RE.match(line):
+            return None
+        offset = len(indent) + 1 + (len(gap) if gap else 1)
+        rest = rest or ""
+        task = _TASK_RE.match(rest)
+        if task:
+            return _Item(len(indent), "task", offset, task.group(2) or "", checked=task.group(1) != " ")
+        return _Item(len(indent), "bullet", offset, rest)
+    match = _ORDERED_RE.match(line)
+    if match:
+        indent, number, delimiter, gap, rest = match.groups()
+        if len(indent) > 3:
+            return None
+        offset = len(indent) + len(number) + 1 + (len(gap) if gap else 1)
+        return _Item(len(indent), "ordered", offset, rest or "", number=int(number))
+    return None
+
+
+def _is_table_start(lines: _Lines) -> bool:
+    first = lines.peek()
+    second = lines.peek(1)
+    return first is not None and "|" in first and second is not None and bool(_TABLE_SEP_RE.match(second))
+
+
+def _starts_block(line: str) -> bool:
+    """Whether a line interrupts a paragraph."""
+    return bool(
+        _HEADING_RE.match(line)
+        or _FENCE_RE.match(line)
+        or _HR_RE.match(line)
+        or _BLOCKQUOTE_RE.match(line)
+        or _DETAILS_OPEN_RE.match(line.strip())
+        or _match_item(line)
+    )
+
+
+def _find_closing(s: str, delimiter: str, start: int, failed: Dict[str, int]) -> int:
+    """
+    Find a closing emphasis delimiter that is not preceded by whitespace.
+
+    ``failed`` maps delimiters to the smallest start a search in ``s`` has
+    failed from. A search from a later start visits the same runs once past
+    its first one, so it only checks that run: unmatched delimiters cost one
+    scan of the string in total instead of one scan each.
+    """
+    char = delimiter[0]
+    size = len(delimiter)
+    settled = delimiter in failed and start >= failed[delimiter]
+    j = start
+    while True:
+        j = s.find(delimiter, j)
+        if j == -1:
+            break
+        run_end = j
+        while run_end < len(s) and s[run_end] == char:
+            run_end += 1
+        run = run_end - j
+        if size == 1 and run == 2:
+            # A double delimiter inside single emphasis belongs to nested bold
+            pass
+        elif j > start and not s[j - 1].isspace():
+            if char != "_" or run_end >= len(s) or not s[run_end].isalnum():
+                # Use the rightmost delimiters of a longer run ("**a *b***")
+                return run_end - size
+        if settled:
+            return -1
+        j = run_end
+    if not settled:
+        failed[delimiter] = start
+    return -1
+
+
+def _find(s: str, sub: str, start: int, absent: Dict[str, int]) -> int:
+    """``s.find(sub, start)``, remembering in ``absent`` where ``sub`` no longer occurs."""
+    if start >= absent.get(sub, len(s) + 1):
+        return -1
+    j = s.find(sub, start)
+    if j == -1:
+        absent[sub] = start
+    return j
+
+
+def _match_brackets(s: str) -> Dict[int, int]:
+    """Map the position of each ``[`` to its matching ``]`` in one pass (escapes skipped)."""
+    matches: Dict[int, int] = {}
+    open_positions: List[int] = []
+    i = 0
+    while i < len(s):
+        c = s[i]
+        if c == "\\":
+            i += 2
+            continue
+        if c == "[":
+            open_positions.append(i)
+        elif c == "]" and open_positions:
+            matches[open_positions.pop()] = i
+        i += 1
+    return matches
+
+
+def _parse_inline(s: str, bold: bool = False, italic: bool = False, link: Optional[str] = None) -> List[TextNode]:
+    """Parse inline Markdown into text nodes with marks."""
+    nodes: List[TextNode] = []
+    buffer: List[str] = []
+
+    def flush() -> None:
+        if buffer:
+            nodes.append(text("".join(buffer), bold=bold, italic=italic, link=link))
+            buffer.clear()
+
+    # Search results reused across the loop, so unmatched delimiters, backticks
+    # and brackets do not each rescan the rest of ``s``
+    failed: Dict[str, int] = {}
+    absent: Dict[str, int] = {}
+    brackets: Optional[Dict[int, int]] = None
+
+    i = 0
+    n = len(s)
+    while i < n:
+        c = s[i]
+
+        if c == "\\" and i + 1 < n and s[i + 1] in _ESCAPABLE:
+            buffer.append(s[i + 1])
+            i += 2
+            continue
+
+        if c == "`":
+            run_end = i
+            while run_end < n and s[run_end] == "`":
+                run_end += 1
+            fence = s[i:run_end]
+            close = _find(s, fence, run_end, absent)
+            while close != -1 and close + len(fence) < n and s[close + len(fence)] == "`":
+                close = _find(s, fence, close + len(fence) + 1, absent)
+            if close == -1:
+                buffer.append(fence)
+                i = run_end
+                continue
+            code = s[run_end:close]
+            if len(code) > 2 and code[0] == " " and code[-1] == " " and code.strip():
+                code = code[1:-1]
+            flush()
+            nodes.append(text(code, bold=bold, italic=italic, code=True, link=link))
+            i = close + len(fence)
+            continue
+
+        if c == "[" and link is None:
+            if brackets is None:
+                brackets = _match_brackets(s)
+            close_bracket = brackets.get(i, -1)
+            if close_bracket != -1 and s.startswith("(", close_bracket + 1):
+                href_start = close_bracket + 2
+                if s.startswith("<", href_start):
+                    href_end = _find(s, ">", href_start, absent)
+                    close_paren = _find(s, ")", href_end, absent) if href_end != -1 else -1
+                    href = s[href_start + 1:href_end] if href_end != -1 else ""
+                else:
+                    close_paren = _find(s, ")", href_start, absent)
+                    href = s[href_start:close_paren].strip() if close_paren != -1 else ""
+                if close_paren != -1 and href:
+                    flush()
+                    nodes.extend(_parse_inline(s[i + 1:close_bracket], bold, italic, href))
+                    i = close_paren + 1
+                    continue
+
+        if c in "*_":
+            run_end = i
+            while run_end < n and s[run_end] == c:
+                run_end += 1
+            run = run_end - i
+            opens = run_end < n and not s[run_end].isspace() and (c == "*" or i == 0 or not s[i - 1].isalnum())
+            if opens:
+                if run >= 3 and not bold and not italic:
+                    close = _find_closing(s, c * 3, i + 3, failed)
+                    if close != -1:
+                        flush()
+                        nodes.extend(_parse_inline(s[i + 3:close], True, True, link))
+                        i = close + 3
+                        continue
+                if run >= 2 and not bold:
+                    close = _find_closing(s, c * 2, i + 2, failed)
+                    if close != -1:
+                        flush()
+                        nodes.extend(_parse_inline(s[i + 2:close], True, italic, link))
+                        i = close + 2
+                        continue
+                if not italic:
+                    close = _find_closing(s, c, i + 1, failed)
+                    if close != -1:
+                        flush()
+                        nodes.extend(_parse_inline(s[i + 1:close], bold, True, link))
+                        i = close + 1
+                        continue
+            buffer.append(s[i:run_end])
+            i = run_end
+            continue
+
+        buffer.append(c)
+        i += 1
+
+    flush()
+    return _merge_text_nodes(nodes)
+
+
+def _merge_text_nodes(nodes: List[TextNode]) -> List[TextNode]:
+    """Merge adjacent text nodes that carry identical marks."""
+    merged: List[TextNode] = []
+    for node in nodes:
+        if merged and merged[-1].get("marks") == node.get("marks"):
+            merged[-1] = {**merged[-1], "text": merged[-1]["text"] + node["text"]}
+        else:
+            merged.append(node)
+    return merged
+
+
+def _split_table_row(line: str) -> List[str]:
+    """Split a pipe table row into raw cell strings, honoring ``\\|`` escapes."""
+    line = line.strip()
+    if line.startswith("|"):
+        line = line[1:]
+    if line.endswith("|") and not line.endswith("\\|"):
+        line = line[:-1]
+    cells: List[str] = []
+    current: List[str] = []
+    i = 0
+    while i < len(line):
+        c = line[i]
+        if c == "\\" and i + 1 < len(line):
+            current.append(line[i:i + 2])
+            i += 2
+            continue
+        if c == "|":
+            cells.append("".join(current).strip())
+            current = []
+        else:
+            current.append(c)
+        i += 1
+    cells.append("".join(current).strip())
+    return cells
+
+
+def _inline_paragraph(raw: str) -> Dict[str, Any]:
+    return paragraph(*_parse_inline(raw))
+
+
+def _parse_table(lines: _Lines) -> DocumentNode:
+    header = _split_table_row(lines.next())
+    lines.next()  # separator row
+    rows = [table_row(*(table_header(_inline_paragraph(cell)) for cell in header))]
+    width = len(header)
+    while True:
+        line = lines.peek()
+        if line is None or _is_blank(line) or "|" not in line:
+            break
+        lines.next()
+        cells = _split_table_row(line)[:width]
+        cells += [""] * (width - len(cells))
+        rows.append(table_row(*(table_cell(_inline_paragraph(cell)) for cell in cells)))
+    return table(*rows)
+
+
+def _parse_fenced_code(lines: _Lines, match: "re.Match") -> DocumentNode:
+    fence, language = match.group(1), match.group(2)
+    lines.next()
+    code_lines: List[str] = []
+    while True:
+        line = lines.next()
+        if line is None:
+            break
+        stripped = line.strip()
+        if stripped.startswith(fence[0] * len(fence)) and not stripped.strip(fence[0]):
+            break
+        code_lines.append(line)
+    return code_block(code="\n".join(code_lines), language=language)
+
+
+def _parse_list(lines: _Lines, first: _Item) -> DocumentNode:
+    kind = first.kind
+    items: List[Dict[str, Any]] = []
+    while True:
+        line = lines.peek()
+        if line is None:
+            break
+        item = _match_item(line)
+        if item is None or item.kind != kind:
+            break
+        lines.next()
+
+        body = [item.text]
+        while True:
+            following = lines.peek()
+            if following is None:
+                break
+            if _is_blank(following):
+                blanks = 0
+                while lines.peek() is not None and _is_blank(lines.peek()):
+                    lines.next()
+                    blanks += 1
+                after = lines.peek()
+                if after is not None and _indent(after) >= item.offset:
+                    body.extend([""] * blanks)
+                    continue
+                break
+            if _indent(following) >= item.offset:
+                body.append(following[item.offset:])
+                lines.next()
+                continue
+            if body[-1].strip() and not _starts_block(following) and not _is_table_start(lines):
+                # Lazy paragraph continuation
+                body.append(following.strip())
+                lines.next()
+                continue
+            break
+
+        children = list(_iter_blocks(_Lines(body))) or [paragraph()]
+        if kind == "task":
+            items.append(task_item(*children, checked=item.checked))
+        else:
+            items.append(list_item(*children))
+
+    if kind == "task":
+        return task_list(*items)
+    if kind == "ordered":
+        return ordered_list(*items, start=first.number)
+    return bullet_list(*items)
+
+
+def _parse_details(lines: _Lines) -> DocumentNode:
+    depth = 0
+    inner: List[str] = []
+    while True:
+        line = lines.next()
+        if line is None:
+            break
+        opened = len(_DETAILS_OPEN_RE.findall(line))
+        closed = len(_DETAILS_CLOSE_RE.findall(line))
+        if depth == 0:
+            # Opening line: keep anything after the tag
+            remainder = _DETAILS_OPEN_RE.split(line, 1)[1]
+            remainder = remainder.split(">", 1)[1] if ">" in remainder else ""
+            depth = opened - closed
+            if remainder.strip() and depth > 0:
+                inner.append(remainder)
+            if depth <= 0:
+                break
+            continue
+        depth += opened - closed
+        if depth <= 0:
+            before = _DETAILS_CLOSE_RE.split(line)[0]
+            if before.strip():
+                inner.append(before)
+            break
+        inner.append(line)
+
+    summary_content: List[TextNode] = []
+    while inner and _is_blank(inner[0]):
+        inner.pop(0)
+    if inner:
+        match = _SUMMARY_RE.match(inner[0])
+        if match:
+            summary_content = _parse_inline(match.group(1).strip())
+            inner.pop(0)
+
+    body = list(_iter_blocks(_Lines(inner)))
+    summary = details_summary(*summary_content)
+    if body:
+        return details(summary, details_content(*body))
+    return details(summary)
+
+
+def _parse_paragraph(lines: _Lines) -> DocumentNode:
+    parts: List[str] = []
+    while True:
+        line = lines.peek()
+        if line is None or _is_blank(line):
+            break
+        if parts and (_starts_block(line) or _is_table_start(lines)):
+            break
+        parts.append(line.strip())
+        lines.next()
+    return _inline_paragraph(" ".join(parts))
+
+
+def _iter_blocks(lines: _Lines) -> Iterator[DocumentNode]:
+    """Yield top-level block nodes from a line stream."""
+    while True:
+        line = lines.peek()
+        if line is None:
+            return
+        if _is_blank(line):
+            lines.next()
+            continue
+
+        match = _FENCE_RE.match(line)
+        if match:
+            yield _parse_fenced_code(lines, match)
+            continue
+
+        match = _HEADING_RE.match(line)
+        if match:
+            lines.next()
+            yield heading(len(match.group(1)), *_parse_inline(match.group(2) or ""))
+            continue
+
+        if _HR_RE.match(line):
+            lines.next()
+            yield horizontal_rule()
+            continue
+
+        if _BLOCKQUOTE_RE.match(line):
+            quoted: List[str] = []
+            while lines.peek() is not None:
+                match = _BLOCKQUOTE_RE.match(lines.peek())
+                if not match:
+                    break
+                quoted.append(match.group(1))
+                lines.next()
+            yield blockquote(*_iter_blocks(_Lines(quoted)))
+            continue
+
+        if _DETAILS_OPEN_RE.match(line.strip()):
+            yield _parse_details(lines)
+            continue
+
+        if _is_table_start(lines):
+            yield _parse_table(lines)
+            continue
+
+        item = _match_item(line)
+        if item is not None:
+            yield _parse_list(lines, item)
+            continue
+
+        yield _parse_paragraph(lines)
+
+
+def iter_markdown_nodes(markdown: Union[str, Iterable[str]]) -> Iterator[DocumentNode]:
+    """
+    Lazily convert Markdown into document nodes.
+
+    Top-level nodes are yielded as soon as their block ends, so an open file
+    can be converted without reading it into memory first.
+
+    Args:
+        markdown: Markdown string, or an iterable of lines (e.g. an open text file)
+
+    Returns:
+        Iterator[DocumentNode]: Top-level document nodes
+
+    Example:
+        >>> with open("notes.md", encoding="utf-8") as f:
+        ...     for node in iter_markdown_nodes(f):
+        ...         print(node["type"])
+    """
+    return _iter_blocks(_Lines(_split_lines(markdown)))
+
+
+def markdown_to_nodes(markdown: Union[str, Iterable[str]]) -> List[DocumentNode]:
+    """
+    Convert Markdown into document nodes locally.
+
+    The nodes are built with the same builder functions as hand-written
+    content, so they can be combined with custom blocks before sending:
+
+    Args:
+        markdown: Markdown string, or an iterable of lines
+
+    Returns:
+        List[DocumentNode]: Top-level document nodes
+
+    Example:
+        >>> from vaiz import markdown_to_nodes, mention_user, paragraph
+        >>> content = markdown_to_nodes("# Release notes\\n\\n- Faster sync\\n- [x] Docs")
+        >>> content.append(paragraph("Owner: ", mention_user(member_id)))
+        >>> client.replace_json_document(document_id, content)
+    """
+    return list(iter_markdown_nodes(markdown))
+
+
+# ---------------------------------------------------------------------------
+# Nodes -> Markdown
+# ---------------------------------------------------------------------------
+
+def _escape_text(value: str) -> str:
+    return _TEXT_ESCAPE_RE.sub(r"\\\1", value)
+
+
+def _code_span(value: str) -> str:
+    longest = 0
+    for run in re.findall(r"`+", value):
+        longest = max(longest, len(run))
+    fence = "`" * (longest + 1)
+    if value.startswith("`") or value.endswith("`"):
+        value = f" {value} "
+    return f"{fence}{value}{fence}"
+
+
+def _node_marks(node: Dict[str, Any]):
+    bold = italic = code = False
+    href = None
+    for mark in node.get("marks") or ():
+        mark_type = mark.get("type")
+        if mark_type == "bold":
+            bold = True
+        elif mark_type == "italic":
+            italic = True
+        elif mark_type == "code":
+            code = True
+        elif mark_type == "link":
+            href = (mark.get("attrs") or {}).get("href")
+    return bold, italic, code, href
+
+
+def _render_link_target(href: str) -> str:
+    if any(c in href for c in " ()<>"):
+        return f"<{href}>"
+    return href
+
+
+def _render_inline(nodes: Iterable[Dict[str, Any]]) -> str:
+    """
+    Render inline nodes.
+
+    Emphasis is opened and closed incrementally so adjacent nodes sharing a
+    mark nest correctly (``**a *b***``), and whitespace at mark boundaries is
+    moved outside the delimiters, where Markdown requires it to be.
+    """
+    out: List[str] = []
+    stack: List[str] = []  # open emphasis marks, outermost first
+    current_href: Optional[str] = None
+    link_start = 0
+
+    def close(count: int) -> None:
+        if not count:
+            return
+        trailing = ""
+        if out:
+            stripped = out[-1].rstrip()
+            trailing = out[-1][len(stripped):]
+            out[-1] = stripped
+        for _ in range(count):
+            out.append(_DELIMITERS[stack.pop()])
+        if trailing:
+            out.append(trailing)
+
+    def close_link() -> None:
+        nonlocal current_href
+        close(len(stack))
+        if current_href is not None:
+            label = "".join(out[link_start:])
+            del out[link_start:]
+            out.append(f"[{label}]({_render_link_target(current_href)})")
+            current_href = None
+
+    for node in nodes:
+        node_type = node.get("type")
+        wanted: List[str] = []
+        href = None
+        if node_type == "text":
+            bold, italic, code, href = _node_marks(node)
+            value = node.get("text", "").replace("\n", " ")
+            rendered = _code_span(value) if code else _escape_text(value)
+            if bold:
+                wanted.append("bold")
+            if italic:
+                wanted.append("italic")
+        elif node_type == "custom-mention":
+            item = ((node.get("attrs") or {}).get("data") or {}).get("item") or {}
+            rendered = f"@{item.get('kind', 'Item')}:{item.get('id', '')}"
+        elif node_type == "hardBreak":
+            rendered = "  \n"
+        else:
+            rendered = _render_inline(node.get("content") or ())
+
+        if href != current_href:
+            close_link()
+            if href is not None:
+                current_href = href
+                link_start = len(out)
+
+        # Close marks this node does not carry (and everything opened after them)
+        for index, mark in enumerate(stack):
+            if mark not in wanted:
+                close(len(stack) - index)
+                break
+
+        if rendered.strip():
+            lead = rendered[:len(rendered) - len(rendered.lstrip())]
+            for mark in wanted:
+                if mark not in stack:
+                    if lead:
+                        out.append(lead)
+                        rendered = rendered[len(lead):]
+                        lead = ""
+                    out.append(_DELIMITERS[mark])
+                    stack.append(mark)
+        out.append(rendered)
+
+    close_link()
+    return "".join(out)
+
+
+def _render_paragraph(node: Dict[str, Any]) -> str:
+    rendered = _render_inline(node.get("content") or ())
+    # Escape characters that would otherwise start a block
+    if rendered[:1] in ("#", ">", "-", "+", "|"):
+        rendered = "\\" + rendered
+    else:
+        match = re.match(r"^(\d+)([.)])", rendered)
+        if match:
+            rendered = f"{match.group(1)}\\{rendered[len(match.group(1)):]}"
+    return rendered
+
+
+def _indent_block(block: str, width: int) -> str:
+    pad = " " * width
+    return "\n".join(pad + line if line else line for line in block.split("\n"))
+
+
+def _render_item(marker: str, children: List[Dict[str, Any]]) -> str:
+    blocks = [block for block in (_render_block(child) for child in children) if block is not None]
+    if not blocks:
+        return marker.rstrip()
+    body = blocks[0]
+    for child, block in zip(children[1:], blocks[1:]):
+        separator = "\n" if child.get("type") in ("bulletList", "orderedList", "taskList") else "\n\n"
+        body += separator + block
+    first, _, rest = body.partition("\n")
+    rendered = marker + first
+    if rest:
+        rendered += "\n" + _indent_block(rest, len(marker))
+    return rendered
+
+
+def _render_table(node: Dict[str, Any]) -> str:
+    rows: List[List[str]] = []
+    for row in node.get("content") or ():
+        cells = []
+        for cell in row.get("content") or ():
+            rendered = " ".join(
+                _render_paragraph(child) if child.get("type") == "paragraph" else (_render_block(child) or "")
+                for child in cell.get("content") or ()
+            )
+            cells.append(rendered.replace("\n", " ").replace("|", "\\|"))
+        rows.append(cells)
+    if not rows:
+        return ""
+    width = max(len(row) for row in rows)
+    lines = []
+    for index, row in enumerate(rows):
+        row = row + [""] * (width - len(row))
+        lines.append("| " + " | ".join(row) + " |")
+        if index == 0:
+            lines.append("| " + " | ".join(["---"] * width) + " |")
+    return "\n".join(lines)
+
+
+def _render_block(node: Dict[str, Any]) -> Optional[str]:
+    """Render one block node; None means the node has no Markdown representation."""
+    node_type = node.get("type")
+    content = node.get("content") or []
+
+    if node_type == "paragraph":
+        return _render_paragraph(node)
+    if node_type == "heading":
+        level = (node.get("attrs") or {}).get("level", 1)
+        return ("#" * level + " " + _render_inline(content)).rstrip()
+    if node_type == "bulletList":
+        return "\n".join(_render_item("- ", item.get("content") or []) for item in content)
+    if node_type == "orderedList":
+        start = (node.get("attrs") or {}).get("start", 1)
+        return "\n".join(
+            _render_item(f"{start + index}. ", item.get("content") or [])
+            for index, item in enumerate(content)
+        )
+    if node_type == "taskList":
+        return "\n".join(
+            _render_item(
+                "- [x] " if (item.get("attrs") or {}).get("checked") else "- [ ] ",
+                item.get("content") or [],
+            )
+            for item in content
+        )
+    if node_type == "codeBlock":
+        code = "".join(child.get("text", "") for child in content)
+        language = (node.get("attrs") or {}).get("language") or ""
+        longest = max([len(run) for run in re.findall(r"`{3,}", code)] or [2])
+        fence = "`" * (longest + 1)
+        return f"{fence}{language}\n{code}\n{fence}"
+    if node_type == "horizontalRule":
+        return "---"
+    if node_type == "blockquote":
+        inner = "\n\n".join(block for block in (_render_block(child) for child in content) if block is not None)
+        return "\n".join(f"> {line}" if line else ">" for line in inner.split("\n"))
+    if node_type == "extension-table":
+        return _render_table(node)
+    if node_type == "details":
+        summary = ""
+        blocks: List[str] = []
+        for child in content:
+            if child.get("type") == "detailsSummary":
+                summary = _render_inline(child.get("content") or [])
+            else:
+                for grandchild in child.get("content") or []:
+                    block = _render_block(grandchild)
+                    if block is not None:
+                        blocks.append(block)
+        parts = ["<details>", f"<summary>{summary}</summary>"]
+        if blocks:
+            parts.append("\n" + "\n\n".join(blocks) + "\n")
+        parts.append("</details>")
+        return "\n".join(parts)
+
+    # Custom blocks store their data as JSON in a text child
+    payload: Dict[str, Any] = {}
+    if (node.get("attrs") or {}).get("custom") == 1 and content:
+        try:
+            payload = json.loads(content[0].get("text", "")) or {}
+        except (TypeError, ValueError):
+            payload = {}
+    if node_type == "image-block":
+        alt = payload.get("caption") or payload.get("title") or ""
+        return f"![{_escape_text(alt)}]({_render_link_target(payload.get('src', ''))})"
+    if node_type == "files":
+        return "\n".join(
+            f"- [{_escape_text(item.get('name', ''))}]({_render_link_target(item.get('url', ''))})"
+            for item in payload.get("files", [])
+        ) or None
+    if node_type == "embed":
+        url = payload.get("url", "")
+        return f"[{_escape_text(url)}]({_render_link_target(url)})" if url else None
+    if node_type in ("doc-siblings",):
+        return None
+    if node_type in ("text", "custom-mention"):
+        return _render_inline([node])
+
+    # Unknown container: render its children
+    blocks = [block for block in (_render_block(child) for child in content) if block is not None]
+    return "\n\n".join(blocks) if blocks else None
+
+
+def iter_markdown(content: Union[Dict[str, Any], Iterable[Dict[str, Any]]]) -> Iterator[str]:
+    """
+    Lazily render document nodes as Markdown blocks.
+
+    Args:
+        content: Document dict from ``get_json_document`` or an iterable of top-level nodes
+
+    Returns:
+        Iterator[str]: One Markdown block per top-level node (blocks without a
+        Markdown representation are skipped)
+    """
+    nodes = (content.get("content") or []) if isinstance(content, dict) else content
+    for node in nodes:
+        block = _render_block(node)
+        if block:
+            yield block
+
+
+def nodes_to_markdown(content: Union[Dict[str, Any], Iterable[Dict[str, Any]]]) -> str:
+    """
+    Render document nodes as Markdown locally.
+
+    Args:
+        content: Document dict from ``get_json_document`` or a list of top-level nodes
+
+    Returns:
+        str: Markdown text with blocks separated by blank lines
+
+    Example:
+        >>> nodes_to_markdown([heading(1, "Title"), paragraph("Some ", text("bold", bold=True), " text")])
+        '# Title\\n\\nSome **bold** text'
+    """
+    return "\n\n".join(iter_markdown(content))
+
+
+__all__ = [
+    'iter_markdown_nodes',
+    'markdown_to_nodes',
+    'iter_markdown',
+    'nodes_to_markdown',
+]
@@ -0,0 +1,159 @@
+"""
+Cross-reference index of mentions between documents and tasks, users, etc.
+
+``MentionIndex`` records the items each document mentions (as found by
+``extract_mentions``) and the reverse, so "which documents link to this task?"
+is answered without requests. ``VaizClient.refresh_mention_index`` keeps it in
+sync with a space, project or member scope.
+"""
+
+import json
+import os
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+
+class MentionIndex:
+    """
+    Cross-reference index of mentions: document -> mentioned items, and the reverse.
+
+    Each document entry also stores the ``updatedAt`` it was indexed at, so
+    ``refresh_mention_index`` only refetches documents that changed. When a
+    path is given, the index is loaded from and saved to a JSON file.
+
+    Example:
+        >>> index = MentionIndex(path="~/.cache/vaiz/mentions.json")
+        >>> client.refresh_mention_index(index, Kind.Project, project_id)
+        >>> index.get_backlinks(task_id, kind="Task")
+        ['68fa6c7b62f676bcd1bcecae']
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Initialize the index.
+
+        Args:
+            path: Optional JSON file to persist the index to
+        """
+        self.path = os.path.expanduser(path) if path else None
+        self._documents: Dict[str, Tuple[Optional[str], List[Tuple[str, str]]]] = {}
+        self._backlinks: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+        if self.path:
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def __contains__(self, document_id: object) -> bool:
+        return document_id in self._documents
+
+    @property
+    def document_ids(self) -> List[str]:
+        """IDs of all indexed documents."""
+        return list(self._documents)
+
+    def get_version(self, document_id: str) -> Optional[str]:
+        """Return the ``updatedAt`` a document was indexed at, if known."""
+        entry = self._documents.get(document_id)
+        return entry[0] if entry else None
+
+    def update(self, document_id: str, mentions: Iterable[Dict[str, Any]], version: Optional[str] = None) -> None:
+        """
+        Replace the mentions recorded for a document.
+
+        Args:
+            document_id: Document ID
+            mentions: Mentioned items (``{"id": ..., "kind": ...}``), e.g. from ``extract_mentions``
+            version: The document's ``updatedAt``, used to skip it while unchanged
+        """
+        items = list(dict.fromkeys((item.get("kind") or "", item["id"]) for item in mentions))
+        with self._lock:
+            self._unlink(document_id)
+            self._documents[document_id] = (version, items)
+            for _, item_id in items:
+                self._backlinks.setdefault(item_id, set()).add(document_id)
+
+    def remove(self, document_id: str) -> bool:
+        """
+        Drop a document from the index.
+
+        Returns:
+            bool: True if the document was indexed
+        """
+        with self._lock:
+            return self._unlink(document_id)
+
+    def _unlink(self, document_id: str) -> bool:
+        entry = self._documents.pop(document_id, None)
+        if entry is None:
+            return False
+        for _, item_id in entry[1]:
+            referrers = self._backlinks.get(item_id)
+            if referrers is None:
+                continue  # same ID mentioned with two kinds
+            referrers.discard(document_id)
+            if not referrers:
+                del self._backlinks[item_id]
+        return True
+
+    def get_mentions(self, document_id: str) -> List[Dict[str, str]]:
+        """Return the items mentioned in a document, in document order."""
+        entry = self._documents.get(document_id)
+        return [{"id": item_id, "kind": kind} for kind, item_id in entry[1]] if entry else []
+
+    def get_backlinks(self, item_id: str, kind: Optional[str] = None) -> List[str]:
+        """
+        Return the IDs of documents that mention an item.
+
+        Args:
+            item_id: ID of the mentioned task, document, user or milestone
+            kind: Only count mentions of this kind ("Task", "Document", "User", "Milestone")
+
+        Returns:
+            List[str]: Sorted document IDs
+        """
+        with self._lock:
+            referrers = self._backlinks.get(item_id, ())
+            if kind is not None:
+                referrers = [
+                    document_id for document_id in referrers
+                    if (kind, item_id) in self._documents[document_id][1]
+                ]
+            return sorted(referrers)
+
+    def clear(self) -> None:
+        """Forget all documents."""
+        with self._lock:
+            self._documents.clear()
+            self._backlinks.clear()
+
+    def save(self) -> None:
+        """Atomically write the index to disk (no-op without a path)."""
+        if not self.path:
+            return
+        # Deferred so the helpers package does not load the API clients
+        from ..api.cache import write_json_atomic
+
+        with self._lock:
+            documents = {
+                document_id: {"updatedAt": version, "mentions": [list(item) for item in items]}
+                for document_id, (version, items) in self._documents.items()
+            }
+        write_json_atomic(self.path, {"version": 1, "documents": documents})
+
+    def _load(self) -> None:
+        """Load a persisted index, ignoring a missing or unreadable file."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        for document_id, entry in data.get("documents", {}).items():
+            mentions = [{"kind": kind, "id": item_id} for kind, item_id in entry.get("mentions", [])]
+            self.update(document_id, mentions, entry.get("updatedAt"))
+
+
+__all__ = [
+    'MentionIndex',
+]
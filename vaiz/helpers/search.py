@@ -0,0 +1,315 @@
+"""
+Local full-text search over task names and document content.
+
+``SearchIndex`` is an in-memory inverted index: every task or document is
+tokenized once when it is added, and queries only look up postings, so
+searching a space with 100k tasks takes milliseconds and no requests.
+
+Pass an index to the client (``VaizClient(..., search_index=index)``) to keep
+it up to date automatically: tasks and documents fetched or written through
+the client are (re)indexed as they pass by.
+"""
+
+import bisect
+import heapq
+import re
+import threading
+from collections import Counter
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from .document_tree import DocumentTree
+
+
+TASK = "task"
+DOCUMENT = "document"
+
+# Tokens in a title count this many times as often as tokens in the body
+_TITLE_WEIGHT = 3
+# Exact term matches score higher than prefix matches
+_EXACT_WEIGHT = 2
+
+_TOKEN_RE = re.compile(r"\w+")
+
+_Key = Tuple[str, str]
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase word tokens.
+
+    Example:
+        >>> tokenize("Fix login-page CSS (PRJ-12)")
+        ['fix', 'login', 'page', 'css', 'prj', '12']
+    """
+    return _TOKEN_RE.findall(text.lower())
+
+
+class SearchHit(NamedTuple):
+    """A search result: what matched and how well."""
+    kind: str
+    id: str
+    title: str
+    score: int
+
+
+class _Entry:
+    __slots__ = ("title", "sort_title", "title_tokens", "body_tokens", "counts")
+
+    def __init__(self) -> None:
+        self.title = ""
+        self.sort_title = ""
+        self.title_tokens: Counter = Counter()
+        self.body_tokens: Counter = Counter()
+        self.counts: Dict[str, int] = {}
+
+
+class SearchIndex:
+    """
+    In-memory inverted index over tasks (``name`` and ``hrid``) and documents
+    (title and text).
+
+    Queries match every word (AND); with ``prefix=True`` each word also
+    matches longer tokens, so ``"deplo pip"`` finds "Deployment pipeline".
+    Updating an item only touches the postings of the tokens that changed.
+    The index is safe to update from several threads.
+
+    Example:
+        >>> index = SearchIndex()
+        >>> client = VaizClient(api_key=..., space_id=..., search_index=index)
+        >>> client.get_tasks(GetTasksRequest(limit=50))  # tasks are indexed as they arrive
+        >>> index.search("login bug", kind="task")
+        [SearchHit(kind='task', id='65a...', title='Fix login bug', score=12)]
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[_Key, _Entry] = {}
+        self._postings: Dict[str, Dict[_Key, int]] = {}
+        self._vocabulary: List[str] = []
+        self._vocabulary_dirty = False
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def _update(
+        self,
+        key: _Key,
+        title: Optional[str] = None,
+        body: Optional[Counter] = None,
+        append: Optional[Counter] = None,
+    ) -> None:
+        """Replace the title and/or body tokens of an item and patch the postings."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = _Entry()
+            if title is not None:
+                entry.title = title
+                entry.sort_title = title.lower()
+                entry.title_tokens = Counter(tokenize(title))
+            if body is not None:
+                entry.body_tokens = body
+            if append is not None:
+                entry.body_tokens.update(append)
+
+            counts = dict(entry.body_tokens)
+            for token, count in entry.title_tokens.items():
+                counts[token] = counts.get(token, 0) + count * _TITLE_WEIGHT
+
+            old = entry.counts
+            postings_by_token = self._postings
+            for token in old:
+                if token not in counts:
+                    postings = postings_by_token[token]
+                    del postings[key]
+                    if not postings:
+                        del postings_by_token[token]
+            for token, count in counts.items():
+                if old.get(token) == count:
+                    continue
+                postings = postings_by_token.get(token)
+                if postings is None:
+                    postings = postings_by_token[token] = {}
+                    self._vocabulary_dirty = True
+                postings[key] = count
+            entry.counts = counts
+
+    def add_task(self, task: Any) -> None:
+        """
+        Index (or re-index) a task by its name and hrid.
+
+        Args:
+            task: A ``Task`` model, or a raw task dict from the API
+        """
+        if isinstance(task, dict):
+            task_id, name, hrid = task["_id"], task.get("name", ""), task.get("hrid", "")
+        else:
+            task_id, name, hrid = task.id, task.name, task.hrid
+        self._update((TASK, task_id), title=name, body=Counter(tokenize(hrid)))
+
+    def add_tasks(self, tasks: Iterable[Any]) -> None:
+        """Index several tasks (see ``add_task``)."""
+        with self._lock:
+            for task in tasks:
+                self.add_task(task)
+
+    def add_document(
+        self,
+        document_id: str,
+        content: Union[str, Dict[str, Any], List[Dict[str, Any]], None] = None,
+        title: Optional[str] = None,
+    ) -> None:
+        """
+        Index (or re-index) a document's title and/or content.
+
+        Whatever is not passed keeps its previously indexed value, so titles
+        from ``get_documents`` and content from ``get_markdown_document`` can
+        arrive separately.
+
+        Args:
+            document_id: Document ID
+            content: Markdown/plain text, or JSON content as returned by ``get_json_document``
+            title: Document title
+        """
+        body = None if content is None else Counter(tokenize(self._text(content)))
+        self._update((DOCUMENT, document_id), title=title, body=body)
+
+    def append_document(self, document_id: str, content: Union[str, List[Dict[str, Any]]]) -> None:
+        """Add appended text or nodes to an already indexed document."""
+        self._update((DOCUMENT, document_id), append=Counter(tokenize(self._text(content))))
+
+    @staticmethod
+    def _text(content: Union[str, Dict[str, Any], List[Dict[str, Any]]]) -> str:
+        if isinstance(content, str):
+            return content
+        return DocumentTree(content).text(separator=" ")
+
+    def remove(self, kind: str, item_id: str) -> bool:
+        """
+        Drop a task or document from the index.
+
+        Returns:
+            bool: True if the item was indexed
+        """
+        key = (kind, item_id)
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return False
+            for token in entry.counts:
+                postings = self._postings[token]
+                del postings[key]
+                if not postings:
+                    del self._postings[token]
+            return True
+
+    def clear(self) -> None:
+        """Drop everything from the index."""
+        with self._lock:
+            self._entries.clear()
+            self._postings.clear()
+            self._vocabulary = []
+            self._vocabulary_dirty = False
+
+    def _postings_for(self, term: str, prefix: bool) -> List[Tuple[Dict[_Key, int], int]]:
+        """Return ``(postings, weight)`` for the term and, with prefix, every longer token starting with it."""
+        matched = []
+        exact = self._postings.get(term)
+        if exact:
+            matched.append((exact, _EXACT_WEIGHT))
+        if not prefix:
+            return matched
+
+        if self._vocabulary_dirty:
+            self._vocabulary = sorted(self._postings)
+            self._vocabulary_dirty = False
+        vocabulary = self._vocabulary
+        position = bisect.bisect_right(vocabulary, term)
+        while position < len(vocabulary) and vocabulary[position].startswith(term):
+            postings = self._postings.get(vocabulary[position])  # None if removed since the last sort
+            if postings:
+                matched.append((postings, 1))
+            position += 1
+        return matched
+
+    def search(
+        self,
+        query: str,
+        limit: Optional[int] = 20,
+        kind: Optional[str] = None,
+        prefix: bool = True,
+    ) -> List[SearchHit]:
+        """
+        Find tasks and documents containing every word of the query.
+
+        Args:
+            query: Words to look for (case-insensitive)
+            limit: Maximum number of hits (default: 20, None for all)
+            kind: Only return ``"task"`` or ``"document"`` hits
+            prefix: Let each word match longer tokens too (default: True)
+
+        Returns:
+            List[SearchHit]: Best matches first
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+
+        with self._lock:
+            # Intersect starting from the rarest term; later terms are either probed
+            # per candidate or merged, whichever touches fewer postings
+            matches = sorted(
+                (self._postings_for(term, prefix) for term in terms),
+                key=lambda matched: sum(len(postings) for postings, _ in matched),
+            )
+            results: Dict[_Key, int] = {}
+            for postings, weight in matches[0]:
+                for key, count in postings.items():
+                    results[key] = results.get(key, 0) + count * weight
+            for matched in matches[1:]:
+                if not results:
+                    break
+                if len(results) * len(matched) <= sum(len(postings) for postings, _ in matched):
+                    narrowed = {}
+                    for key, score in results.items():
+                        extra = 0
+                        for postings, weight in matched:
+                            count = postings.get(key)
+                            if count:
+                                extra += count * weight
+                        if extra:
+                            narrowed[key] = score + extra
+                else:
+                    scores: Dict[_Key, int] = {}
+                    for postings, weight in matched:
+                        for key, count in postings.items():
+                            if key in results:
+                                scores[key] = scores.get(key, 0) + count * weight
+                    narrowed = {key: results[key] + extra for key, extra in scores.items()}
+                results = narrowed
+            if not results:
+                return []
+
+            items: Iterable[Tuple[_Key, int]] = results.items()
+            if kind is not None:
+                items = [(key, score) for key, score in items if key[0] == kind]
+            entries = self._entries
+            order = lambda item: (-item[1], entries[item[0]].sort_title, item[0][1])
+            if limit is None:
+                best = sorted(items, key=order)
+            else:
+                best = heapq.nsmallest(limit, items, key=order)
+            return [
+                SearchHit(kind=key[0], id=key[1], title=entries[key].title, score=score)
+                for key, score in best
+            ]
+
+
+__all__ = [
+    'SearchIndex',
+    'SearchHit',
+    'tokenize',
+]
@@ -0,0 +1,397 @@
+"""
+Columnar task sets for analytics.
+
+``TaskTable`` stores a set of tasks column by column: priority and completion
+as small integers, timestamps as epoch milliseconds, and board, project,
+group, creator and assignees as integer codes into per-column category lists.
+Filters, group-bys and sorts work on whole columns at once.
+
+Columns are ``array.array`` objects. When NumPy is installed they are wrapped
+(without copying) in NumPy arrays and every operation is vectorized; without
+it the same operations run as plain Python loops over the arrays.
+"""
+
+import itertools
+import operator
+from array import array
+from collections import Counter
+from datetime import datetime
+from typing import Any, Collection, Dict, Iterable, List, Optional, Sequence, Union
+
+from ..models.tasks import Task, TaskRecord, TaskView, to_epoch_millis
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+
+# Epoch-millisecond value used for missing timestamps
+MISSING = -(2 ** 63)
+
+TIMESTAMP_COLUMNS = ("due_start", "due_end", "created_at", "updated_at", "completed_at")
+CATEGORY_COLUMNS = ("board", "project", "group", "creator")
+ASSIGNEES = "assignees"
+
+TaskLike = Union[Task, TaskView, TaskRecord, Dict[str, Any]]
+Timestamp = Union[datetime, int, str]
+
+
+def _record(task: TaskLike) -> TaskRecord:
+    if isinstance(task, TaskRecord):
+        return task
+    if isinstance(task, dict):
+        return TaskRecord.from_dict(task)
+    return TaskRecord.from_task(task)
+
+
+def _millis(value: Timestamp) -> int:
+    return value if isinstance(value, int) else to_epoch_millis(value)
+
+
+class TaskTable:
+    """
+    Column-oriented set of tasks with vectorized filters, group-bys and sorts.
+
+    Every operation that selects tasks returns a new ``TaskTable``; the
+    original is never modified.
+
+    Example:
+        >>> table = TaskTable.from_tasks(client.iter_tasks(GetTasksRequest(project=project_id), views=True))
+        >>> len(table.overdue())
+        17
+        >>> table.filter(completed=False).count_by("assignees")
+        {'68fa...': 12, '68fb...': 7}
+        >>> table.sort_by("due_end").ids[:5]
+    """
+
+    def __init__(
+        self,
+        ids: List[str],
+        columns: Dict[str, Any],
+        categories: Dict[str, List[Optional[str]]],
+        assignee_offsets: Any,
+        use_numpy: Optional[bool] = None,
+    ):
+        """
+        Wrap prepared columns; use ``TaskTable.from_tasks`` to build a table.
+
+        Args:
+            ids: Task IDs, one per row
+            columns: Column name -> ``array.array`` (priority, completed, timestamps, category codes)
+            categories: Category column name (and ``"assignees"``) -> values indexed by code
+            assignee_offsets: Row boundaries into ``columns["assignees"]`` (one more entry than rows)
+            use_numpy: Vectorize with NumPy (default: when it is installed)
+        """
+        if use_numpy and np is None:
+            raise ImportError("use_numpy=True requires NumPy")
+        self._np = np if (use_numpy is None or use_numpy) else None
+        self.ids = ids
+        self._categories = categories
+        if self._np is not None:
+            columns = {name: self._np.frombuffer(column, dtype=column.typecode) if isinstance(column, array) else column
+                       for name, column in columns.items()}
+            if isinstance(assignee_offsets, array):
+                assignee_offsets = self._np.frombuffer(assignee_offsets, dtype=assignee_offsets.typecode)
+        self._columns = columns
+        self._assignee_offsets = assignee_offsets
+
+    @classmethod
+    def from_tasks(cls, tasks: Iterable[TaskLike], use_numpy: Optional[bool] = None) -> "TaskTable":
+        """
+        Build a table in one pass over tasks.
+
+        Args:
+            tasks: `Task` models, `TaskView`s, `TaskRecord`s or raw task dicts, e.g.
+                `get_tasks(...).payload.tasks` or `client.iter_tasks(...)`
+            use_numpy: Vectorize with NumPy (default: when it is installed)
+
+        Returns:
+            TaskTable: One row per task, in input order
+        """
+        ids: List[str] = []
+        priority = array("b")
+        completed = array("b")
+        timestamps = {name: array("q") for name in TIMESTAMP_COLUMNS}
+        codes = {name: array("l") for name in CATEGORY_COLUMNS + (ASSIGNEES,)}
+        lookups: Dict[str, Dict[Optional[str], int]] = {name: {} for name in codes}
+        offsets = array("q", [0])
+
+        for task in tasks:
+            record = _record(task)
+            ids.append(record.id)
+            priority.append(record.priority or 0)
+            completed.append(1 if record.completed else 0)
+            for name, column in timestamps.items():
+                value = getattr(record, name)
+                column.append(MISSING if value is None else value)
+            for name in CATEGORY_COLUMNS:
+                lookup = lookups[name]
+                codes[name].append(lookup.setdefault(getattr(record, name), len(lookup)))
+            lookup = lookups[ASSIGNEES]
+            codes[ASSIGNEES].extend(lookup.setdefault(member, len(lookup)) for member in record.assignees)
+            offsets.append(len(codes[ASSIGNEES]))
+
+        columns: Dict[str, Any] = {"priority": priority, "completed": completed, **timestamps, **codes}
+        categories = {name: list(lookup) for name, lookup in lookups.items()}
+        return cls(ids, columns, categories, offsets, use_numpy=use_numpy)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __repr__(self) -> str:
+        backend = "numpy" if self._np is not None else "array"
+        return f"TaskTable({len(self)} tasks, {backend})"
+
+    def column(self, name: str) -> Any:
+        """
+        Raw column: a NumPy array or an ``array.array``.
+
+        Timestamps are epoch milliseconds with ``MISSING`` for unset values;
+        category columns hold codes into ``categories(name)``.
+        """
+        return self._columns[name]
+
+    def categories(self, name: str) -> List[Optional[str]]:
+        """Values of a category column (or ``"assignees"``), indexed by code."""
+        return self._categories[name]
+
+    # Masks -----------------------------------------------------------------
+
+    def _all(self) -> Any:
+        if self._np is not None:
+            return self._np.ones(len(self), dtype=bool)
+        return [True] * len(self)
+
+    def _isin(self, name: str, values: Collection[Any]) -> Any:
+        column = self._columns[name]
+        if self._np is not None:
+            return self._np.isin(column, list(values))
+        values = set(values)
+        return [value in values for value in column]
+
+    def _compare(self, name: str, op: Any, value: int) -> Any:
+        """``op(column, value)`` for a timestamp column; missing timestamps never match."""
+        column = self._columns[name]
+        if self._np is not None:
+            return op(column, value) & (column != MISSING)
+        return [item != MISSING and op(item, value) for item in column]
+
+    def _and(self, left: Any, right: Any) -> Any:
+        if self._np is not None:
+            return left & right
+        return list(map(operator.and_, left, right))
+
+    def _codes_for(self, name: str, values: Any) -> List[int]:
+        if isinstance(values, str) or values is None:
+            values = (values,)
+        wanted = set(values)
+        return [code for code, value in enumerate(self._categories[name]) if value in wanted]
+
+    def _assignee_mask(self, members: Any) -> Any:
+        codes = set(self._codes_for(ASSIGNEES, members))
+        column, offsets = self._columns[ASSIGNEES], self._assignee_offsets
+        if self._np is not None:
+            xp = self._np
+            # Row of every assignee entry, then count the matching entries per row
+            rows = xp.repeat(xp.arange(len(self)), xp.diff(offsets))
+            hits = xp.isin(column, list(codes))
+            return xp.bincount(rows[hits], minlength=len(self)) > 0
+        return [
+            any(code in codes for code in column[offsets[row]:offsets[row + 1]])
+            for row in range(len(self))
+        ]
+
+    # Selection -------------------------------------------------------------
+
+    def take(self, indices: Sequence[int]) -> "TaskTable":
+        """Rows at the given positions, in that order."""
+        xp = self._np
+        if xp is not None:
+            indices = xp.asarray(indices, dtype=xp.int64)
+        columns = {}
+        for name, column in self._columns.items():
+            if name == ASSIGNEES:
+                continue
+            if xp is not None:
+                columns[name] = column[indices]
+            else:
+                columns[name] = array(column.typecode, [column[index] for index in indices])
+
+        offsets = self._assignee_offsets
+        members = self._columns[ASSIGNEES]
+        if xp is not None:
+            starts, ends = offsets[:-1][indices], offsets[1:][indices]
+            lengths = ends - starts
+            new_offsets = xp.concatenate(([0], xp.cumsum(lengths)))
+            positions = xp.repeat(starts - new_offsets[:-1], lengths) + xp.arange(int(new_offsets[-1]))
+            columns[ASSIGNEES] = members[positions]
+        else:
+            new_members = array(members.typecode)
+            new_offsets = array("q", [0])
+            for index in indices:
+                new_members.extend(members[offsets[index]:offsets[index + 1]])
+                new_offsets.append(len(new_members))
+            columns[ASSIGNEES] = new_members
+
+        ids = self.ids
+        return TaskTable(
+            [ids[index] for index in (indices.tolist() if xp is not None else indices)],
+            columns,
+            self._categories,
+            new_offsets,
+            use_numpy=xp is not None,
+        )
+
+    def where(self, mask: Any) -> "TaskTable":
+        """Rows where a boolean mask (one entry per row) is true."""
+        if self._np is not None:
+            return self.take(self._np.flatnonzero(mask))
+        return self.take(list(itertools.compress(range(len(self)), mask)))
+
+    def filter(
+        self,
+        completed: Optional[bool] = None,
+        priority: Union[int, Collection[int], None] = None,
+        board: Union[str, Collection[str], None] = None,
+        project: Union[str, Collection[str], None] = None,
+        group: Union[str, Collection[str], None] = None,
+        creator: Union[str, Collection[str], None] = None,
+        assignee: Union[str, Collection[str], None] = None,
+        due_before: Optional[Timestamp] = None,
+        due_after: Optional[Timestamp] = None,
+    ) -> "TaskTable":
+        """
+        Tasks matching every given condition.
+
+        Args:
+            completed: Completion state
+            priority: Priority value or values (`TaskPriority` members work too)
+            board: Board ID or IDs (likewise ``project``, ``group`` and ``creator``)
+            assignee: Member ID or IDs; matches tasks assigned to any of them
+            due_before: Only tasks with ``due_end`` before this time (datetime, ISO string or epoch ms)
+            due_after: Only tasks with ``due_end`` at or after this time
+
+        Returns:
+            TaskTable: The matching tasks, in the same order
+        """
+        mask = self._all()
+        if completed is not None:
+            mask = self._and(mask, self._isin("completed", (1 if completed else 0,)))
+        if priority is not None:
+            values = (priority,) if isinstance(priority, int) else priority
+            mask = self._and(mask, self._isin("priority", [int(value) for value in values]))
+        for name, values in (("board", board), ("project", project), ("group", group), ("creator", creator)):
+            if values is not None:
+                mask = self._and(mask, self._isin(name, self._codes_for(name, values)))
+        if assignee is not None:
+            mask = self._and(mask, self._assignee_mask(assignee))
+        if due_before is not None:
+            mask = self._and(mask, self._compare("due_end", operator.lt, _millis(due_before)))
+        if due_after is not None:
+            mask = self._and(mask, self._compare("due_end", operator.ge, _millis(due_after)))
+        return self.where(mask)
+
+    def overdue(self, now: Optional[Timestamp] = None) -> "TaskTable":
+        """Open tasks whose ``due_end`` is before ``now`` (default: the current time)."""
+        return self.filter(completed=False, due_before=now if now is not None else datetime.now().astimezone())
+
+    # Grouping and sorting --------------------------------------------------
+
+    def count_by(self, name: str) -> Dict[Any, int]:
+        """
+        Number of tasks per value of a column.
+
+        Args:
+            name: ``"priority"``, ``"completed"``, a category column, or
+                ``"assignees"`` (tasks per member; unassigned tasks are not counted)
+
+        Returns:
+            Dict[Any, int]: Value -> count, for values that occur
+        """
+        column = self._columns[name]
+        if self._np is not None:
+            if name in ("priority", "completed"):
+                values, counts = self._np.unique(column, return_counts=True)
+                pairs = zip(values.tolist(), counts.tolist())
+            else:
+                pairs = enumerate(self._np.bincount(column, minlength=len(self._categories[name])).tolist())
+        else:
+            pairs = Counter(column).items()
+        if name == "completed":
+            return {bool(value): count for value, count in pairs if count}
+        if name == "priority":
+            return {value: count for value, count in pairs if count}
+        categories = self._categories[name]
+        return {categories[code]: count for code, count in pairs if count}
+
+    def group_by(self, name: str) -> Dict[Any, "TaskTable"]:
+        """
+        Split the table by the value of ``"priority"``, ``"completed"`` or a category column.
+
+        Returns:
+            Dict[Any, TaskTable]: Value -> tasks with that value, in table order
+        """
+        if name == ASSIGNEES:
+            raise ValueError("Use filter(assignee=...) or count_by('assignees') for assignees")
+        column = self._columns[name]
+        groups: Dict[Any, List[int]] = {}
+        if self._np is not None:
+            order = self._np.argsort(column, kind="stable")
+            values, starts = self._np.unique(column[order], return_index=True)
+            for value, rows in zip(values.tolist(), self._np.split(order, starts[1:])):
+                groups[value] = rows
+        else:
+            for row, value in enumerate(column):
+                groups.setdefault(value, []).append(row)
+
+        result = {}
+        for value, rows in groups.items():
+            if name == "completed":
+                key = bool(value)
+            elif name == "priority":
+                key = value
+            else:
+                key = self._categories[name][value]
+            result[key] = self.take(rows)
+        return result
+
+    def sort_by(self, name: str, descending: bool = False) -> "TaskTable":
+        """
+        Tasks ordered by a column (stable; missing timestamps always sort last).
+
+        Args:
+            name: ``"priority"``, ``"completed"``, a timestamp column or a category column
+                (category columns sort by their value, e.g. the board ID)
+            descending: Largest values first
+        """
+        column = self._columns[name]
+        xp = self._np
+        if name in CATEGORY_COLUMNS:
+            values = self._categories[name]
+            ranks = [0] * len(values)
+            for rank, code in enumerate(sorted(range(len(values)), key=lambda code: (values[code] is None, values[code] or ""))):
+                ranks[code] = rank
+            keys: Any = xp.asarray(ranks, dtype=xp.int64)[column] if xp is not None else [ranks[code] for code in column]
+        else:
+            keys = column
+        timestamps = name in TIMESTAMP_COLUMNS
+
+        if xp is not None:
+            present = xp.flatnonzero(column != MISSING) if timestamps else xp.arange(len(self))
+            present_keys = keys[present].astype(xp.int64)
+            order = present[xp.argsort(-present_keys if descending else present_keys, kind="stable")]
+            if timestamps:
+                order = xp.concatenate((order, xp.flatnonzero(column == MISSING)))
+            return self.take(order)
+
+        rows = range(len(self))
+        present = [row for row in rows if not timestamps or column[row] != MISSING]
+        present.sort(key=keys.__getitem__, reverse=descending)
+        missing = [row for row in rows if timestamps and column[row] == MISSING]
+        return self.take(present + missing)
+
+__all__ = [
+    'TaskTable',
+    'MISSING',
+]
@@ -1,5 +1,5 @@
-from .base import TaskFollower, TaskPriority, CustomField, VaizBaseModel, ColorInfo
-from .tasks import Task, TaskResponse, CreateTaskRequest, EditTaskRequest, TaskFile, TaskUploadFile, TaskCustomField, GetHistoryRequest, GetHistoryResponse, HistoryItem, HistoryData, GetHistoryPayload, GetTasksRequest, GetTasksResponse, GetTasksPayload, MoveTaskItem, MoveTasksRequest, MoveTasksPayload, MoveTasksResponse
+from .base import TaskFollower, TaskPriority, CustomField, DeferredBaseModel, VaizBaseModel, IsoDateTime, ColorInfo
+from .tasks import Task, TaskView, TaskRecord, to_epoch_millis, from_epoch_millis, TaskResponse, CreateTaskRequest, EditTaskRequest, TaskFile, TaskUploadFile, TaskCustomField, GetHistoryRequest, GetHistoryResponse, HistoryItem, HistoryData, GetHistoryPayload, GetTasksRequest, GetTasksResponse, GetTasksPayload, MoveTaskItem, MoveTasksRequest, MoveTasksPayload, MoveTasksResponse
 from .boards import Board, BoardResponse, BoardsResponse, CustomFieldType, CreateBoardTypeRequest, CreateBoardTypeResponse, EditBoardTypeRequest, EditBoardTypeResponse, CreateBoardGroupRequest, CreateBoardGroupResponse, EditBoardGroupRequest, EditBoardGroupResponse, CreateBoardCustomFieldRequest, CreateBoardCustomFieldResponse, EditBoardCustomFieldRequest, EditBoardCustomFieldResponse
 from .profile import Profile, ProfileResponse
 from .projects import Project, ProjectsResponse, ProjectResponse
@@ -13,7 +13,9 @@ from .enums import CommentReactionType, COMMENT_REACTION_METADATA, AvatarMode, K
 
 __all__ = [
     # Base models
+    'DeferredBaseModel',
     'VaizBaseModel',
+    'IsoDateTime',
     'TaskFollower',
     'TaskPriority',
     'CustomField',
@@ -21,6 +23,10 @@ __all__ = [
     
     # Task models
     'Task',
+    'TaskView',
+    'TaskRecord',
+    'to_epoch_millis',
+    'from_epoch_millis',
     'TaskResponse',
     'CreateTaskRequest',
     'EditTaskRequest',
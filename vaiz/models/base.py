@@ -1,16 +1,44 @@
-from pydantic import BaseModel, RootModel, Field, ConfigDict, model_serializer
-from typing import List, Optional, Dict, Literal, Any, Union
+from pydantic import BaseModel, RootModel, Field, ConfigDict, TypeAdapter, WrapSerializer
+from pydantic_core.core_schema import SerializationInfo, SerializerFunctionWrapHandler
+from typing import List, Optional, Dict, Literal, Any, Union, Callable
+from typing_extensions import Annotated, get_args, get_origin
 from enum import Enum
 from datetime import datetime
 
 
-class VaizBaseModel(BaseModel):
+def _serialize_datetime(value: datetime, handler: SerializerFunctionWrapHandler, info: SerializationInfo) -> Any:
+    """ISO strings from ``model_dump()``; JSON output keeps pydantic's own format."""
+    if info.mode == "python":
+        return value.isoformat()
+    return handler(value)
+
+
+# Datetime field type for API models: dumped as an ISO 8601 string for the API.
+# The serializer is part of the field's compiled schema, so it only runs for
+# datetime values (including nested ones, e.g. in lists) and adds no per-model work.
+IsoDateTime = Annotated[datetime, WrapSerializer(_serialize_datetime)]
+
+
+class DeferredBaseModel(BaseModel):
+    """
+    Base for API models whose pydantic schema is built on first use.
+
+    Compiling validators and serializers for every model is most of the cost of
+    importing the package; with ``defer_build`` a model is compiled the first
+    time it validates or serializes data, so short-lived processes only pay for
+    the models they use.
+    """
+
+    model_config = ConfigDict(defer_build=True)
+
+
+class VaizBaseModel(DeferredBaseModel):
     """
     Base model for all Vaiz API models with automatic date/datetime handling.
     
     Features:
     - Automatically parses ISO date strings to datetime objects
-    - Automatically serializes datetime objects to ISO strings for API
+    - Serializes datetime fields declared as ``IsoDateTime`` to ISO strings for the API
     - Proper field alias support
     """
     
@@ -21,19 +49,8 @@ class VaizBaseModel(BaseModel):
         validate_assignment=True
     )
 
-    @model_serializer(mode='wrap')
-    def serialize_model(self, serializer, info):
-        """Custom serializer to handle datetime objects."""
-        data = serializer(self)
-        if isinstance(data, dict):
-            # Convert datetime objects to ISO strings
-            for key, value in data.items():
-                if isinstance(value, datetime):
-                    data[key] = value.isoformat()
-        return data
-
 
-class ColorInfo(BaseModel):
+class ColorInfo(DeferredBaseModel):
     """Color configuration used across different entities (profiles, spaces, members)."""
     color: str
     is_dark: bool = Field(..., alias="isDark")
@@ -50,6 +67,80 @@ class TaskPriority(int, Enum):
     High = 3
 
 
-class CustomField(BaseModel):
+class CustomField(DeferredBaseModel):
     id: str
-    value: Union[str, List[str]] 
\ No newline at end of file
+    value: Union[str, List[str]] 
+
+
+# --- Raw value conversion ---------------------------------------------------
+#
+# Converters that turn raw JSON values into what a field's type holds after
+# validation (nested models, lists and dicts of models, datetimes, enums), for
+# views that convert response fields one at a time as they are read.
+
+_Convert = Callable[[Any], Any]
+
+_PASSTHROUGH = (str, int, float, bool, bytes, dict, list, type(None))
+
+
+def _parse_datetime(value: Any, _adapter=TypeAdapter(datetime)) -> Any:
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            if value.endswith("Z"):  # Python < 3.11
+                try:
+                    return datetime.fromisoformat(value[:-1] + "+00:00")
+                except ValueError:
+                    pass
+    elif value is None or isinstance(value, datetime):
+        return value
+    return _adapter.validate_python(value)
+
+
+def _raw_converter(annotation: Any) -> Optional[_Convert]:
+    """Conversion needed to turn JSON data into ``annotation`` (None if the data can be used as is)."""
+    if annotation is Any or annotation in _PASSTHROUGH:
+        return None
+    if get_origin(annotation) is Annotated:
+        return _raw_converter(get_args(annotation)[0])
+    if annotation is datetime:
+        return _parse_datetime
+    if isinstance(annotation, type):
+        if issubclass(annotation, RootModel):
+            return lambda value: annotation.model_validate(value)
+        if issubclass(annotation, BaseModel):
+            return lambda value: annotation.model_validate(value) if isinstance(value, dict) else value
+        if issubclass(annotation, Enum):
+            members = {member.value: member for member in annotation}
+            return lambda value: members[value] if value in members else value
+
+    origin = get_origin(annotation)
+    if origin is Literal:
+        return None
+    if origin is Union:
+        members = [member for member in get_args(annotation) if member is not type(None)]
+        converters = [_raw_converter(member) for member in members]
+        if all(convert is None for convert in converters):
+            return None
+        if len(members) == 1:
+            convert = converters[0]
+            if convert is _parse_datetime:
+                return convert  # already passes None through
+            return lambda value: None if value is None else convert(value)
+    elif origin in (list, List):
+        args = get_args(annotation)
+        convert = _raw_converter(args[0]) if args else None
+        if convert is None:
+            return None
+        return lambda value: list(map(convert, value)) if isinstance(value, list) else value
+    elif origin in (dict, Dict):
+        args = get_args(annotation)
+        convert = _raw_converter(args[1]) if len(args) == 2 else None
+        if convert is None:
+            return None
+        return lambda value: {key: convert(item) for key, item in value.items()} if isinstance(value, dict) else value
+
+    # Anything else (unions of models, constrained types, ...) goes through pydantic
+    adapter = TypeAdapter(annotation)
+    return adapter.validate_python
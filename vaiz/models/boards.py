@@ -1,10 +1,9 @@
 from typing import List, Optional, Dict, Any, Union
-from pydantic import BaseModel, Field
+from pydantic import Field
 from enum import Enum
-from datetime import datetime
 
 from .enums import Icon, Color
-from .base import VaizBaseModel
+from .base import DeferredBaseModel, VaizBaseModel, IsoDateTime
 
 
 class CustomFieldType(str, Enum):
@@ -20,7 +19,7 @@ class CustomFieldType(str, Enum):
     ESTIMATION = "Estimation"
 
 
-class BoardGroup(BaseModel):
+class BoardGroup(DeferredBaseModel):
     name: str
     id: str = Field(..., alias="_id")
     description: Optional[str] = None
@@ -28,7 +27,7 @@ class BoardGroup(BaseModel):
     hidden: Optional[bool] = None
 
 
-class BoardType(BaseModel):
+class BoardType(DeferredBaseModel):
     label: str
     icon: Icon
     color: Union[str, Color]  # Color enum value or string
@@ -37,7 +36,7 @@ class BoardType(BaseModel):
     hidden: Optional[bool] = None
 
 
-class BoardCustomField(BaseModel):
+class BoardCustomField(DeferredBaseModel):
     """
     Represents a custom field in a board.
     
@@ -63,22 +62,22 @@ class Board(VaizBaseModel):
     project: Optional[str] = None
     creator: Optional[str] = None
     archiver: Optional[str] = None
-    archived_at: Optional[datetime] = Field(default=None, alias="archivedAt")
-    created_at: Optional[datetime] = Field(default=None, alias="createdAt")
+    archived_at: Optional[IsoDateTime] = Field(default=None, alias="archivedAt")
+    created_at: Optional[IsoDateTime] = Field(default=None, alias="createdAt")
     deleter: Optional[str] = None
-    deleted_at: Optional[datetime] = Field(default=None, alias="deletedAt")
+    deleted_at: Optional[IsoDateTime] = Field(default=None, alias="deletedAt")
     groups: Optional[List[BoardGroup]] = None
     types_list: Optional[List[BoardType]] = Field(default=None, alias="typesList")
     custom_fields: Optional[List[BoardCustomField]] = Field(default=None, alias="customFields")
     task_order_by_groups: Optional[Dict[str, List[str]]] = Field(default=None, alias="taskOrderByGroups")
-    updated_at: Optional[datetime] = Field(default=None, alias="updatedAt")
+    updated_at: Optional[IsoDateTime] = Field(default=None, alias="updatedAt")
 
 
-class BoardsPayload(BaseModel):
+class BoardsPayload(DeferredBaseModel):
     boards: List[Board]
 
 
-class BoardsResponse(BaseModel):
+class BoardsResponse(DeferredBaseModel):
     type: str
     payload: BoardsPayload
 
@@ -87,7 +86,7 @@ class BoardsResponse(BaseModel):
         return self.payload.boards
 
 
-class BoardResponse(BaseModel):
+class BoardResponse(DeferredBaseModel):
     type: str
     payload: Dict[str, Board] = Field(..., alias="payload")
 
@@ -103,12 +102,12 @@ class CreateBoardTypeRequest(VaizBaseModel):
     color: Color
 
 
-class CreateBoardTypePayload(BaseModel):
+class CreateBoardTypePayload(DeferredBaseModel):
     boardId: str
     boardType: BoardType
 
 
-class CreateBoardTypeResponse(BaseModel):
+class CreateBoardTypeResponse(DeferredBaseModel):
     type: str
     payload: CreateBoardTypePayload
 
@@ -127,12 +126,12 @@ class EditBoardTypeRequest(VaizBaseModel):
     hidden: Optional[bool] = None
 
 
-class EditBoardTypePayload(BaseModel):
+class EditBoardTypePayload(DeferredBaseModel):
     boardId: str
     boardType: BoardType
 
 
-class EditBoardTypeResponse(BaseModel):
+class EditBoardTypeResponse(DeferredBaseModel):
     type: str
     payload: EditBoardTypePayload
 
@@ -150,11 +149,11 @@ class CreateBoardCustomFieldRequest(VaizBaseModel):
     options: Optional[List[Any]] = None
 
 
-class CreateBoardCustomFieldPayload(BaseModel):
+class CreateBoardCustomFieldPayload(DeferredBaseModel):
     customField: BoardCustomField
 
 
-class CreateBoardCustomFieldResponse(BaseModel):
+class CreateBoardCustomFieldResponse(DeferredBaseModel):
     type: str
     payload: CreateBoardCustomFieldPayload
 
@@ -172,11 +171,11 @@ class EditBoardCustomFieldRequest(VaizBaseModel):
     options: Optional[List[Any]] = None
 
 
-class EditBoardCustomFieldPayload(BaseModel):
+class EditBoardCustomFieldPayload(DeferredBaseModel):
     customField: BoardCustomField
 
 
-class EditBoardCustomFieldResponse(BaseModel):
+class EditBoardCustomFieldResponse(DeferredBaseModel):
     type: str
     payload: EditBoardCustomFieldPayload
 
@@ -191,11 +190,11 @@ class CreateBoardGroupRequest(VaizBaseModel):
     description: Optional[str] = None
 
 
-class CreateBoardGroupPayload(BaseModel):
+class CreateBoardGroupPayload(DeferredBaseModel):
     boardGroups: List[BoardGroup]
 
 
-class CreateBoardGroupResponse(BaseModel):
+class CreateBoardGroupResponse(DeferredBaseModel):
     type: str
     payload: CreateBoardGroupPayload
 
@@ -213,11 +212,11 @@ class EditBoardGroupRequest(VaizBaseModel):
     hidden: Optional[bool] = None
 
 
-class EditBoardGroupPayload(BaseModel):
+class EditBoardGroupPayload(DeferredBaseModel):
     boardGroups: List[BoardGroup]
 
 
-class EditBoardGroupResponse(BaseModel):
+class EditBoardGroupResponse(DeferredBaseModel):
     type: str
     payload: EditBoardGroupPayload
 
@@ -1,11 +1,10 @@
-from pydantic import BaseModel, Field, ConfigDict
-from datetime import datetime
+from pydantic import Field, ConfigDict
 from typing import Optional, List, Dict
 from .upload import UploadedFile
-from .base import VaizBaseModel
+from .base import DeferredBaseModel, VaizBaseModel, IsoDateTime
 
 
-class CommentReaction(BaseModel):
+class CommentReaction(DeferredBaseModel):
     """Model for comment reaction."""
 
     reaction_db_id: str = Field(..., alias="_id")
@@ -26,16 +25,16 @@ class Comment(VaizBaseModel):
     files: List[UploadedFile] = []
     reactions: List["CommentReaction"] = []
     reply_to: Optional[str] = Field(default=None, alias="replyTo")
-    created_at: datetime = Field(..., alias="createdAt")
-    updated_at: datetime = Field(..., alias="updatedAt")
-    edited_at: Optional[datetime] = Field(default=None, alias="editedAt")
-    deleted_at: Optional[datetime] = Field(default=None, alias="deletedAt")
+    created_at: IsoDateTime = Field(..., alias="createdAt")
+    updated_at: IsoDateTime = Field(..., alias="updatedAt")
+    edited_at: Optional[IsoDateTime] = Field(default=None, alias="editedAt")
+    deleted_at: Optional[IsoDateTime] = Field(default=None, alias="deletedAt")
     has_removed_files: bool = Field(False, alias="hasRemovedFiles")
 
     model_config = ConfigDict(populate_by_name=True)
 
 
-class PostCommentRequest(BaseModel):
+class PostCommentRequest(DeferredBaseModel):
     """Request model for creating a comment."""
 
     content: str
@@ -51,7 +50,7 @@ class PostCommentRequest(BaseModel):
         return {k: v for k, v in data.items() if v is not None}
 
 
-class PostCommentResponse(BaseModel):
+class PostCommentResponse(DeferredBaseModel):
     """Response model for creating a comment."""
 
     payload: Dict[str, Comment]
@@ -63,7 +62,7 @@ class PostCommentResponse(BaseModel):
         return self.payload["comment"]
 
 
-class ReactToCommentRequest(BaseModel):
+class ReactToCommentRequest(DeferredBaseModel):
     """Request model for reacting to a comment."""
 
     comment_id: str = Field(..., alias="commentId")
@@ -82,7 +81,7 @@ class ReactToCommentRequest(BaseModel):
         return {k: v for k, v in data.items() if v is not None}
 
 
-class ReactToCommentResponse(BaseModel):
+class ReactToCommentResponse(DeferredBaseModel):
     """Response model for reacting to a comment."""
 
     payload: Dict[str, List[CommentReaction]]
@@ -94,7 +93,7 @@ class ReactToCommentResponse(BaseModel):
         return self.payload["reactions"]
 
 
-class GetCommentsRequest(BaseModel):
+class GetCommentsRequest(DeferredBaseModel):
     """Request model for getting comments."""
 
     document_id: str = Field(..., alias="documentId")
@@ -107,7 +106,7 @@ class GetCommentsRequest(BaseModel):
         return {k: v for k, v in data.items() if v is not None}
 
 
-class GetCommentsResponse(BaseModel):
+class GetCommentsResponse(DeferredBaseModel):
     """Response model for getting comments."""
 
     payload: Dict[str, List[Comment]]
@@ -119,7 +118,7 @@ class GetCommentsResponse(BaseModel):
         return self.payload["comments"]
 
 
-class EditCommentRequest(BaseModel):
+class EditCommentRequest(DeferredBaseModel):
     """Request model for editing a comment."""
 
     content: str
@@ -136,7 +135,7 @@ class EditCommentRequest(BaseModel):
         return {k: v for k, v in data.items() if v is not None}
 
 
-class EditCommentResponse(BaseModel):
+class EditCommentResponse(DeferredBaseModel):
     """Response model for editing a comment."""
 
     payload: Dict[str, Comment]
@@ -148,7 +147,7 @@ class EditCommentResponse(BaseModel):
         return self.payload["comment"]
 
 
-class DeleteCommentRequest(BaseModel):
+class DeleteCommentRequest(DeferredBaseModel):
     """Request model for deleting a comment."""
 
     comment_id: str = Field(..., alias="commentId")
@@ -161,7 +160,7 @@ class DeleteCommentRequest(BaseModel):
         return {k: v for k, v in data.items() if v is not None}
 
 
-class DeleteCommentResponse(BaseModel):
+class DeleteCommentResponse(DeferredBaseModel):
     """Response model for deleting a comment."""
 
     payload: Dict[str, Comment]
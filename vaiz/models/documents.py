@@ -1,11 +1,10 @@
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import Field, ConfigDict
 from typing import List, Any, Dict, Optional
-from datetime import datetime
-from .base import VaizBaseModel
+from .base import DeferredBaseModel, VaizBaseModel, IsoDateTime
 from .enums import Kind
 
 
-class GetDocumentRequest(BaseModel):
+class GetDocumentRequest(DeferredBaseModel):
     """Request model for fetching a JSON document by its ID."""
     document_id: str = Field(..., alias="documentId")
 
@@ -16,7 +15,7 @@ class GetDocumentRequest(BaseModel):
         return {k: v for k, v in data.items() if v is not None}
 
 
-class ReplaceDocumentRequest(BaseModel):
+class ReplaceDocumentRequest(DeferredBaseModel):
     """Request model for replacing document content."""
     document_id: str = Field(..., alias="documentId")
     description: str
@@ -28,12 +27,12 @@ class ReplaceDocumentRequest(BaseModel):
         return {k: v for k, v in data.items() if v is not None}
 
 
-class ReplaceDocumentResponse(BaseModel):
+class ReplaceDocumentResponse(DeferredBaseModel):
     """Response model for document replacement - returns empty object on success."""
     pass
 
 
-class ReplaceJSONDocumentRequest(BaseModel):
+class ReplaceJSONDocumentRequest(DeferredBaseModel):
     """Request model for replacing document content with JSON content."""
     document_id: str = Field(..., alias="documentId")
     content: List[Dict[str, Any]] = Field(..., description="JSONContent array in document structure format")
@@ -45,12 +44,12 @@ class ReplaceJSONDocumentRequest(BaseModel):
         return {k: v for k, v in data.items() if v is not None}
 
 
-class ReplaceJSONDocumentResponse(BaseModel):
+class ReplaceJSONDocumentResponse(DeferredBaseModel):
     """Response model for JSON document replacement - returns empty object on success."""
     pass
 
 
-class AppendDocumentRequest(BaseModel):
+class AppendDocumentRequest(DeferredBaseModel):
     """Request model for appending plain text content to a document."""
     document_id: str = Field(..., alias="documentId")
     description: Optional[str] = None
@@ -63,12 +62,12 @@ class AppendDocumentRequest(BaseModel):
         return {k: v for k, v in data.items() if v is not None}
 
 
-class AppendDocumentResponse(BaseModel):
+class AppendDocumentResponse(DeferredBaseModel):
     """Response model for document append - returns empty object on success."""
     pass
 
 
-class AppendJSONDocumentRequest(BaseModel):
+class AppendJSONDocumentRequest(DeferredBaseModel):
     """Request model for appending JSON content to a document."""
     document_id: str = Field(..., alias="documentId")
     content: List[Dict[str, Any]] = Field(..., description="JSONContent array in document structure format")
@@ -80,12 +79,12 @@ class AppendJSONDocumentRequest(BaseModel):
         return {k: v for k, v in data.items() if v is not None}
 
 
-class AppendJSONDocumentResponse(BaseModel):
+class AppendJSONDocumentResponse(DeferredBaseModel):
     """Response model for JSON document append - returns empty object on success."""
     pass
 
 
-class ReplaceMarkdownDocumentRequest(BaseModel):
+class ReplaceMarkdownDocumentRequest(DeferredBaseModel):
     """Request model for replacing document content with Markdown content."""
     document_id: str = Field(..., alias="documentId")
     markdown: str
@@ -97,12 +96,12 @@ class ReplaceMarkdownDocumentRequest(BaseModel):
         return {k: v for k, v in data.items() if v is not None}
 
 
-class ReplaceMarkdownDocumentResponse(BaseModel):
+class ReplaceMarkdownDocumentResponse(DeferredBaseModel):
     """Response model for Markdown document replacement - returns empty object on success."""
     pass
 
 
-class AppendMarkdownDocumentRequest(BaseModel):
+class AppendMarkdownDocumentRequest(DeferredBaseModel):
     """Request model for appending Markdown content to a document."""
     document_id: str = Field(..., alias="documentId")
     markdown: str
@@ -114,12 +113,12 @@ class AppendMarkdownDocumentRequest(BaseModel):
         return {k: v for k, v in data.items() if v is not None}
 
 
-class AppendMarkdownDocumentResponse(BaseModel):
+class AppendMarkdownDocumentResponse(DeferredBaseModel):
     """Response model for Markdown document append - returns empty object on success."""
     pass
 
 
-class GetMarkdownDocumentRequest(BaseModel):
+class GetMarkdownDocumentRequest(DeferredBaseModel):
     """Request model for fetching document content as Markdown."""
     document_id: str = Field(..., alias="documentId")
 
@@ -130,12 +129,12 @@ class GetMarkdownDocumentRequest(BaseModel):
         return {k: v for k, v in data.items() if v is not None}
 
 
-class GetMarkdownDocumentPayload(BaseModel):
+class GetMarkdownDocumentPayload(DeferredBaseModel):
     """Payload containing the document content as Markdown."""
     markdown: str = ""
 
 
-class GetMarkdownDocumentResponse(BaseModel):
+class GetMarkdownDocumentResponse(DeferredBaseModel):
     """Response model for fetching document content as Markdown."""
     payload: GetMarkdownDocumentPayload
     type: str
@@ -153,13 +152,13 @@ class Document(VaizBaseModel):
     contributor_ids: List[str] = Field(default_factory=list, alias="contributorIds")
     archiver: Optional[str] = None
     followers: Dict[str, str] = Field(default_factory=dict)
-    archived_at: Optional[datetime] = Field(default=None, alias="archivedAt")
+    archived_at: Optional[IsoDateTime] = Field(default=None, alias="archivedAt")
     kind_id: str = Field(..., alias="kindId")
     kind: Kind
     creator: str
     map: List[Any] = Field(default_factory=list)
-    created_at: datetime = Field(..., alias="createdAt")
-    updated_at: datetime = Field(..., alias="updatedAt")
+    created_at: IsoDateTime = Field(..., alias="createdAt")
+    updated_at: IsoDateTime = Field(..., alias="updatedAt")
     bucket: str
 
     model_config = ConfigDict(populate_by_name=True)
@@ -235,15 +234,15 @@ class EditDocument(VaizBaseModel):
     contributor_ids: List[str] = Field(default_factory=list, alias="contributorIds")
     archiver: Optional[str] = None
     followers: Dict[str, str] = Field(default_factory=dict)
-    archived_at: Optional[datetime] = Field(default=None, alias="archivedAt")
+    archived_at: Optional[IsoDateTime] = Field(default=None, alias="archivedAt")
     kind_id: str = Field(..., alias="kindId")
     kind: Kind
     creator: str
-    created_at: datetime = Field(..., alias="createdAt")
-    updated_at: datetime = Field(..., alias="updatedAt")
+    created_at: IsoDateTime = Field(..., alias="createdAt")
+    updated_at: IsoDateTime = Field(..., alias="updatedAt")
     bucket: str
     content: Optional[str] = None
-    content_updated_at: Optional[datetime] = Field(default=None, alias="contentUpdatedAt")
+    content_updated_at: Optional[IsoDateTime] = Field(default=None, alias="contentUpdatedAt")
 
     model_config = ConfigDict(populate_by_name=True, extra="ignore")
 
@@ -1,7 +1,7 @@
-from pydantic import BaseModel, Field
+from pydantic import Field
 from typing import List, Optional
 from datetime import datetime
-from .base import VaizBaseModel, ColorInfo
+from .base import DeferredBaseModel, VaizBaseModel, ColorInfo
 from .enums import AvatarMode
 
 
@@ -20,12 +20,12 @@ class Member(VaizBaseModel):
     updated_at: str = Field(..., alias="updatedAt")    # String date from API
 
 
-class GetSpaceMembersPayload(BaseModel):
+class GetSpaceMembersPayload(DeferredBaseModel):
     """Payload containing list of space members."""
     members: List[Member]
 
 
-class GetSpaceMembersResponse(BaseModel):
+class GetSpaceMembersResponse(DeferredBaseModel):
     """Response model for getting space members."""
     type: str
     payload: GetSpaceMembersPayload
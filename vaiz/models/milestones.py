@@ -1,7 +1,6 @@
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import Field, ConfigDict
 from typing import List, Optional, Dict, TYPE_CHECKING, Any, Union
-from datetime import datetime
-from .base import VaizBaseModel
+from .base import DeferredBaseModel, VaizBaseModel, IsoDateTime
 from .enums import Color
 
 if TYPE_CHECKING:
@@ -14,8 +13,8 @@ class CreateMilestoneRequest(VaizBaseModel):
     description: Optional[str] = None
     board: str
     project: str
-    due_start: Optional[datetime] = Field(default=None, alias="dueStart")
-    due_end: Optional[datetime] = Field(default=None, alias="dueEnd")
+    due_start: Optional[IsoDateTime] = Field(default=None, alias="dueStart")
+    due_end: Optional[IsoDateTime] = Field(default=None, alias="dueEnd")
     tags: List[str] = []
     color: Union[str, Color] = Color.Blue  # Default blue color
 
@@ -29,18 +28,18 @@ class Milestone(VaizBaseModel):
     project: str
     creator: str
     archiver: Optional[str] = None
-    due_start: Optional[datetime] = Field(default=None, alias="dueStart")
-    due_end: Optional[datetime] = Field(default=None, alias="dueEnd")
+    due_start: Optional[IsoDateTime] = Field(default=None, alias="dueStart")
+    due_end: Optional[IsoDateTime] = Field(default=None, alias="dueEnd")
     tags: List[str] = []
-    archived_at: Optional[datetime] = Field(default=None, alias="archivedAt")
+    archived_at: Optional[IsoDateTime] = Field(default=None, alias="archivedAt")
     is_archived: bool = Field(False, alias="isArchived")
     is_active: bool = Field(True, alias="isActive")
     is_completed: bool = Field(False, alias="isCompleted")
     color: Optional[Union[str, Color]] = None
-    created_at: datetime = Field(..., alias="createdAt")
-    updated_at: datetime = Field(..., alias="updatedAt")
+    created_at: IsoDateTime = Field(..., alias="createdAt")
+    updated_at: IsoDateTime = Field(..., alias="updatedAt")
     deleter: Optional[str] = None
-    deleted_at: Optional[datetime] = Field(default=None, alias="deletedAt")
+    deleted_at: Optional[IsoDateTime] = Field(default=None, alias="deletedAt")
     followers: Optional[Dict[str, str]] = {}
     document: Optional[str] = None
     total: Optional[int] = 0
@@ -50,11 +49,11 @@ class Milestone(VaizBaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
 
-class MilestonesPayload(BaseModel):
+class MilestonesPayload(DeferredBaseModel):
     milestones: List[Milestone]
 
 
-class MilestonesResponse(BaseModel):
+class MilestonesResponse(DeferredBaseModel):
     type: str
     payload: MilestonesPayload
 
@@ -63,11 +62,11 @@ class MilestonesResponse(BaseModel):
         return self.payload.milestones
 
 
-class CreateMilestonePayload(BaseModel):
+class CreateMilestonePayload(DeferredBaseModel):
     milestone: Milestone
 
 
-class CreateMilestoneResponse(BaseModel):
+class CreateMilestoneResponse(DeferredBaseModel):
     type: str
     payload: CreateMilestonePayload
 
@@ -76,11 +75,11 @@ class CreateMilestoneResponse(BaseModel):
         return self.payload.milestone
 
 
-class GetMilestonePayload(BaseModel):
+class GetMilestonePayload(DeferredBaseModel):
     milestone: Milestone
 
 
-class GetMilestoneResponse(BaseModel):
+class GetMilestoneResponse(DeferredBaseModel):
     type: str
     payload: GetMilestonePayload
 
@@ -94,8 +93,8 @@ class EditMilestoneRequest(VaizBaseModel):
     milestone_id: str = Field(..., alias="_id")  # Use alias to send as "_id" to API
     name: Optional[str] = None
     description: Optional[str] = None
-    due_start: Optional[datetime] = Field(default=None, alias="dueStart")
-    due_end: Optional[datetime] = Field(default=None, alias="dueEnd")
+    due_start: Optional[IsoDateTime] = Field(default=None, alias="dueStart")
+    due_end: Optional[IsoDateTime] = Field(default=None, alias="dueEnd")
     tags: Optional[List[str]] = None
     color: Optional[Union[str, Color]] = None
 
@@ -108,11 +107,11 @@ class EditMilestoneRequest(VaizBaseModel):
         return {k: v for k, v in data.items() if v is not None}
 
 
-class EditMilestonePayload(BaseModel):
+class EditMilestonePayload(DeferredBaseModel):
     milestone: Milestone
 
 
-class EditMilestoneResponse(BaseModel):
+class EditMilestoneResponse(DeferredBaseModel):
     type: str
     payload: EditMilestonePayload
 
@@ -121,7 +120,7 @@ class EditMilestoneResponse(BaseModel):
         return self.payload.milestone
 
 
-class ToggleMilestoneRequest(BaseModel):
+class ToggleMilestoneRequest(DeferredBaseModel):
     task_id: str = Field(..., alias="taskId")
     milestone_ids: List[str] = Field(..., alias="milestoneIds")
 
@@ -131,11 +130,11 @@ class ToggleMilestoneRequest(BaseModel):
         return super().model_dump(by_alias=True, **kwargs)
 
 
-class ToggleMilestonePayload(BaseModel):
+class ToggleMilestonePayload(DeferredBaseModel):
     task: Dict[str, Any]  # Using Dict to avoid circular import issues
 
 
-class ToggleMilestoneResponse(BaseModel):
+class ToggleMilestoneResponse(DeferredBaseModel):
     type: str
     payload: ToggleMilestonePayload
 
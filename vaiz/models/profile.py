@@ -1,17 +1,16 @@
-from pydantic import BaseModel, Field
+from pydantic import Field
 from typing import Optional, List, Dict, Any
-from datetime import datetime
-from .base import VaizBaseModel
+from .base import DeferredBaseModel, VaizBaseModel, IsoDateTime
 from .enums import AvatarMode
 
 
-class ProfileEmail(BaseModel):
+class ProfileEmail(DeferredBaseModel):
     email: str
     confirmed: bool
     primary: bool
 
 
-class ProfileColor(BaseModel):
+class ProfileColor(DeferredBaseModel):
     color: Optional[str] = None  # Color name
     is_dark: Optional[bool] = Field(None, alias="isDark")
 
@@ -26,22 +25,22 @@ class Profile(VaizBaseModel):
     color: ProfileColor = Field(default_factory=ProfileColor)
     avatar_mode: AvatarMode = Field(..., alias="avatarMode")
     incomplete_steps: Optional[List[str]] = Field(default_factory=list, alias="incompleteSteps")
-    registered_date: datetime = Field(..., alias="registeredDate")
+    registered_date: IsoDateTime = Field(..., alias="registeredDate")
     recovery_codes: Optional[List[Dict[str, str]]] = Field(default_factory=list, alias="recoveryCodes")
-    password_changed_date: Optional[datetime] = Field(None, alias="passwordChangedDate")
+    password_changed_date: Optional[IsoDateTime] = Field(None, alias="passwordChangedDate")
     member_id: Optional[str] = Field(None, alias="memberId")
-    created_at: Optional[datetime] = Field(None, alias="createdAt")
-    updated_at: datetime = Field(..., alias="updatedAt")
+    created_at: Optional[IsoDateTime] = Field(None, alias="createdAt")
+    updated_at: IsoDateTime = Field(..., alias="updatedAt")
     c_data: Optional[Dict[str, Optional[str]]] = Field(default_factory=dict, alias="cData")
     is_email_confirmed: Optional[bool] = Field(None, alias="isEmailConfirmed")
     avatar: Optional[str] = None
     invited: Optional[bool] = None
-    recovery_codes_viewed_date: Optional[datetime] = Field(None, alias="recoveryCodesViewedDate")
+    recovery_codes_viewed_date: Optional[IsoDateTime] = Field(None, alias="recoveryCodesViewedDate")
     phone_number: Optional[str] = Field(None, alias="phoneNumber")
     webauthn_credentials: Optional[List[Dict[str, Any]]] = Field(default_factory=list, alias="webAuthnCredentials")
 
 
-class ProfileResponse(BaseModel):
+class ProfileResponse(DeferredBaseModel):
     type: str
     payload: Dict[str, Profile]
 
@@ -1,7 +1,6 @@
-from pydantic import BaseModel, Field
+from pydantic import Field
 from typing import Optional, List, Union
-from datetime import datetime
-from .base import VaizBaseModel
+from .base import DeferredBaseModel, VaizBaseModel, IsoDateTime
 from .enums import Icon, Color
 
 
@@ -11,10 +10,10 @@ class Project(VaizBaseModel):
     name: str
     description: Optional[str] = None
     creator: str
-    archived_at: Optional[datetime] = Field(default=None, alias="archivedAt")
+    archived_at: Optional[IsoDateTime] = Field(default=None, alias="archivedAt")
     archiver: Optional[str] = None
-    created_at: datetime = Field(..., alias="createdAt")
-    updated_at: datetime = Field(..., alias="updatedAt")
+    created_at: IsoDateTime = Field(..., alias="createdAt")
+    updated_at: IsoDateTime = Field(..., alias="updatedAt")
     team: List[str] = []
     color: Optional[Union[str, Color]] = None  # Color enum value or string
     slug: Optional[str] = None
@@ -22,11 +21,11 @@ class Project(VaizBaseModel):
     space: Optional[str] = None
 
 
-class ProjectsPayload(BaseModel):
+class ProjectsPayload(DeferredBaseModel):
     projects: List[Project]
 
 
-class ProjectsResponse(BaseModel):
+class ProjectsResponse(DeferredBaseModel):
     type: str
     payload: ProjectsPayload
 
@@ -35,11 +34,11 @@ class ProjectsResponse(BaseModel):
         return self.payload.projects
 
 
-class ProjectPayload(BaseModel):
+class ProjectPayload(DeferredBaseModel):
     project: Project
 
 
-class ProjectResponse(BaseModel):
+class ProjectResponse(DeferredBaseModel):
     type: str
     payload: ProjectPayload
 
@@ -1,7 +1,6 @@
-from pydantic import BaseModel, Field
+from pydantic import Field
 from typing import Optional, Union, Dict, Any
-from datetime import datetime
-from .base import VaizBaseModel, ColorInfo
+from .base import DeferredBaseModel, VaizBaseModel, IsoDateTime, ColorInfo
 from .enums import AvatarMode
 
 
@@ -14,22 +13,22 @@ class Space(VaizBaseModel):
     avatar: Optional[str] = None
     creator: Union[str, Dict[str, Any]]  # Can be string ID or user object
     plan: str
-    created_at: datetime = Field(..., alias="createdAt")
-    updated_at: datetime = Field(..., alias="updatedAt")
+    created_at: IsoDateTime = Field(..., alias="createdAt")
+    updated_at: IsoDateTime = Field(..., alias="updatedAt")
     is_foreign: bool = Field(..., alias="isForeign")
 
 
-class GetSpaceRequest(BaseModel):
+class GetSpaceRequest(DeferredBaseModel):
     """Request model for getting space information."""
     space_id: str = Field(..., alias="spaceId")
 
 
-class GetSpacePayload(BaseModel):
+class GetSpacePayload(DeferredBaseModel):
     """Payload containing space information."""
     space: Space
 
 
-class GetSpaceResponse(BaseModel):
+class GetSpaceResponse(DeferredBaseModel):
     """Response model for getting space information."""
     type: str
     payload: GetSpacePayload
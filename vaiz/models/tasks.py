@@ -1,7 +1,8 @@
-from pydantic import BaseModel, Field, ConfigDict
-from typing import Dict, Any, List, Optional, TYPE_CHECKING
-from datetime import datetime
-from .base import TaskPriority, CustomField, VaizBaseModel
+from pydantic import Field, ConfigDict
+from typing import Dict, Any, List, Optional, Tuple, Union, TYPE_CHECKING
+from datetime import datetime, timedelta, timezone
+import sys
+from .base import TaskPriority, CustomField, DeferredBaseModel, VaizBaseModel, IsoDateTime, _parse_datetime, _raw_converter
 from .documents import ReplaceDocumentResponse
 from .enums import UploadFileType, Kind
 
@@ -21,7 +22,7 @@ class TaskFile(VaizBaseModel):
     dominant_color: Optional[Dict[str, Any]] = None
     mime: Optional[str] = None
     original_name: Optional[str] = None
-    date: Optional[datetime] = None
+    date: Optional[IsoDateTime] = None
     owner: Optional[str] = None
     access_kind: Optional[str] = None
     access_kind_id: Optional[str] = None
@@ -29,7 +30,7 @@ class TaskFile(VaizBaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
 
-class TaskCustomField(BaseModel):
+class TaskCustomField(DeferredBaseModel):
     id: str
     value: Any
     _id: str
@@ -51,18 +52,18 @@ class Task(VaizBaseModel):
     assignees: List[str] = []
     subtasks: List[str] = []
     milestones: List[str] = []
-    due_start: Optional[datetime] = Field(default=None, alias="dueStart")
-    due_end: Optional[datetime] = Field(default=None, alias="dueEnd")
+    due_start: Optional[IsoDateTime] = Field(default=None, alias="dueStart")
+    due_end: Optional[IsoDateTime] = Field(default=None, alias="dueEnd")
     blocking: List[str] = Field(default_factory=list, alias="rightConnectors", serialization_alias="rightConnectors")
     blockers: List[str] = Field(default_factory=list, alias="leftConnectors", serialization_alias="leftConnectors")
-    archived_at: Optional[datetime] = Field(default=None, alias="archivedAt")
-    completed_at: Optional[datetime] = Field(default=None, alias="completedAt")
+    archived_at: Optional[IsoDateTime] = Field(default=None, alias="archivedAt")
+    completed_at: Optional[IsoDateTime] = Field(default=None, alias="completedAt")
     custom_fields: List[TaskCustomField] = Field(default_factory=list, alias="customFields")
     deleter: Optional[str] = None
-    deleted_at: Optional[datetime] = Field(default=None, alias="deletedAt")
+    deleted_at: Optional[IsoDateTime] = Field(default=None, alias="deletedAt")
     creator: str
-    created_at: datetime = Field(..., alias="createdAt")
-    updated_at: datetime = Field(..., alias="updatedAt")
+    created_at: IsoDateTime = Field(..., alias="createdAt")
+    updated_at: IsoDateTime = Field(..., alias="updatedAt")
     document: str
     editor: Optional[str] = None
     milestone: Optional[str] = None
@@ -100,7 +101,191 @@ class Task(VaizBaseModel):
         return client.replace_document(self.document, description)
 
 
-class TaskResponse(BaseModel):
+
+class _LazyTaskField:
+    """Non-data descriptor: converts a raw task field on first read and memoizes it on the view."""
+    __slots__ = ("name", "keys", "convert", "default")
+
+    def __init__(self, name: str, field: Any):
+        self.name = name
+        self.keys = (field.alias, name) if field.alias and field.alias != name else (name,)
+        self.convert = _raw_converter(field.annotation)
+        self.default = None if field.is_required() else (
+            lambda: field.get_default(call_default_factory=True)
+        )
+
+    def __get__(self, view: Any, owner: Any = None) -> Any:
+        if view is None:
+            return self
+        raw = view.raw
+        for key in self.keys:
+            if key in raw:
+                value = raw[key]
+                if self.convert is not None:
+                    value = self.convert(value)
+                break
+        else:
+            if self.default is None:
+                raise AttributeError(f"Task data has no {self.name!r}")
+            value = self.default()
+        # The instance dict now shadows this descriptor
+        view.__dict__[self.name] = value
+        return value
+
+
+class TaskView:
+    """
+    Read-only task backed by the raw task dict from the API.
+
+    Nothing is converted up front: each field is converted (datetimes,
+    priority, custom fields) the first time it is read and then memoized on
+    the instance, so reading a few fields of many tasks costs only those
+    fields. Field names and values are the same as on `Task`; use
+    `to_model()` for a full, validated `Task`.
+
+    Attributes:
+        raw: The task dict as returned by the API
+
+    Example:
+        >>> views = client.get_task_views(GetTasksRequest(limit=50))
+        >>> overdue = [v.id for v in views if v.due_end and v.due_end < now and not v.completed]
+    """
+    __slots__ = ("raw", "__dict__")
+
+    def __init__(self, raw: Dict[str, Any]):
+        self.raw = raw
+
+    def __repr__(self) -> str:
+        return f"TaskView(id={self.raw.get('_id')!r}, name={self.raw.get('name')!r})"
+
+    def to_model(self) -> Task:
+        """Validate the raw data into a full `Task`."""
+        return Task.model_validate(self.raw)
+
+
+for _name, _field in Task.model_fields.items():
+    setattr(TaskView, _name, _LazyTaskField(_name, _field))
+del _name, _field
+
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# TaskRecord field groups: ids repeated across many tasks are interned, lists
+# become tuples and datetimes become epoch milliseconds
+_RECORD_UNIQUE = ("id", "name", "hrid", "document", "priority", "completed")
+_RECORD_INTERNED = ("group", "board", "project", "parent_task", "archiver", "creator", "deleter", "editor", "milestone")
+_RECORD_ID_LISTS = ("types", "assignees", "subtasks", "milestones", "blocking", "blockers")
+_RECORD_TIMESTAMPS = ("due_start", "due_end", "archived_at", "completed_at", "deleted_at", "created_at", "updated_at")
+_RECORD_KEYS = {name: field.alias or name for name, field in Task.model_fields.items()}
+
+
+def to_epoch_millis(value: Union[datetime, str, None]) -> Optional[int]:
+    """Convert a datetime (or ISO string) to integer milliseconds since the epoch; naive values are taken as UTC."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = _parse_datetime(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    delta = value - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1000 + delta.microseconds // 1000
+
+
+def from_epoch_millis(value: Optional[int]) -> Optional[datetime]:
+    """Convert epoch milliseconds back to an aware UTC datetime."""
+    return None if value is None else _EPOCH + timedelta(milliseconds=value)
+
+
+class TaskRecord:
+    """
+    Memory-compact task for large in-process mirrors.
+
+    Has the same attribute names as `Task`, but stores them in ``__slots__``:
+    ids that repeat across tasks (board, project, group, creator, ...) are
+    interned so all records share one string, lists are tuples, ``followers``
+    is a tuple of ``(member_id, role)`` pairs, ``custom_fields`` a tuple of
+    ``(field_id, value)`` pairs, ``priority`` an int and all datetimes are
+    integer milliseconds since the epoch (UTC). Sub-millisecond precision is
+    dropped; everything else round-trips through `to_task()`.
+
+    Example:
+        >>> mirror = {task.id: TaskRecord.from_task(task) for task in client.iter_tasks()}
+        >>> record = mirror[task_id]
+        >>> record.due_end  # epoch milliseconds
+        1740787200000
+        >>> record.to_task().due_end
+        datetime.datetime(2025, 3, 1, 0, 0, tzinfo=datetime.timezone.utc)
+    """
+    __slots__ = tuple(Task.model_fields)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TaskRecord":
+        """Build a record straight from a raw task dict as returned by the API."""
+        record = cls.__new__(cls)
+        intern = sys.intern
+        keys = _RECORD_KEYS
+        for name in _RECORD_UNIQUE:
+            setattr(record, name, data.get(keys[name]))
+        record.priority = int(record.priority) if record.priority is not None else None
+        for name in _RECORD_INTERNED:
+            value = data.get(keys[name])
+            setattr(record, name, intern(value) if isinstance(value, str) else value)
+        for name in _RECORD_ID_LISTS:
+            setattr(record, name, tuple(map(intern, data.get(keys[name]) or ())))
+        for name in _RECORD_TIMESTAMPS:
+            setattr(record, name, to_epoch_millis(data.get(keys[name])))
+        record.followers = tuple(
+            (intern(member_id), intern(role)) for member_id, role in (data.get("followers") or {}).items()
+        )
+        record.custom_fields = tuple(
+            (field["id"], field.get("value")) for field in data.get("customFields") or ()
+        )
+        return record
+
+    @classmethod
+    def from_task(cls, task: Union[Task, "TaskView"]) -> "TaskRecord":
+        """Build a record from a `Task` model (or a `TaskView`)."""
+        if isinstance(task, TaskView):
+            return cls.from_dict(task.raw)
+        record = cls.__new__(cls)
+        intern = sys.intern
+        for name in _RECORD_UNIQUE:
+            setattr(record, name, getattr(task, name))
+        record.priority = int(task.priority)
+        for name in _RECORD_INTERNED:
+            value = getattr(task, name)
+            setattr(record, name, intern(value) if isinstance(value, str) else value)
+        for name in _RECORD_ID_LISTS:
+            setattr(record, name, tuple(map(intern, getattr(task, name))))
+        for name in _RECORD_TIMESTAMPS:
+            setattr(record, name, to_epoch_millis(getattr(task, name)))
+        record.followers = tuple((intern(member_id), intern(role)) for member_id, role in task.followers.items())
+        record.custom_fields = tuple((field.id, field.value) for field in task.custom_fields)
+        return record
+
+    def to_task(self) -> Task:
+        """Rebuild the `Task` model from the stored values."""
+        values: Dict[str, Any] = {name: getattr(self, name) for name in _RECORD_UNIQUE + _RECORD_INTERNED}
+        for name in _RECORD_ID_LISTS:
+            values[name] = list(getattr(self, name))
+        for name in _RECORD_TIMESTAMPS:
+            values[name] = from_epoch_millis(getattr(self, name))
+        values["followers"] = dict(self.followers)
+        values["custom_fields"] = [{"id": field_id, "value": value} for field_id, value in self.custom_fields]
+        return Task(**values)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TaskRecord):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"TaskRecord(id={self.id!r}, name={self.name!r})"
+
+class TaskResponse(DeferredBaseModel):
     payload: Dict[str, Any]
     type: str
 
@@ -126,8 +311,8 @@ class CreateTaskRequest(VaizBaseModel):
     assignees: List[str] = []
     subtasks: List[str] = []
     milestones: List[str] = []
-    due_start: Optional[datetime] = Field(default=None, alias="dueStart")
-    due_end: Optional[datetime] = Field(default=None, alias="dueEnd")
+    due_start: Optional[IsoDateTime] = Field(default=None, alias="dueStart")
+    due_end: Optional[IsoDateTime] = Field(default=None, alias="dueEnd")
     blocking: List[str] = Field(default_factory=list, alias="rightConnectors", serialization_alias="rightConnectors")
     blockers: List[str] = Field(default_factory=list, alias="leftConnectors", serialization_alias="leftConnectors")
     custom_fields: List[CustomField] = Field(default_factory=list, alias="customFields")
@@ -149,8 +334,8 @@ class EditTaskRequest(VaizBaseModel):
     assignees: Optional[List[str]] = None
     subtasks: Optional[List[str]] = None
     milestones: Optional[List[str]] = None
-    due_start: Optional[datetime] = Field(default=None, alias="dueStart")
-    due_end: Optional[datetime] = Field(default=None, alias="dueEnd")
+    due_start: Optional[IsoDateTime] = Field(default=None, alias="dueStart")
+    due_end: Optional[IsoDateTime] = Field(default=None, alias="dueEnd")
     blocking: Optional[List[str]] = Field(default=None, alias="rightConnectors", serialization_alias="rightConnectors")
     blockers: Optional[List[str]] = Field(default=None, alias="leftConnectors", serialization_alias="leftConnectors")
     custom_fields: Optional[List[CustomField]] = Field(default=None, alias="customFields")
@@ -163,7 +348,7 @@ class EditTaskRequest(VaizBaseModel):
         return {k: v for k, v in data.items() if v is not None}
 
 
-class TaskUploadFile(BaseModel):
+class TaskUploadFile(DeferredBaseModel):
     path: str
     type: Optional[UploadFileType] = None
 
@@ -207,8 +392,8 @@ class GetHistoryRequest(VaizBaseModel):
     kind: Kind
     kindId: str
     createdBy: Optional[List[str]] = None
-    dateRangeStart: Optional[datetime] = None
-    dateRangeEnd: Optional[datetime] = None
+    dateRangeStart: Optional[IsoDateTime] = None
+    dateRangeEnd: Optional[IsoDateTime] = None
     limit: Optional[int] = None
     lastLoadedDate: Optional[int] = 0
     keys: Optional[List[str]] = None
@@ -1,14 +1,13 @@
-from pydantic import BaseModel, Field
+from pydantic import Field
 from typing import Optional, Dict, Any
-from datetime import datetime
 from vaiz.models.enums import UploadFileType
-from .base import VaizBaseModel
+from .base import DeferredBaseModel, VaizBaseModel, IsoDateTime
 
 class UploadedFile(VaizBaseModel):
     dominant_color: Optional[Dict[str, Any]] = Field(default_factory=dict, alias="dominantColor")
     dimension: Optional[list] = Field(default_factory=list)
     id: str = Field(..., alias="_id")
-    date: datetime
+    date: IsoDateTime
     owner: str
     url: str
     name: str
@@ -20,10 +19,10 @@ class UploadedFile(VaizBaseModel):
     access_kind: str = Field(..., alias="accessKind")
     access_kind_id: str = Field(..., alias="accessKindId")
 
-class UploadFilePayload(BaseModel):
+class UploadFilePayload(DeferredBaseModel):
     file: UploadedFile
 
-class UploadFileResponse(BaseModel):
+class UploadFileResponse(DeferredBaseModel):
     type: str
     payload: UploadFilePayload
 